@@ -2,11 +2,23 @@ import os
 import logging
 from pathlib import Path
 from datetime import datetime
-from dotenv import load_dotenv
 
-load_dotenv(dotenv_path=Path(__file__).resolve().parent / ".env")
+# Deployments that inject the environment directly (e.g. Docker) ship no .env and skip the dotenv import entirely.
+DOTENV_PATH = Path(__file__).resolve().parent / ".env"
+if DOTENV_PATH.is_file():
+    from dotenv import load_dotenv
+    load_dotenv(dotenv_path=DOTENV_PATH)
 logger = logging.getLogger(__name__)
 
+REQUIRED_ENV_VARS = (
+    "TELEGRAM_BOT_TOKEN", "TELEGRAM_OWNER_ID", "TELEGRAM_API_ID",
+    "TELEGRAM_API_HASH", "APPEAL_CHAT_USERNAME", "APPEAL_CHAT_ID",
+)
+missing_env_vars = [name for name in REQUIRED_ENV_VARS if not os.environ.get(name)]
+if missing_env_vars:
+    logger.critical(f"CRITICAL: Missing required environment variables: {', '.join(missing_env_vars)}")
+    exit(1)
+
 try:
     OWNER_ID = int(os.getenv("TELEGRAM_OWNER_ID"))
     logger.info(f"Owner ID loaded: {OWNER_ID}")
@@ -14,10 +26,7 @@ except (ValueError, TypeError):
     logger.critical("CRITICAL: Invalid or missing TELEGRAM_OWNER_ID.")
     exit(1)
 
-BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
-if not BOT_TOKEN:
-    logger.critical("CRITICAL: TELEGRAM_BOT_TOKEN not set!")
-    exit(1)
+BOT_TOKEN = os.environ["TELEGRAM_BOT_TOKEN"]
 
 try:
     API_ID = int(os.getenv("TELEGRAM_API_ID"))
@@ -26,17 +35,10 @@ except (ValueError, TypeError):
     logger.critical("CRITICAL: Invalid or missing TELEGRAM_API_ID.")
     exit(1)
 
-API_HASH = os.getenv("TELEGRAM_API_HASH")
-if not API_HASH:
-    logger.critical("CRITICAL: TELEGRAM_API_HASH not set!")
-    exit(1)
+API_HASH = os.environ["TELEGRAM_API_HASH"]
 
-APPEAL_CHAT_USERNAME = os.getenv("APPEAL_CHAT_USERNAME")
-if not APPEAL_CHAT_USERNAME:
-    logger.critical("CRITICAL: APPEAL_CHAT_USERNAME not set!")
-    exit(1)
-else:
-    logger.info(f"Appeal chat loaded: {APPEAL_CHAT_USERNAME}")
+APPEAL_CHAT_USERNAME = os.environ["APPEAL_CHAT_USERNAME"]
+logger.info(f"Appeal chat loaded: {APPEAL_CHAT_USERNAME}")
     
 try:
     APPEAL_CHAT_ID = int(os.getenv("APPEAL_CHAT_ID"))
@@ -81,6 +83,21 @@ else:
     
 LOG_CHAT_USERNAME = os.getenv("LOG_CHAT_USERNAME")
 
+WEBHOOK_URL = os.getenv("WEBHOOK_URL")
+WEBHOOK_LISTEN = os.getenv("WEBHOOK_LISTEN", "0.0.0.0")
+WEBHOOK_PORT = 8443
+WEBHOOK_SECRET_TOKEN = os.getenv("WEBHOOK_SECRET_TOKEN")
+if WEBHOOK_URL:
+    webhook_port_str = os.getenv("WEBHOOK_PORT")
+    if webhook_port_str:
+        try:
+            WEBHOOK_PORT = int(webhook_port_str)
+        except ValueError:
+            logger.error(f"Invalid WEBHOOK_PORT: '{webhook_port_str}'. Falling back to {WEBHOOK_PORT}.")
+    logger.info(f"Webhook mode enabled on port {WEBHOOK_PORT}.")
+else:
+    logger.info("WEBHOOK_URL not set. Updates will be fetched with long polling.")
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_NAME = os.path.join(BASE_DIR, "zenthron_data.db")
 SESSION_NAME = "zenthron_user_session"
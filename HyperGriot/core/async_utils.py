@@ -6,7 +6,9 @@ from functools import wraps
 P = ParamSpec("P")
 T = TypeVar("T")
 
-_executor = ThreadPoolExecutor()
+# Each worker thread lazily opens its own SQLite connection, so this also bounds the connection pool.
+AIOIFY_MAX_WORKERS = 8
+_executor = ThreadPoolExecutor(max_workers=AIOIFY_MAX_WORKERS, thread_name_prefix="aioify")
 
 def aioify(func: Callable[P, T]) -> Callable[P, Awaitable[T]]:
     @wraps(func)
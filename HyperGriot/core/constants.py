@@ -273,6 +273,13 @@ OWNER_COMMANDS_TEXT = """
 /execute &lt;file patch&gt; [args...] - Run script.
 """
 
+PRIVILEGED_HELP_TEXTS = {
+    "support": SUPPORT_COMMANDS_TEXT,
+    "sudo": ADMIN_NOTE_TEXT + SUPPORT_COMMANDS_TEXT + SUDO_COMMANDS_TEXT,
+    "dev": ADMIN_NOTE_TEXT + SUPPORT_COMMANDS_TEXT + SUDO_COMMANDS_TEXT + DEVELOPER_COMMANDS_TEXT,
+    "owner": ADMIN_NOTE_TEXT + SUPPORT_COMMANDS_TEXT + SUDO_COMMANDS_TEXT + DEVELOPER_COMMANDS_TEXT + OWNER_COMMANDS_TEXT,
+}
+
 # --- ACTION COMMANDS TEXTS ---
 KILL_TEXTS = [
     "Unleashed a script of fury upon {target}. They have been *deleted*. ☠️ R.I.P.",
@@ -917,3 +924,12 @@ CANT_TARGET_SELF_TEXTS = [
     "Error: Cannot establish action connection with self.",
     "DO NOT TARGET ME - REEEEEEEEEEEEEEEEEEE!",
 ]
+
+# --- PERMISSION TEXTS ---
+MISSING_PERMISSION_TEXTS = {
+    permission: f"Why should I listen to a person with no privileges for this? You need '{permission}' permission."
+    for permission in (
+        "can_change_info", "can_delete_messages", "can_manage_chat",
+        "can_pin_messages", "can_promote_members", "can_restrict_members",
+    )
+}
@@ -1,6 +1,8 @@
 import sqlite3
 import logging
-import json
+import orjson
+import threading
+import time
 from datetime import datetime, timezone
 from typing import List, Tuple
 from telegram import User
@@ -9,206 +11,218 @@ from ..config import DB_NAME, MAX_WARNS
 
 logger = logging.getLogger(__name__)
 
-def init_db():
-    conn = None
-    try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                user_id INTEGER PRIMARY KEY,
-                username TEXT,
-                first_name TEXT,
-                last_name TEXT,
-                language_code TEXT,
-                is_bot INTEGER,
-                last_seen TEXT 
-            )
-        """)
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_username ON users (username)")
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS blacklist (
-                user_id INTEGER PRIMARY KEY,
-                reason TEXT,
-                banned_by_id INTEGER,
-                timestamp TEXT 
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS whitelist_users (
-                user_id INTEGER PRIMARY KEY,
-                added_by_id INTEGER NOT NULL,
-                timestamp TEXT NOT NULL
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS support_users (
-                user_id INTEGER PRIMARY KEY,
-                added_by_id INTEGER NOT NULL,
-                timestamp TEXT NOT NULL
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS sudo_users (
-                user_id INTEGER PRIMARY KEY,
-                added_by_id INTEGER NOT NULL,
-                timestamp TEXT NOT NULL
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS dev_users (
-                user_id INTEGER PRIMARY KEY,
-                added_by_id INTEGER NOT NULL,
-                timestamp TEXT NOT NULL
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS global_bans (
-                user_id INTEGER PRIMARY KEY,
-                reason TEXT,
-                banned_by_id INTEGER NOT NULL,
-                timestamp TEXT NOT NULL
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS bot_chats (
-                chat_id INTEGER PRIMARY KEY,
-                chat_title TEXT,
-                added_at TEXT NOT NULL,
-                enforce_gban INTEGER DEFAULT 1 NOT NULL,
-                welcome_enabled INTEGER DEFAULT 1 NOT NULL,
-                custom_welcome TEXT,
-                goodbye_enabled INTEGER DEFAULT 1 NOT NULL,
-                custom_goodbye TEXT,
-                clean_service_messages INTEGER DEFAULT 0 NOT NULL,
-                warn_limit INTEGER,
-                rules_text TEXT
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS notes (
-                chat_id INTEGER NOT NULL,
-                note_name TEXT NOT NULL,
-                content TEXT NOT NULL,
-                created_by_id INTEGER,
-                created_at TEXT,
-                PRIMARY KEY (chat_id, note_name)
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS warnings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL,
-                chat_id INTEGER NOT NULL,
-                reason TEXT,
-                warned_by_id INTEGER,
-                warned_at TEXT
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS afk_users (
-                user_id INTEGER PRIMARY KEY,
-                reason TEXT,
-                afk_since TEXT NOT NULL
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS disabled_modules (
-                module_name TEXT PRIMARY KEY
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS disabled_commands_per_chat (
-                chat_id INTEGER,
-                command_name TEXT,
-                PRIMARY KEY (chat_id, command_name)
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS chat_join_settings (
-                chat_id INTEGER PRIMARY KEY,
-                filters TEXT,
-                action TEXT NOT NULL DEFAULT 'kick'
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS chat_filters (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                chat_id INTEGER NOT NULL,
-                keyword TEXT NOT NULL,
-                reply_text TEXT,
-                reply_type TEXT NOT NULL DEFAULT 'text', -- 'text', 'photo', 'sticker', 'audio', 'document', 'animation', 'video', 'voice'
-                file_id TEXT,
-                filter_type TEXT NOT NULL DEFAULT 'keyword', -- 'keyword', 'wildcard', 'regex'
-                buttons TEXT,
-                UNIQUE (chat_id, keyword)
-            )
-        """)
+SCHEMA = """
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS users (
+    user_id INTEGER PRIMARY KEY,
+    username TEXT,
+    first_name TEXT,
+    last_name TEXT,
+    language_code TEXT,
+    is_bot INTEGER,
+    last_seen TEXT
+);
+DROP INDEX IF EXISTS idx_username;
+CREATE INDEX IF NOT EXISTS idx_users_username_lower ON users (LOWER(username));
+
+CREATE TABLE IF NOT EXISTS blacklist (
+    user_id INTEGER PRIMARY KEY,
+    reason TEXT,
+    banned_by_id INTEGER,
+    timestamp TEXT
+);
+
+CREATE TABLE IF NOT EXISTS whitelist_users (
+    user_id INTEGER PRIMARY KEY,
+    added_by_id INTEGER NOT NULL,
+    timestamp TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS support_users (
+    user_id INTEGER PRIMARY KEY,
+    added_by_id INTEGER NOT NULL,
+    timestamp TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS sudo_users (
+    user_id INTEGER PRIMARY KEY,
+    added_by_id INTEGER NOT NULL,
+    timestamp TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS dev_users (
+    user_id INTEGER PRIMARY KEY,
+    added_by_id INTEGER NOT NULL,
+    timestamp TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS global_bans (
+    user_id INTEGER PRIMARY KEY,
+    reason TEXT,
+    banned_by_id INTEGER NOT NULL,
+    timestamp TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS bot_chats (
+    chat_id INTEGER PRIMARY KEY,
+    chat_title TEXT,
+    added_at TEXT NOT NULL,
+    enforce_gban INTEGER DEFAULT 1 NOT NULL,
+    welcome_enabled INTEGER DEFAULT 1 NOT NULL,
+    custom_welcome TEXT,
+    goodbye_enabled INTEGER DEFAULT 1 NOT NULL,
+    custom_goodbye TEXT,
+    clean_service_messages INTEGER DEFAULT 0 NOT NULL,
+    warn_limit INTEGER,
+    rules_text TEXT
+);
+
+CREATE TABLE IF NOT EXISTS notes (
+    chat_id INTEGER NOT NULL,
+    note_name TEXT NOT NULL,
+    content TEXT NOT NULL,
+    created_by_id INTEGER,
+    created_at TEXT,
+    PRIMARY KEY (chat_id, note_name)
+);
+
+CREATE TABLE IF NOT EXISTS warnings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    chat_id INTEGER NOT NULL,
+    reason TEXT,
+    warned_by_id INTEGER,
+    warned_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_warnings_chat_user ON warnings (chat_id, user_id);
+
+CREATE TABLE IF NOT EXISTS afk_users (
+    user_id INTEGER PRIMARY KEY,
+    reason TEXT,
+    afk_since TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS disabled_modules (
+    module_name TEXT PRIMARY KEY
+);
+
+CREATE TABLE IF NOT EXISTS disabled_commands_per_chat (
+    chat_id INTEGER,
+    command_name TEXT,
+    PRIMARY KEY (chat_id, command_name)
+);
+
+CREATE TABLE IF NOT EXISTS chat_join_settings (
+    chat_id INTEGER PRIMARY KEY,
+    filters TEXT,
+    action TEXT NOT NULL DEFAULT 'kick'
+);
+
+CREATE TABLE IF NOT EXISTS chat_filters (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    chat_id INTEGER NOT NULL,
+    keyword TEXT NOT NULL,
+    reply_text TEXT,
+    reply_type TEXT NOT NULL DEFAULT 'text', -- 'text', 'photo', 'sticker', 'audio', 'document', 'animation', 'video', 'voice'
+    file_id TEXT,
+    filter_type TEXT NOT NULL DEFAULT 'keyword', -- 'keyword', 'wildcard', 'regex'
+    buttons TEXT,
+    UNIQUE (chat_id, keyword)
+);
+
+CREATE TABLE IF NOT EXISTS chat_blacklist (
+    chat_id INTEGER PRIMARY KEY,
+    chat_name TEXT,
+    timestamp TEXT
+);
+
+COMMIT;
+"""
+
+STATEMENT_CACHE_SIZE = 256
+CONNECTION_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA journal_size_limit=67108864;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-64000;
+PRAGMA mmap_size=268435456;
+PRAGMA optimize=0x10002;
+"""
+STARTUP_ANALYZE = """
+PRAGMA analysis_limit=1000;
+ANALYZE;
+"""
+
+_thread_local = threading.local()
+
+def get_connection() -> sqlite3.Connection:
+    """Returns the calling thread's long-lived connection to the bot database."""
+    conn = getattr(_thread_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_NAME, cached_statements=STATEMENT_CACHE_SIZE)
+        conn.executescript(CONNECTION_PRAGMAS)
+        _thread_local.conn = conn
+    return conn
+
+def backup_database(target_path: str) -> None:
+    """Copies a consistent snapshot of the bot database, including pages still in the WAL, to target_path."""
+    target = sqlite3.connect(target_path)
+    try:
+        get_connection().backup(target)
+    finally:
+        target.close()
 
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS chat_blacklist (
-                chat_id INTEGER PRIMARY KEY,
-                chat_name TEXT,
-                timestamp TEXT
-            )
-        """)
-        
-        conn.commit()
-        logger.info(f"Database '{DB_NAME}' initialized successfully.")
+def init_db():
+    try:
+        with get_connection() as conn:
+            conn.executescript(SCHEMA)
+            conn.executescript(STARTUP_ANALYZE)
+            logger.info(f"Database '{DB_NAME}' initialized successfully.")
+            load_role_members()
+            load_gbanned_users()
+            load_blacklisted_users()
+            load_disabled_modules()
+            load_disabled_commands()
     except sqlite3.Error as e:
         logger.error(f"SQLite error during DB initialization: {e}", exc_info=True)
-    finally:
-        if conn:
-            conn.close()
 
 # --- DATABASE HELPER FUNCTIONS ---
 # --- MODULES ---
+_disabled_modules: set[str] = set()
+
+def load_disabled_modules() -> None:
+    """Loads the disabled module names into memory; disable_module/enable_module keep the set in sync."""
+    _disabled_modules.clear()
+    _disabled_modules.update(get_disabled_modules())
+
 def is_module_disabled(module_name: str) -> bool:
-    try:
-        with sqlite3.connect(DB_NAME) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT module_name FROM disabled_modules WHERE module_name = ?", (module_name,))
-            return cursor.fetchone() is not None
-    except sqlite3.Error as e:
-        logger.error(f"Błąd SQLite przy sprawdzaniu modułu {module_name}: {e}")
-        return False
+    return module_name in _disabled_modules
 
 def disable_module(module_name: str) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
-            conn.execute("INSERT OR IGNORE INTO disabled_modules (module_name) VALUES (?)", (module_name,))
-            return conn.total_changes > 0
+        with get_connection() as conn:
+            cursor = conn.execute("INSERT OR IGNORE INTO disabled_modules (module_name) VALUES (?)", (module_name,))
+        _disabled_modules.add(module_name)
+        return cursor.rowcount > 0
     except sqlite3.Error as e:
         logger.error(f"Błąd SQLite przy wyłączaniu modułu {module_name}: {e}")
         return False
 
 def enable_module(module_name: str) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
-            conn.execute("DELETE FROM disabled_modules WHERE module_name = ?", (module_name,))
-            return conn.total_changes > 0
+        with get_connection() as conn:
+            cursor = conn.execute("DELETE FROM disabled_modules WHERE module_name = ?", (module_name,))
+        _disabled_modules.discard(module_name)
+        return cursor.rowcount > 0
     except sqlite3.Error as e:
         logger.error(f"Błąd SQLite przy włączaniu modułu {module_name}: {e}")
         return False
 
 def get_disabled_modules() -> list:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT module_name FROM disabled_modules")
             return [row[0] for row in cursor.fetchall()]
@@ -217,46 +231,51 @@ def get_disabled_modules() -> list:
         return []
 
 # --- DISABLERS ---
-def is_command_disabled_in_chat(chat_id: int, command_name: str) -> bool:
+_disabled_commands: set[tuple[int, str]] = set()
+
+def load_disabled_commands() -> None:
+    """Loads every (chat_id, command_name) pair into memory; disable/enable_command_in_chat keep the set in sync."""
     try:
-        with sqlite3.connect(DB_NAME) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT 1 FROM disabled_commands_per_chat WHERE chat_id = ? AND command_name = ?",
-                (chat_id, command_name.lower())
-            )
-            return cursor.fetchone() is not None
+        with get_connection() as conn:
+            _disabled_commands.clear()
+            _disabled_commands.update(conn.execute("SELECT chat_id, command_name FROM disabled_commands_per_chat"))
     except sqlite3.Error as e:
-        logger.error(f"SQLite error checking disabled command '{command_name}' in chat {chat_id}: {e}")
-        return False
+        logger.error(f"SQLite error loading disabled commands: {e}", exc_info=True)
+
+def is_command_disabled_in_chat(chat_id: int, command_name: str) -> bool:
+    return (chat_id, command_name.lower()) in _disabled_commands
 
 def disable_command_in_chat(chat_id: int, command_name: str) -> bool:
+    command_name = command_name.lower()
     try:
-        with sqlite3.connect(DB_NAME) as conn:
-            conn.execute(
+        with get_connection() as conn:
+            cursor = conn.execute(
                 "INSERT OR IGNORE INTO disabled_commands_per_chat (chat_id, command_name) VALUES (?, ?)",
-                (chat_id, command_name.lower())
+                (chat_id, command_name)
             )
-            return conn.total_changes > 0
+        _disabled_commands.add((chat_id, command_name))
+        return cursor.rowcount > 0
     except sqlite3.Error as e:
         logger.error(f"SQLite error disabling command '{command_name}' in chat {chat_id}: {e}")
         return False
 
 def enable_command_in_chat(chat_id: int, command_name: str) -> bool:
+    command_name = command_name.lower()
     try:
-        with sqlite3.connect(DB_NAME) as conn:
-            conn.execute(
+        with get_connection() as conn:
+            cursor = conn.execute(
                 "DELETE FROM disabled_commands_per_chat WHERE chat_id = ? AND command_name = ?",
-                (chat_id, command_name.lower())
+                (chat_id, command_name)
             )
-            return conn.total_changes > 0
+        _disabled_commands.discard((chat_id, command_name))
+        return cursor.rowcount > 0
     except sqlite3.Error as e:
         logger.error(f"SQLite error enabling command '{command_name}' in chat {chat_id}: {e}")
         return False
 
 def get_disabled_commands_in_chat(chat_id: int) -> list[str]:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT command_name FROM disabled_commands_per_chat WHERE chat_id = ?",
@@ -268,77 +287,80 @@ def get_disabled_commands_in_chat(chat_id: int) -> list[str]:
         return []
 
 # --- BLACKLIST ---
+_blacklisted_users: set[int] = set()
+
+def load_blacklisted_users() -> None:
+    """Loads every blacklisted user ID into memory; the blacklist table is only written through the helpers below."""
+    try:
+        with get_connection() as conn:
+            _blacklisted_users.clear()
+            _blacklisted_users.update(row[0] for row in conn.execute("SELECT user_id FROM blacklist"))
+    except sqlite3.Error as e:
+        logger.error(f"SQLite error loading blacklist: {e}", exc_info=True)
+
 def add_to_blacklist(user_id: int, banned_by_id: int, reason: str | None = "No reason provided.") -> bool:
-    conn = None
-    try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        current_timestamp_iso = datetime.now(timezone.utc).isoformat()
-        cursor.execute(
-            "INSERT OR IGNORE INTO blacklist (user_id, reason, banned_by_id, timestamp) VALUES (?, ?, ?, ?)",
-            (user_id, reason, banned_by_id, current_timestamp_iso)
-        )
-        conn.commit()
-        return cursor.rowcount > 0
+    try:
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            current_timestamp_iso = datetime.now(timezone.utc).isoformat()
+            cursor.execute(
+                "INSERT OR IGNORE INTO blacklist (user_id, reason, banned_by_id, timestamp) VALUES (?, ?, ?, ?)",
+                (user_id, reason, banned_by_id, current_timestamp_iso)
+            )
+            conn.commit()
+            _blacklisted_users.add(user_id)
+            return cursor.rowcount > 0
     except sqlite3.Error as e:
         logger.error(f"SQLite error adding user {user_id} to blacklist: {e}", exc_info=True)
         return False
-    finally:
-        if conn:
-            conn.close()
 
 def remove_from_blacklist(user_id: int) -> bool:
-    conn = None
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM blacklist WHERE user_id = ?", (user_id,))
-        conn.commit()
-        return cursor.rowcount > 0
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM blacklist WHERE user_id = ?", (user_id,))
+            conn.commit()
+            _blacklisted_users.discard(user_id)
+            return cursor.rowcount > 0
     except sqlite3.Error as e:
         logger.error(f"SQLite error removing user {user_id} from blacklist: {e}", exc_info=True)
         return False
-    finally:
-        if conn:
-            conn.close()
 
 def get_blacklist_reason(user_id: int) -> str | None:
-    conn = None
-    try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute("SELECT reason FROM blacklist WHERE user_id = ?", (user_id,))
-        row = cursor.fetchone()
-        if row:
-            return row[0]
+    if user_id not in _blacklisted_users:
         return None
+    try:
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT reason FROM blacklist WHERE user_id = ?", (user_id,))
+            row = cursor.fetchone()
+            if row:
+                return row[0]
+            return None
     except sqlite3.Error as e:
         logger.error(f"SQLite error checking blacklist reason for user {user_id}: {e}", exc_info=True)
         return None
-    finally:
-        if conn:
-            conn.close()
 
 def is_user_blacklisted(user_id: int) -> bool:
-    return get_blacklist_reason(user_id) is not None
+    return user_id in _blacklisted_users
 
 # --- WHITELIST ---
 def add_to_whitelist(user_id: int, added_by_id: int) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             timestamp = datetime.now(timezone.utc).isoformat()
-            conn.execute(
+            cursor = conn.execute(
                 "INSERT OR IGNORE INTO whitelist_users (user_id, added_by_id, timestamp) VALUES (?, ?, ?)",
                 (user_id, added_by_id, timestamp)
             )
-            return conn.total_changes > 0
+            return cursor.rowcount > 0
     except sqlite3.Error as e:
         logger.error(f"SQLite error adding user {user_id} to whitelist: {e}")
         return False
 
 def remove_from_whitelist(user_id: int) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM whitelist_users WHERE user_id = ?", (user_id,))
             return cursor.rowcount > 0
@@ -348,82 +370,104 @@ def remove_from_whitelist(user_id: int) -> bool:
 
 def is_whitelisted(user_id: int) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             res = conn.cursor().execute("SELECT 1 FROM whitelist_users WHERE user_id = ?", (user_id,)).fetchone()
             return res is not None
     except sqlite3.Error:
         return False
 
 def get_all_whitelist_users_from_db() -> List[Tuple[int, str]]:
-    conn = None
     whitelist_list = []
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute("SELECT user_id, timestamp FROM whitelist_users ORDER BY timestamp DESC")
-        rows = cursor.fetchall()
-        for row in rows:
-            whitelist_list.append((row[0], row[1]))
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT user_id, timestamp FROM whitelist_users ORDER BY timestamp DESC")
+            rows = cursor.fetchall()
+            for row in rows:
+                whitelist_list.append((row[0], row[1]))
     except sqlite3.Error as e:
         logger.error(f"SQLite error fetching all whitelist users: {e}", exc_info=True)
-    finally:
-        if conn:
-            conn.close()
     return whitelist_list
 
+# --- ROLES ---
+ROLE_TABLES = (("dev", "dev_users"), ("sudo", "sudo_users"), ("support", "support_users"))
+ROLE_TABLE_BY_NAME = dict(ROLE_TABLES)
+_role_members: dict[str, set[int]] = {table: set() for _, table in ROLE_TABLES}
+
+def load_role_members() -> None:
+    """Loads every dev, sudo and support user into memory; the role tables are only written through the helpers below."""
+    try:
+        with get_connection() as conn:
+            for _, table in ROLE_TABLES:
+                _role_members[table] = {row[0] for row in conn.execute(f"SELECT user_id FROM {table}")}
+    except sqlite3.Error as e:
+        logger.error(f"SQLite error loading role members: {e}", exc_info=True)
+
+def get_user_role(user_id: int) -> str | None:
+    """Returns the highest role ('dev', 'sudo' or 'support') of a user."""
+    for role, table in ROLE_TABLES:
+        if user_id in _role_members[table]:
+            return role
+    return None
+
+def set_user_role(user_id: int, role: str, added_by_id: int) -> bool:
+    """Moves a user to a single role ('dev', 'sudo' or 'support') in one transaction."""
+    try:
+        with get_connection() as conn:
+            current_timestamp_iso = datetime.now(timezone.utc).isoformat()
+            for _, table in ROLE_TABLES:
+                conn.execute(f"DELETE FROM {table} WHERE user_id = ?", (user_id,))
+            conn.execute(
+                f"INSERT INTO {ROLE_TABLE_BY_NAME[role]} (user_id, added_by_id, timestamp) VALUES (?, ?, ?)",
+                (user_id, added_by_id, current_timestamp_iso)
+            )
+    except sqlite3.Error as e:
+        logger.error(f"SQLite error setting role {role} for user {user_id}: {e}", exc_info=True)
+        return False
+    for _, table in ROLE_TABLES:
+        _role_members[table].discard(user_id)
+    _role_members[ROLE_TABLE_BY_NAME[role]].add(user_id)
+    return True
+
 # --- SUPPORT ---
 def add_support_user(user_id: int, added_by_id: int) -> bool:
     """Adds a user to the Support list."""
-    conn = None
-    try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        current_timestamp_iso = datetime.now(timezone.utc).isoformat()
-        cursor.execute(
-            "INSERT OR IGNORE INTO support_users (user_id, added_by_id, timestamp) VALUES (?, ?, ?)",
-            (user_id, added_by_id, current_timestamp_iso)
-        )
-        conn.commit()
-        return cursor.rowcount > 0
+    try:
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            current_timestamp_iso = datetime.now(timezone.utc).isoformat()
+            cursor.execute(
+                "INSERT OR IGNORE INTO support_users (user_id, added_by_id, timestamp) VALUES (?, ?, ?)",
+                (user_id, added_by_id, current_timestamp_iso)
+            )
+            conn.commit()
+            _role_members["support_users"].add(user_id)
+            return cursor.rowcount > 0
     except sqlite3.Error as e:
         logger.error(f"SQLite error adding support user {user_id}: {e}", exc_info=True)
         return False
-    finally:
-        if conn: conn.close()
 
 def remove_support_user(user_id: int) -> bool:
     """Removes a user from the Support list."""
-    conn = None
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM support_users WHERE user_id = ?", (user_id,))
-        conn.commit()
-        return cursor.rowcount > 0
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM support_users WHERE user_id = ?", (user_id,))
+            conn.commit()
+            _role_members["support_users"].discard(user_id)
+            return cursor.rowcount > 0
     except sqlite3.Error as e:
         logger.error(f"SQLite error removing support user {user_id}: {e}", exc_info=True)
         return False
-    finally:
-        if conn: conn.close()
 
 def is_support_user(user_id: int) -> bool:
     """Checks if a user is on the Support list."""
-    conn = None
-    try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1 FROM support_users WHERE user_id = ?", (user_id,))
-        return cursor.fetchone() is not None
-    except sqlite3.Error as e:
-        logger.error(f"SQLite error checking support for user {user_id}: {e}", exc_info=True)
-        return False
-    finally:
-        if conn: conn.close()
+    return user_id in _role_members["support_users"]
 
 def get_all_support_users_from_db() -> List[Tuple[int, str]]:
     """Fetches all Support users from the database."""
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT user_id, timestamp FROM support_users ORDER BY timestamp DESC")
             return cursor.fetchall()
@@ -434,125 +478,90 @@ def get_all_support_users_from_db() -> List[Tuple[int, str]]:
 # --- SUDO ---
 def add_sudo_user(user_id: int, added_by_id: int) -> bool:
     """Adds a user to the sudo list."""
-    conn = None
-    try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        current_timestamp_iso = datetime.now(timezone.utc).isoformat()
-        cursor.execute(
-            "INSERT OR IGNORE INTO sudo_users (user_id, added_by_id, timestamp) VALUES (?, ?, ?)",
-            (user_id, added_by_id, current_timestamp_iso)
-        )
-        conn.commit()
-        return cursor.rowcount > 0 
+    try:
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            current_timestamp_iso = datetime.now(timezone.utc).isoformat()
+            cursor.execute(
+                "INSERT OR IGNORE INTO sudo_users (user_id, added_by_id, timestamp) VALUES (?, ?, ?)",
+                (user_id, added_by_id, current_timestamp_iso)
+            )
+            conn.commit()
+            _role_members["sudo_users"].add(user_id)
+            return cursor.rowcount > 0 
     except sqlite3.Error as e:
         logger.error(f"SQLite error adding sudo user {user_id}: {e}", exc_info=True)
         return False
-    finally:
-        if conn:
-            conn.close()
 
 def remove_sudo_user(user_id: int) -> bool:
     """Removes a user from the sudo list."""
-    conn = None
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM sudo_users WHERE user_id = ?", (user_id,))
-        conn.commit()
-        return cursor.rowcount > 0
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM sudo_users WHERE user_id = ?", (user_id,))
+            conn.commit()
+            _role_members["sudo_users"].discard(user_id)
+            return cursor.rowcount > 0
     except sqlite3.Error as e:
         logger.error(f"SQLite error removing sudo user {user_id}: {e}", exc_info=True)
         return False
-    finally:
-        if conn:
-            conn.close()
 
 def is_sudo_user(user_id: int) -> bool:
     """Checks if a user is on the sudo list (database check only)."""
-    conn = None
-    try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1 FROM sudo_users WHERE user_id = ?", (user_id,))
-        return cursor.fetchone() is not None
-    except sqlite3.Error as e:
-        logger.error(f"SQLite error checking sudo for user {user_id}: {e}", exc_info=True)
-        return False 
-    finally:
-        if conn:
-            conn.close()
+    return user_id in _role_members["sudo_users"]
 
 def get_all_sudo_users_from_db() -> List[Tuple[int, str]]:
-    conn = None
     sudo_list = []
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute("SELECT user_id, timestamp FROM sudo_users ORDER BY timestamp DESC")
-        rows = cursor.fetchall()
-        for row in rows:
-            sudo_list.append((row[0], row[1]))
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT user_id, timestamp FROM sudo_users ORDER BY timestamp DESC")
+            rows = cursor.fetchall()
+            for row in rows:
+                sudo_list.append((row[0], row[1]))
     except sqlite3.Error as e:
         logger.error(f"SQLite error fetching all sudo users: {e}", exc_info=True)
-    finally:
-        if conn:
-            conn.close()
     return sudo_list
 
 # --- DEVELOPER ---
 def add_dev_user(user_id: int, added_by_id: int) -> bool:
     """Adds a user to the Developer list."""
-    conn = None
-    try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        current_timestamp_iso = datetime.now(timezone.utc).isoformat()
-        cursor.execute(
-            "INSERT OR IGNORE INTO dev_users (user_id, added_by_id, timestamp) VALUES (?, ?, ?)",
-            (user_id, added_by_id, current_timestamp_iso)
-        )
-        conn.commit()
-        return cursor.rowcount > 0
+    try:
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            current_timestamp_iso = datetime.now(timezone.utc).isoformat()
+            cursor.execute(
+                "INSERT OR IGNORE INTO dev_users (user_id, added_by_id, timestamp) VALUES (?, ?, ?)",
+                (user_id, added_by_id, current_timestamp_iso)
+            )
+            conn.commit()
+            _role_members["dev_users"].add(user_id)
+            return cursor.rowcount > 0
     except sqlite3.Error as e:
         logger.error(f"SQLite error adding dev user {user_id}: {e}", exc_info=True)
         return False
-    finally:
-        if conn: conn.close()
 
 def remove_dev_user(user_id: int) -> bool:
     """Removes a user from the Developer list."""
-    conn = None
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM dev_users WHERE user_id = ?", (user_id,))
-        conn.commit()
-        return cursor.rowcount > 0
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM dev_users WHERE user_id = ?", (user_id,))
+            conn.commit()
+            _role_members["dev_users"].discard(user_id)
+            return cursor.rowcount > 0
     except sqlite3.Error as e:
         logger.error(f"SQLite error removing dev user {user_id}: {e}", exc_info=True)
         return False
-    finally:
-        if conn: conn.close()
 
 def is_dev_user(user_id: int) -> bool:
     """Checks if a user is on the Developer list."""
-    conn = None
-    try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1 FROM dev_users WHERE user_id = ?", (user_id,))
-        return cursor.fetchone() is not None
-    except sqlite3.Error as e:
-        logger.error(f"SQLite error checking dev for user {user_id}: {e}", exc_info=True)
-        return False
-    finally:
-        if conn: conn.close()
+    return user_id in _role_members["dev_users"]
         
 def get_all_dev_users_from_db() -> List[Tuple[int, str]]:
     """Fetches all developers from the database."""
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT user_id, timestamp FROM dev_users ORDER BY timestamp DESC")
             return cursor.fetchall()
@@ -561,16 +570,30 @@ def get_all_dev_users_from_db() -> List[Tuple[int, str]]:
         return []
 
 # --- GLOBAL BANS ---
+_gbanned_users: set[int] = set()
+
+def load_gbanned_users() -> None:
+    """Loads every globally banned user ID into memory; global_bans is only written through the helpers below."""
+    try:
+        with get_connection() as conn:
+            _gbanned_users.clear()
+            _gbanned_users.update(row[0] for row in conn.execute("SELECT user_id FROM global_bans"))
+    except sqlite3.Error as e:
+        logger.error(f"SQLite error loading global bans: {e}", exc_info=True)
+
 def add_to_gban(user_id: int, banned_by_id: int, reason: str | None) -> bool:
     reason = reason or "No reason provided."
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             timestamp = datetime.now(timezone.utc).isoformat()
             cursor.execute(
-                "INSERT OR REPLACE INTO global_bans (user_id, reason, banned_by_id, timestamp) VALUES (?, ?, ?, ?)",
+                "INSERT INTO global_bans (user_id, reason, banned_by_id, timestamp) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(user_id) DO UPDATE SET reason = excluded.reason, banned_by_id = excluded.banned_by_id, timestamp = excluded.timestamp",
                 (user_id, reason, banned_by_id, timestamp)
             )
+            conn.commit()
+            _gbanned_users.add(user_id)
             return cursor.rowcount > 0
     except sqlite3.Error as e:
         logger.error(f"SQLite error adding user {user_id} to gban list: {e}")
@@ -578,17 +601,21 @@ def add_to_gban(user_id: int, banned_by_id: int, reason: str | None) -> bool:
 
 def remove_from_gban(user_id: int) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM global_bans WHERE user_id = ?", (user_id,))
+            conn.commit()
+            _gbanned_users.discard(user_id)
             return cursor.rowcount > 0
     except sqlite3.Error as e:
         logger.error(f"SQLite error removing user {user_id} from gban list: {e}")
         return False
 
 def get_gban_reason(user_id: int) -> str | None:
+    if user_id not in _gbanned_users:
+        return None
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT reason FROM global_bans WHERE user_id = ?", (user_id,))
             row = cursor.fetchone()
@@ -600,7 +627,7 @@ def get_gban_reason(user_id: int) -> str | None:
 def is_gban_enforced(chat_id: int) -> bool:
     """Checks if gban enforcement is enabled for a specific chat."""
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             res = cursor.execute(
                 "SELECT enforce_gban FROM bot_chats WHERE chat_id = ?", (chat_id,)
@@ -613,38 +640,94 @@ def is_gban_enforced(chat_id: int) -> bool:
         return True
 
 # --- USERS ---
+USER_UPSERT_QUERY = """
+    INSERT INTO users (user_id, username, first_name, last_name, language_code, is_bot, last_seen)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(user_id) DO UPDATE SET
+        username = excluded.username,
+        first_name = excluded.first_name,
+        last_name = excluded.last_name,
+        language_code = excluded.language_code,
+        is_bot = excluded.is_bot,
+        last_seen = excluded.last_seen 
+"""
+USER_SELECT_QUERY = "SELECT user_id, username, first_name, last_name, language_code, is_bot FROM users"
+USER_LAST_SEEN_RESOLUTION = 300
+_pending_user_rows: dict[int, tuple] = {}
+_pending_user_rows_lock = threading.Lock()
+_written_user_profiles: dict[int, tuple[tuple, float]] = {}
+_written_user_profiles_lock = threading.Lock()
+
+def _user_row(user: User) -> tuple:
+    return (
+        user.id, user.username, user.first_name, user.last_name,
+        user.language_code, 1 if user.is_bot else 0, datetime.now(timezone.utc).isoformat()
+    )
+
+def _user_from_row(row: tuple) -> User:
+    user_id, username, first_name, last_name, language_code, is_bot = row
+    return User(
+        id=user_id, username=username, first_name=first_name or "",
+        last_name=last_name, language_code=language_code, is_bot=bool(is_bot)
+    )
+
 def update_user_in_db(user: User | None):
     if not user:
         return
-    conn = None
-    try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        current_timestamp_iso = datetime.now(timezone.utc).isoformat()
-        cursor.execute("""
-            INSERT INTO users (user_id, username, first_name, last_name, language_code, is_bot, last_seen)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(user_id) DO UPDATE SET
-                username = excluded.username,
-                first_name = excluded.first_name,
-                last_name = excluded.last_name,
-                language_code = excluded.language_code,
-                is_bot = excluded.is_bot,
-                last_seen = excluded.last_seen 
-        """, (
-            user.id, user.username, user.first_name, user.last_name,
-            user.language_code, 1 if user.is_bot else 0, current_timestamp_iso
-        ))
-        conn.commit()
+    try:
+        with get_connection() as conn:
+            conn.execute(USER_UPSERT_QUERY, _user_row(user))
     except sqlite3.Error as e:
         logger.error(f"SQLite error updating user {user.id} in users table: {e}", exc_info=True)
-    finally:
-        if conn:
-            conn.close()
+
+def queue_user_update(user: User | None) -> None:
+    """Buffers a users-table upsert until the next write_user_updates call; only the latest row per user is kept.
+
+    Users whose profile is unchanged are skipped until USER_LAST_SEEN_RESOLUTION seconds after their last successful write.
+    """
+    if not user:
+        return
+    profile = (user.username, user.first_name, user.last_name, user.language_code, 1 if user.is_bot else 0)
+    written = _written_user_profiles.get(user.id)
+    if written and written[0] == profile and time.monotonic() - written[1] < USER_LAST_SEEN_RESOLUTION:
+        return
+    row = _user_row(user)
+    with _pending_user_rows_lock:
+        _pending_user_rows[user.id] = row
+
+def take_pending_user_updates() -> list[tuple]:
+    global _pending_user_rows
+    with _pending_user_rows_lock:
+        pending, _pending_user_rows = _pending_user_rows, {}
+    return list(pending.values())
+
+def write_user_updates(rows: list[tuple]) -> None:
+    if not rows:
+        return
+    try:
+        with get_connection() as conn:
+            conn.executemany(USER_UPSERT_QUERY, rows)
+    except sqlite3.Error as e:
+        logger.error(f"SQLite error writing {len(rows)} buffered user updates: {e}", exc_info=True)
+        with _pending_user_rows_lock:
+            for row in rows:
+                _pending_user_rows.setdefault(row[0], row)
+        return
+
+    now = time.monotonic()
+    with _written_user_profiles_lock:
+        for row in rows:
+            _written_user_profiles[row[0]] = (row[1:6], now)
+        stale_user_ids = [
+            user_id for user_id, (_, written_at) in _written_user_profiles.items()
+            if now - written_at >= USER_LAST_SEEN_RESOLUTION
+        ]
+        for user_id in stale_user_ids:
+            del _written_user_profiles[user_id]
 
 def delete_user_from_db(user_id: int) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM users WHERE user_id = ?", (user_id,))
             return cursor.rowcount > 0
@@ -655,60 +738,69 @@ def delete_user_from_db(user_id: int) -> bool:
 def get_user_from_db_by_username(username_query: str) -> User | None:
     if not username_query:
         return None
-    conn = None
     user_obj: User | None = None
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        normalized_username = username_query.lstrip('@').lower()
-        cursor.execute(
-            "SELECT user_id, username, first_name, last_name, language_code, is_bot FROM users WHERE LOWER(username) = ?",
-            (normalized_username,)
-        )
-        row = cursor.fetchone()
-        if row:
-            user_obj = User(
-                id=row[0], username=row[1], first_name=row[2] or "",
-                last_name=row[3], language_code=row[4], is_bot=bool(row[5])
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            normalized_username = username_query.lstrip('@').lower()
+            cursor.execute(
+                f"{USER_SELECT_QUERY} WHERE LOWER(username) = ? ORDER BY last_seen DESC LIMIT 1",
+                (normalized_username,)
             )
-            logger.info(f"User {username_query} found in DB with ID {row[0]}.")
+            row = cursor.fetchone()
+            if row:
+                user_obj = _user_from_row(row)
+                logger.info(f"User {username_query} found in DB with ID {row[0]}.")
     except sqlite3.Error as e:
         logger.error(f"SQLite error fetching user by username '{username_query}': {e}", exc_info=True)
-    finally:
-        if conn:
-            conn.close()
     return user_obj
 
 def get_user_from_db_by_id(user_id: int) -> User | None:
     if not user_id:
         return None
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "SELECT user_id, username, first_name, last_name, language_code, is_bot FROM users WHERE user_id = ?",
+                f"{USER_SELECT_QUERY} WHERE user_id = ?",
                 (user_id,)
             )
             row = cursor.fetchone()
             if row:
-                user_obj = User(
-                    id=row[0], username=row[1], first_name=row[2] or "",
-                    last_name=row[3], language_code=row[4], is_bot=bool(row[5])
-                )
+                user_obj = _user_from_row(row)
                 logger.info(f"User ID {user_id} found in DB.")
                 return user_obj
     except sqlite3.Error as e:
         logger.error(f"SQLite error fetching user by ID {user_id}: {e}", exc_info=True)
     return None
 
+def get_users_from_db_by_ids(user_ids: list[int]) -> dict[int, User]:
+    if not user_ids:
+        return {}
+    users_map: dict[int, User] = {}
+    try:
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            placeholders = ",".join("?" * len(user_ids))
+            cursor.execute(
+                f"{USER_SELECT_QUERY} WHERE user_id IN ({placeholders})",
+                tuple(user_ids)
+            )
+            for row in cursor.fetchall():
+                users_map[row[0]] = _user_from_row(row)
+    except sqlite3.Error as e:
+        logger.error(f"SQLite error fetching {len(user_ids)} users by ID: {e}", exc_info=True)
+    return users_map
+
 # --- CHATS ---
 def add_chat_to_db(chat_id: int, chat_title: str):
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             timestamp = datetime.now(timezone.utc).isoformat()
             cursor.execute(
-                "INSERT OR REPLACE INTO bot_chats (chat_id, chat_title, added_at) VALUES (?, ?, ?)",
+                "INSERT INTO bot_chats (chat_id, chat_title, added_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(chat_id) DO UPDATE SET chat_title = excluded.chat_title",
                 (chat_id, chat_title, timestamp)
             )
     except sqlite3.Error as e:
@@ -716,7 +808,7 @@ def add_chat_to_db(chat_id: int, chat_title: str):
 
 def remove_chat_from_db(chat_id: int):
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM bot_chats WHERE chat_id = ?", (chat_id,))
     except sqlite3.Error as e:
@@ -724,7 +816,7 @@ def remove_chat_from_db(chat_id: int):
 
 def get_all_bot_chats_from_db() -> List[Tuple[int, str, str]]:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT chat_id, chat_title, added_at FROM bot_chats ORDER BY added_at DESC")
             return cursor.fetchall()
@@ -734,7 +826,7 @@ def get_all_bot_chats_from_db() -> List[Tuple[int, str, str]]:
 
 def remove_chat_from_db_by_id(chat_id: int) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM bot_chats WHERE chat_id = ?", (chat_id,))
             conn.commit()
@@ -746,14 +838,11 @@ def remove_chat_from_db_by_id(chat_id: int) -> bool:
 # --- CHAT SETTINGS ---
 def set_welcome_setting(chat_id: int, enabled: bool, text: str | None = None) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
-            cursor = conn.cursor()
-            cursor.execute("INSERT OR IGNORE INTO bot_chats (chat_id, added_at) VALUES (?, ?)", 
-                           (chat_id, datetime.now(timezone.utc).isoformat()))
-            
-            cursor.execute(
-                "UPDATE bot_chats SET welcome_enabled = ?, custom_welcome = ? WHERE chat_id = ?",
-                (1 if enabled else 0, text, chat_id)
+        with get_connection() as conn:
+            conn.execute(
+                "INSERT INTO bot_chats (chat_id, added_at, welcome_enabled, custom_welcome) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(chat_id) DO UPDATE SET welcome_enabled = excluded.welcome_enabled, custom_welcome = excluded.custom_welcome",
+                (chat_id, datetime.now(timezone.utc).isoformat(), 1 if enabled else 0, text)
             )
         return True
     except sqlite3.Error as e:
@@ -762,14 +851,11 @@ def set_welcome_setting(chat_id: int, enabled: bool, text: str | None = None) ->
 
 def set_goodbye_setting(chat_id: int, enabled: bool, text: str | None = None) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
-            cursor = conn.cursor()
-            cursor.execute("INSERT OR IGNORE INTO bot_chats (chat_id, added_at) VALUES (?, ?)", 
-                           (chat_id, datetime.now(timezone.utc).isoformat()))
-            
-            cursor.execute(
-                "UPDATE bot_chats SET goodbye_enabled = ?, custom_goodbye = ? WHERE chat_id = ?",
-                (1 if enabled else 0, text, chat_id)
+        with get_connection() as conn:
+            conn.execute(
+                "INSERT INTO bot_chats (chat_id, added_at, goodbye_enabled, custom_goodbye) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(chat_id) DO UPDATE SET goodbye_enabled = excluded.goodbye_enabled, custom_goodbye = excluded.custom_goodbye",
+                (chat_id, datetime.now(timezone.utc).isoformat(), 1 if enabled else 0, text)
             )
         return True
     except sqlite3.Error as e:
@@ -778,7 +864,7 @@ def set_goodbye_setting(chat_id: int, enabled: bool, text: str | None = None) ->
 
 def get_welcome_settings(chat_id: int) -> Tuple[bool, str | None]:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             res = conn.cursor().execute(
                 "SELECT welcome_enabled, custom_welcome FROM bot_chats WHERE chat_id = ?", (chat_id,)
             ).fetchone()
@@ -792,7 +878,7 @@ def get_welcome_settings(chat_id: int) -> Tuple[bool, str | None]:
 def get_goodbye_settings(chat_id: int) -> Tuple[bool, str | None]:
     """Pobiera ustawienia pożegnań (czy włączone, jaki tekst)."""
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             res = conn.cursor().execute(
                 "SELECT goodbye_enabled, custom_goodbye FROM bot_chats WHERE chat_id = ?", (chat_id,)
             ).fetchone()
@@ -805,14 +891,11 @@ def get_goodbye_settings(chat_id: int) -> Tuple[bool, str | None]:
 
 def set_clean_service(chat_id: int, enabled: bool) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
-            cursor = conn.cursor()
-            cursor.execute("INSERT OR IGNORE INTO bot_chats (chat_id, added_at) VALUES (?, ?)", 
-                           (chat_id, datetime.now(timezone.utc).isoformat()))
-            
-            cursor.execute(
-                "UPDATE bot_chats SET clean_service_messages = ? WHERE chat_id = ?",
-                (1 if enabled else 0, chat_id)
+        with get_connection() as conn:
+            conn.execute(
+                "INSERT INTO bot_chats (chat_id, added_at, clean_service_messages) VALUES (?, ?, ?) "
+                "ON CONFLICT(chat_id) DO UPDATE SET clean_service_messages = excluded.clean_service_messages",
+                (chat_id, datetime.now(timezone.utc).isoformat(), 1 if enabled else 0)
             )
         return True
     except sqlite3.Error as e:
@@ -821,7 +904,7 @@ def set_clean_service(chat_id: int, enabled: bool) -> bool:
 
 def should_clean_service(chat_id: int) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             res = conn.cursor().execute(
                 "SELECT clean_service_messages FROM bot_chats WHERE chat_id = ?", (chat_id,)
             ).fetchone()
@@ -832,11 +915,12 @@ def should_clean_service(chat_id: int) -> bool:
 
 def set_warn_limit(chat_id: int, limit: int) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
-            cursor = conn.cursor()
-            cursor.execute("INSERT OR IGNORE INTO bot_chats (chat_id, added_at) VALUES (?, ?)", 
-                           (chat_id, datetime.now(timezone.utc).isoformat()))
-            cursor.execute("UPDATE bot_chats SET warn_limit = ? WHERE chat_id = ?", (limit, chat_id))
+        with get_connection() as conn:
+            conn.execute(
+                "INSERT INTO bot_chats (chat_id, added_at, warn_limit) VALUES (?, ?, ?) "
+                "ON CONFLICT(chat_id) DO UPDATE SET warn_limit = excluded.warn_limit",
+                (chat_id, datetime.now(timezone.utc).isoformat(), limit)
+            )
         return True
     except sqlite3.Error as e:
         logger.error(f"Error setting warn limit for chat {chat_id}: {e}")
@@ -844,7 +928,7 @@ def set_warn_limit(chat_id: int, limit: int) -> bool:
 
 def get_warn_limit(chat_id: int) -> int:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             res = conn.cursor().execute("SELECT warn_limit FROM bot_chats WHERE chat_id = ?", (chat_id,)).fetchone()
             if res and res[0] is not None and res[0] > 0:
                 return res[0]
@@ -855,10 +939,12 @@ def get_warn_limit(chat_id: int) -> int:
 
 def set_rules(chat_id: int, rules: str) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
-            conn.execute("INSERT OR IGNORE INTO bot_chats (chat_id, added_at) VALUES (?, ?)",
-                         (chat_id, datetime.now(timezone.utc).isoformat()))
-            conn.execute("UPDATE bot_chats SET rules_text = ? WHERE chat_id = ?", (rules, chat_id))
+        with get_connection() as conn:
+            conn.execute(
+                "INSERT INTO bot_chats (chat_id, added_at, rules_text) VALUES (?, ?, ?) "
+                "ON CONFLICT(chat_id) DO UPDATE SET rules_text = excluded.rules_text",
+                (chat_id, datetime.now(timezone.utc).isoformat(), rules)
+            )
         return True
     except sqlite3.Error as e:
         logger.error(f"Error setting rules for chat {chat_id}: {e}")
@@ -866,7 +952,7 @@ def set_rules(chat_id: int, rules: str) -> bool:
 
 def get_rules(chat_id: int) -> str | None:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             res = conn.cursor().execute("SELECT rules_text FROM bot_chats WHERE chat_id = ?", (chat_id,)).fetchone()
             return res[0] if res else None
     except sqlite3.Error:
@@ -878,10 +964,11 @@ def clear_rules(chat_id: int) -> bool:
 # --- NOTES ---
 def add_note(chat_id: int, note_name: str, content: str, user_id: int) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             timestamp = datetime.now(timezone.utc).isoformat()
             conn.execute(
-                "INSERT OR REPLACE INTO notes (chat_id, note_name, content, created_by_id, created_at) VALUES (?, ?, ?, ?, ?)",
+                "INSERT INTO notes (chat_id, note_name, content, created_by_id, created_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(chat_id, note_name) DO UPDATE SET content = excluded.content, created_by_id = excluded.created_by_id, created_at = excluded.created_at",
                 (chat_id, note_name.lower(), content, user_id, timestamp)
             )
         return True
@@ -891,7 +978,7 @@ def add_note(chat_id: int, note_name: str, content: str, user_id: int) -> bool:
 
 def remove_note(chat_id: int, note_name: str) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM notes WHERE chat_id = ? AND note_name = ?", (chat_id, note_name.lower()))
             return cursor.rowcount > 0
@@ -901,7 +988,7 @@ def remove_note(chat_id: int, note_name: str) -> bool:
 
 def get_note(chat_id: int, note_name: str) -> str | None:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             res = conn.cursor().execute("SELECT content FROM notes WHERE chat_id = ? AND note_name = ?", (chat_id, note_name.lower())).fetchone()
             return res[0] if res else None
     except sqlite3.Error:
@@ -909,7 +996,7 @@ def get_note(chat_id: int, note_name: str) -> str | None:
 
 def get_all_notes(chat_id: int) -> List[str]:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             notes = conn.cursor().execute("SELECT note_name FROM notes WHERE chat_id = ? ORDER BY note_name", (chat_id,)).fetchall()
             return [row[0] for row in notes]
     except sqlite3.Error:
@@ -918,7 +1005,7 @@ def get_all_notes(chat_id: int) -> List[str]:
 # --- WARNINGS ---
 def add_warning(chat_id: int, user_id: int, reason: str, admin_id: int) -> Tuple[int, int]:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             timestamp = datetime.now(timezone.utc).isoformat()
             cursor.execute(
@@ -939,7 +1026,7 @@ def add_warning(chat_id: int, user_id: int, reason: str, admin_id: int) -> Tuple
 
 def remove_warning_by_id(warn_id: int) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM warnings WHERE id = ?", (warn_id,))
             return cursor.rowcount > 0
@@ -949,7 +1036,7 @@ def remove_warning_by_id(warn_id: int) -> bool:
 
 def get_warnings(chat_id: int, user_id: int) -> List[Tuple[str, int]]:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             warnings = conn.cursor().execute(
                 "SELECT reason, warned_by_id FROM warnings WHERE chat_id = ? AND user_id = ?",
                 (chat_id, user_id)
@@ -961,7 +1048,7 @@ def get_warnings(chat_id: int, user_id: int) -> List[Tuple[str, int]]:
 
 def reset_warnings(chat_id: int, user_id: int) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM warnings WHERE chat_id = ? AND user_id = ?", (chat_id, user_id))
             return cursor.rowcount > 0
@@ -972,10 +1059,11 @@ def reset_warnings(chat_id: int, user_id: int) -> bool:
 # --- AFK ---
 def set_afk(user_id: int, reason: str | None) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             timestamp = datetime.now(timezone.utc).isoformat()
             conn.execute(
-                "INSERT OR REPLACE INTO afk_users (user_id, reason, afk_since) VALUES (?, ?, ?)",
+                "INSERT INTO afk_users (user_id, reason, afk_since) VALUES (?, ?, ?) "
+                "ON CONFLICT(user_id) DO UPDATE SET reason = excluded.reason, afk_since = excluded.afk_since",
                 (user_id, reason, timestamp)
             )
         return True
@@ -985,7 +1073,7 @@ def set_afk(user_id: int, reason: str | None) -> bool:
 
 def get_afk_status(user_id: int) -> Tuple[str, str] | None:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             res = conn.cursor().execute(
                 "SELECT reason, afk_since FROM afk_users WHERE user_id = ?", (user_id,)
             ).fetchone()
@@ -995,7 +1083,7 @@ def get_afk_status(user_id: int) -> Tuple[str, str] | None:
 
 def clear_afk(user_id: int) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM afk_users WHERE user_id = ?", (user_id,))
             return cursor.rowcount > 0
@@ -1004,25 +1092,31 @@ def clear_afk(user_id: int) -> bool:
         return False
 
 # --- JOINFILTERS ---
+_join_settings_cache: dict[int, tuple[list[str], str]] = {}
+
 def get_chat_join_settings(chat_id: int) -> tuple[list[str], str]:
+    cached = _join_settings_cache.get(chat_id)
+    if cached is not None:
+        return list(cached[0]), cached[1]
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT filters, action FROM chat_join_settings WHERE chat_id = ?", (chat_id,))
             row = cursor.fetchone()
             if row:
                 filters_json, action = row
-                filters_list = json.loads(filters_json) if filters_json else []
-                return filters_list, action
+                filters_list = orjson.loads(filters_json) if filters_json else []
             else:
-                return [], 'kick'
-    except (sqlite3.Error, json.JSONDecodeError) as e:
+                filters_list, action = [], 'kick'
+            _join_settings_cache[chat_id] = (filters_list, action)
+            return list(filters_list), action
+    except (sqlite3.Error, orjson.JSONDecodeError) as e:
         logger.error(f"Error getting join settings for chat {chat_id}: {e}")
         return [], 'kick'
 
 def update_chat_join_settings(chat_id: int, filters: list[str] | None = None, action: str | None = None) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             
             current_filters, current_action = get_chat_join_settings(chat_id)
@@ -1030,26 +1124,34 @@ def update_chat_join_settings(chat_id: int, filters: list[str] | None = None, ac
             new_filters = filters if filters is not None else current_filters
             new_action = action if action is not None else current_action
 
-            filters_json = json.dumps(sorted(list(set(new_filters))))
+            filters_json = orjson.dumps(sorted(set(new_filters))).decode()
 
             cursor.execute(
-                "INSERT OR REPLACE INTO chat_join_settings (chat_id, filters, action) VALUES (?, ?, ?)",
+                "INSERT INTO chat_join_settings (chat_id, filters, action) VALUES (?, ?, ?) "
+                "ON CONFLICT(chat_id) DO UPDATE SET filters = excluded.filters, action = excluded.action",
                 (chat_id, filters_json, new_action)
             )
+        _join_settings_cache.pop(chat_id, None)
         return True
-    except (sqlite3.Error, json.JSONDecodeError) as e:
+    except (sqlite3.Error, orjson.JSONDecodeError) as e:
         logger.error(f"Error updating join settings for chat {chat_id}: {e}")
         return False
 
 # --- FILTERS ---
 def add_or_update_filter(chat_id: int, keyword: str, data: dict) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             conn.execute(
                 """
-                INSERT OR REPLACE INTO chat_filters 
+                INSERT INTO chat_filters 
                 (chat_id, keyword, reply_text, reply_type, file_id, filter_type, buttons) 
                 VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(chat_id, keyword) DO UPDATE SET
+                    reply_text = excluded.reply_text,
+                    reply_type = excluded.reply_type,
+                    file_id = excluded.file_id,
+                    filter_type = excluded.filter_type,
+                    buttons = excluded.buttons
                 """,
                 (
                     chat_id,
@@ -1058,7 +1160,7 @@ def add_or_update_filter(chat_id: int, keyword: str, data: dict) -> bool:
                     data.get('reply_type', 'text'),
                     data.get('file_id'),
                     data.get('filter_type', 'keyword'),
-                    json.dumps(data.get('buttons')) if data.get('buttons') else None,
+                    orjson.dumps(data.get('buttons')).decode() if data.get('buttons') else None,
                 )
             )
             return True
@@ -1068,7 +1170,7 @@ def add_or_update_filter(chat_id: int, keyword: str, data: dict) -> bool:
 
 def remove_filter(chat_id: int, keyword: str) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM chat_filters WHERE chat_id = ? AND keyword = ?", (chat_id, keyword.lower()))
             return cursor.rowcount > 0
@@ -1076,35 +1178,47 @@ def remove_filter(chat_id: int, keyword: str) -> bool:
     
 def get_all_filters_for_chat(chat_id: int) -> list[dict]:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
-            conn.row_factory = sqlite3.Row
+        with get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM chat_filters WHERE chat_id = ?", (chat_id,))
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(
+                "SELECT keyword, reply_text, reply_type, file_id, filter_type, buttons FROM chat_filters WHERE chat_id = ?",
+                (chat_id,)
+            )
             return [dict(row) for row in cursor.fetchall()]
     except sqlite3.Error: return []
 
+def get_filter_keywords_for_chat(chat_id: int) -> list[tuple[str, str]]:
+    try:
+        with get_connection() as conn:
+            cursor = conn.execute(
+                "SELECT filter_type, keyword FROM chat_filters WHERE chat_id = ? ORDER BY keyword", (chat_id,)
+            )
+            return cursor.fetchall()
+    except sqlite3.Error: return []
+
 # --- BLACKLIST CHAT ---
 def blacklist_chat(chat_id: int, chat_name: str) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             current_timestamp = datetime.now(timezone.utc).isoformat()
-            conn.execute(
+            cursor = conn.execute(
                 "INSERT OR IGNORE INTO chat_blacklist (chat_id, chat_name, timestamp) VALUES (?, ?, ?)",
                 (chat_id, chat_name, current_timestamp)
             )
-            return conn.total_changes > 0
+            return cursor.rowcount > 0
     except sqlite3.Error: return False
 
 def unblacklist_chat(chat_id: int) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
-            conn.execute("DELETE FROM chat_blacklist WHERE chat_id = ?", (chat_id,))
-            return conn.total_changes > 0
+        with get_connection() as conn:
+            cursor = conn.execute("DELETE FROM chat_blacklist WHERE chat_id = ?", (chat_id,))
+            return cursor.rowcount > 0
     except sqlite3.Error: return False
 
 def is_chat_blacklisted(chat_id: int) -> bool:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT 1 FROM chat_blacklist WHERE chat_id = ?", (chat_id,))
             return cursor.fetchone() is not None
@@ -1112,8 +1226,20 @@ def is_chat_blacklisted(chat_id: int) -> bool:
 
 def get_blacklisted_chats() -> list[tuple[int, str, str]]:
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT chat_id, chat_name, timestamp FROM chat_blacklist ORDER BY timestamp DESC")
             return cursor.fetchall()
     except sqlite3.Error: return []
+
+# --- STATS ---
+STATS_TABLES = (
+    "bot_chats", "chat_blacklist", "users", "dev_users", "sudo_users",
+    "support_users", "whitelist_users", "blacklist", "global_bans",
+)
+STATS_QUERY = "SELECT " + ", ".join(f"(SELECT COUNT(*) FROM {table})" for table in STATS_TABLES)
+
+def get_table_counts() -> dict[str, int]:
+    """Row counts for every /stats table in one query; raises sqlite3.Error."""
+    with get_connection() as conn:
+        return dict(zip(STATS_TABLES, conn.execute(STATS_QUERY).fetchone()))
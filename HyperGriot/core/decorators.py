@@ -4,18 +4,31 @@ from telegram.ext import ContextTypes
 
 from .database import is_command_disabled_in_chat, is_module_disabled
 from ..config import OWNER_ID
-from .utils import _can_user_perform_action
+from .utils import _can_user_perform_action, send_safe_reply, GROUP_CHAT_TYPES
+
+MANAGEABLE_COMMANDS = set()
 
 def check_module_enabled(module_name: str):
     def decorator(func):
         @wraps(func)
         async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
-            user = update.effective_user
-            
-            if user and user.id == OWNER_ID:
-                return await func(update, context, *args, **kwargs)
-
             if is_module_disabled(module_name):
+                user = update.effective_user
+                if not user or user.id != OWNER_ID:
+                    return
+
+            return await func(update, context, *args, **kwargs)
+        return wrapper
+    return decorator
+
+def group_only(failure_message: str):
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
+            chat = update.effective_chat
+            if not chat or chat.type not in GROUP_CHAT_TYPES:
+                if update.message:
+                    await send_safe_reply(update, context, text=failure_message)
                 return
 
             return await func(update, context, *args, **kwargs)
@@ -24,18 +37,16 @@ def check_module_enabled(module_name: str):
 
 def command_control(command_name: str):
     def decorator(func):
-        setattr(func, '_is_manageable', True)
-        setattr(func, '_command_name', command_name)
+        MANAGEABLE_COMMANDS.add(command_name)
         
         @wraps(func)
         async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
             chat = update.effective_chat
 
-            if not chat or chat.type not in ["group", "supergroup"]:
+            if not chat or chat.type not in GROUP_CHAT_TYPES:
                 return await func(update, context, *args, **kwargs)
 
             if is_command_disabled_in_chat(chat.id, command_name):
-                
                 is_admin = await _can_user_perform_action(
                     update, 
                     context, 
@@ -43,10 +54,7 @@ def command_control(command_name: str):
                     failure_message=None,
                     allow_bot_privileged_override=True
                 )
-                
-                if is_admin:
-                    pass
-                else:
+                if not is_admin:
                     return
 
             return await func(update, context, *args, **kwargs)
@@ -2,7 +2,7 @@ from telegram import Update
 from telegram.ext import MessageHandler, ContextTypes, filters
 
 CUSTOM_COMMANDS = {}
-PREFIXES = ['!', '?'] 
+PREFIXES = frozenset({'!', '?'})
 
 def custom_handler(name: str | list[str]):
     def decorator(func):
@@ -20,15 +20,9 @@ async def command_router(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     text = message.text
     
-    used_prefix = None
-    for p in PREFIXES:
-        if text.startswith(p):
-            used_prefix = p
-            break
-    
-    if not used_prefix: return
+    if text[0] not in PREFIXES: return
 
-    command_parts = text[len(used_prefix):].split()
+    command_parts = text[1:].split()
     if not command_parts: return
 
     command = command_parts[0].lower()
@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import html
 import io
 import json
@@ -6,7 +7,7 @@ import logging
 import random
 import re
 import sqlite3
-import subprocess
+import time
 from datetime import timedelta, datetime, timezone
 from typing import List, Tuple
 
@@ -14,18 +15,18 @@ import google.generativeai as genai
 import requests
 import speedtest
 import telegram
-from telegram import Update, User, Chat, constants, ChatPermissions
-from telegram.constants import ParseMode, ChatMemberStatus
+from telegram import Update, User, Chat, ChatMember, constants
+from telegram.constants import ParseMode, ChatMemberStatus, ChatType
 from telegram.error import TelegramError, BadRequest
 from telegram.ext import ContextTypes
 from telethon import TelegramClient
 from telethon.tl.types import User as TelethonUser
 
-from ..config import OWNER_ID, TENOR_API_KEY, GEMINI_API_KEY, LOG_CHAT_ID, ADMIN_LOG_CHAT_ID, DB_NAME
+from ..config import OWNER_ID, TENOR_API_KEY, GEMINI_API_KEY, LOG_CHAT_ID, ADMIN_LOG_CHAT_ID
 from .database import (
-    is_dev_user, is_sudo_user, is_support_user,
+    is_dev_user, get_user_role,
     get_user_from_db_by_id, get_user_from_db_by_username,
-    update_user_in_db
+    update_user_in_db, get_connection
 )
 from .async_utils import aioify
 
@@ -55,6 +56,14 @@ async def check_username_protection(target_mention: str, context: ContextTypes.D
     return is_protected, is_owner_match
 
 # --- THEMED GIFS ---
+TENOR_SEARCH_URL = "https://tenor.googleapis.com/v2/search"
+TENOR_RESULT_LIMIT = 5
+_tenor_session = requests.Session()
+
+@aioify
+def _search_tenor(params: dict) -> requests.Response:
+    return _tenor_session.get(TENOR_SEARCH_URL, params=params, timeout=7)
+
 async def get_themed_gif(context: ContextTypes.DEFAULT_TYPE, search_terms: list[str]) -> str | None:
     if not TENOR_API_KEY: return None
     if not search_terms: logger.warning("No search terms for get_themed_gif."); return None
@@ -62,18 +71,17 @@ async def get_themed_gif(context: ContextTypes.DEFAULT_TYPE, search_terms: list[
     search_term = random.choice(search_terms)
     logger.info(f"Searching Tenor for BEST results: '{search_term}'")
     
-    url = "https://tenor.googleapis.com/v2/search"
     params = { 
         "q": search_term, 
         "key": TENOR_API_KEY, 
         "client_key": "zenthron_project_py", 
-        "limit": 15, 
+        "limit": TENOR_RESULT_LIMIT, 
         "media_filter": "gif", 
         "contentfilter": "high"
     }
     
     try:
-        response = requests.get(url, params=params, timeout=7)
+        response = await _search_tenor(params)
         if response.status_code != 200:
             logger.error(f"Tenor API failed for '{search_term}', status: {response.status_code}")
             try: error_content = response.json(); logger.error(f"Tenor error content: {error_content}")
@@ -84,8 +92,7 @@ async def get_themed_gif(context: ContextTypes.DEFAULT_TYPE, search_terms: list[
         results = data.get("results")
         
         if results:
-            top_gifs = results[:5] 
-            selected_gif = random.choice(top_gifs)
+            selected_gif = random.choice(results)
             
             gif_url = selected_gif.get("media_formats", {}).get("gif", {}).get("url")
             if not gif_url: gif_url = selected_gif.get("media_formats", {}).get("tinygif", {}).get("url")
@@ -97,7 +104,7 @@ async def get_themed_gif(context: ContextTypes.DEFAULT_TYPE, search_terms: list[
                 logger.warning(f"Could not extract GIF URL from Tenor item for '{search_term}'.")
         else: 
             logger.warning(f"No results on Tenor for '{search_term}'.")
-            logger.debug(f"Tenor response (no results): {data}")
+            logger.debug("Tenor response (no results): %s", data)
             
     except requests.exceptions.Timeout: logger.error(f"Timeout fetching GIF from Tenor for '{search_term}'.")
     except requests.exceptions.RequestException as e: logger.error(f"Network/Request error fetching GIF from Tenor: {e}")
@@ -262,28 +269,16 @@ def get_readable_time_delta(delta: timedelta) -> str:
         parts.append(f"{seconds}s")
     return ", ".join(parts) if parts else "0s"
 
+DURATION_PATTERN = re.compile(r"(\d+)([smhdw])?")
+DURATION_UNIT_SECONDS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
 def parse_duration_to_timedelta(duration_str: str | None) -> timedelta | None:
     if not duration_str:
         return None
-    duration_str = duration_str.lower()
-    value = 0
-    unit = None
-    match = re.match(r"(\d+)([smhdw])", duration_str)
-    if match:
-        value = int(match.group(1))
-        unit = match.group(2)
-    else:
-        try:
-            value = int(duration_str)
-            unit = 'm' 
-        except ValueError:
-            return None
-    if unit == 's': return timedelta(seconds=value)
-    elif unit == 'm': return timedelta(minutes=value)
-    elif unit == 'h': return timedelta(hours=value)
-    elif unit == 'd': return timedelta(days=value)
-    elif unit == 'w': return timedelta(weeks=value)
-    return None
+    match = DURATION_PATTERN.match(duration_str.lower())
+    if not match or (match.group(2) is None and match.end() != len(duration_str)):
+        return None
+    return timedelta(seconds=int(match.group(1)) * DURATION_UNIT_SECONDS[match.group(2) or 'm'])
 
 async def _parse_mod_command_args(args: list[str]) -> tuple[str | None, str | None, str | None]:
     target_arg: str | None = None
@@ -329,6 +324,38 @@ async def send_safe_reply(update: Update, context: ContextTypes.DEFAULT_TYPE, te
         else:
             raise e
 
+ADMIN_STATUSES = frozenset({ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER})
+GROUP_CHAT_TYPES = frozenset({ChatType.GROUP, ChatType.SUPERGROUP})
+GROUP_OR_CHANNEL_CHAT_TYPES = GROUP_CHAT_TYPES | {ChatType.CHANNEL}
+SUDO_OR_HIGHER_ROLES = frozenset({"dev", "sudo"})
+
+# --- CHAT ADMINISTRATORS CACHE ---
+CHAT_ADMINS_CACHE_TTL = 300
+_chat_admins_cache: dict[int, tuple[float, tuple[ChatMember, ...]]] = {}
+
+async def get_chat_administrators_cached(context: ContextTypes.DEFAULT_TYPE, chat_id: int) -> tuple[ChatMember, ...]:
+    cached = _chat_admins_cache.get(chat_id)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < CHAT_ADMINS_CACHE_TTL:
+        return cached[1]
+    administrators = await context.bot.get_chat_administrators(chat_id=chat_id)
+    expired_chat_ids = [cached_id for cached_id, (cached_at, _) in _chat_admins_cache.items() if now - cached_at >= CHAT_ADMINS_CACHE_TTL]
+    for expired_chat_id in expired_chat_ids:
+        del _chat_admins_cache[expired_chat_id]
+    _chat_admins_cache[chat_id] = (now, administrators)
+    return administrators
+
+def invalidate_chat_administrators(chat_id: int) -> None:
+    _chat_admins_cache.pop(chat_id, None)
+
+async def invalidate_admins_on_member_change(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Drops the cached admin list when anyone gains, loses or changes an administrator/creator status."""
+    member_update = update.chat_member or update.my_chat_member
+    if not member_update:
+        return
+    if member_update.old_chat_member.status in ADMIN_STATUSES or member_update.new_chat_member.status in ADMIN_STATUSES:
+        invalidate_chat_administrators(member_update.chat.id)
+
 async def _can_user_perform_action(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -339,7 +366,7 @@ async def _can_user_perform_action(
     user = update.effective_user
     chat = update.effective_chat
 
-    if allow_bot_privileged_override and (is_owner_or_dev(user.id) or is_sudo_user(user.id)):
+    if allow_bot_privileged_override and is_sudo_or_higher(user.id):
         return True
 
     try:
@@ -362,7 +389,39 @@ async def _can_user_perform_action(
     return False
 
 # --- LOG ---
+OPERATIONAL_LOG_FLUSH_INTERVAL = 3
+OPERATIONAL_LOG_MAX_LENGTH = 4000
+
 async def send_operational_log(context: ContextTypes.DEFAULT_TYPE, message: str, parse_mode: str = ParseMode.HTML) -> None:
+    """
+    Queues an operational log message. Queued messages are sent together by
+    flush_operational_logs, which runs every OPERATIONAL_LOG_FLUSH_INTERVAL seconds.
+    """
+    context.bot_data.setdefault("operational_log_buffer", []).append((message, parse_mode))
+    if not context.job_queue:
+        await flush_operational_logs(context)
+
+async def flush_operational_logs(context: ContextTypes.DEFAULT_TYPE) -> None:
+    buffer = context.bot_data.get("operational_log_buffer")
+    if not buffer:
+        return
+    pending = buffer[:]
+    buffer.clear()
+
+    batch: list[str] = []
+    batch_length = 0
+    batch_parse_mode = pending[0][1]
+    for message, parse_mode in pending:
+        if batch and (parse_mode != batch_parse_mode or batch_length + len(message) + 2 > OPERATIONAL_LOG_MAX_LENGTH):
+            await _send_operational_log_now(context, "\n\n".join(batch), batch_parse_mode)
+            batch, batch_length = [], 0
+        batch.append(message)
+        batch_length += len(message) + 2
+        batch_parse_mode = parse_mode
+    if batch:
+        await _send_operational_log_now(context, "\n\n".join(batch), batch_parse_mode)
+
+async def _send_operational_log_now(context: ContextTypes.DEFAULT_TYPE, message: str, parse_mode: str = ParseMode.HTML) -> None:
     """
     Sends an operational log message to LOG_CHAT_ID if configured,
     otherwise falls back to OWNER_ID.
@@ -413,20 +472,13 @@ async def send_critical_log(context: ContextTypes.DEFAULT_TYPE, message: str, pa
 
 # --- PERMISSIONS ---
 def is_owner_or_dev(user_id: int) -> bool:
-    if user_id == OWNER_ID:
-        return True
-    return is_dev_user(user_id)
+    return user_id == OWNER_ID or is_dev_user(user_id)
 
 def is_privileged_user(user_id: int) -> bool:
-    if user_id == OWNER_ID:
-        return True
-    if is_dev_user(user_id):
-        return True
-    if is_sudo_user(user_id):
-        return True
-    if is_support_user(user_id):
-        return True
-    return False
+    return user_id == OWNER_ID or get_user_role(user_id) is not None
+
+def is_sudo_or_higher(user_id: int) -> bool:
+    return user_id == OWNER_ID or get_user_role(user_id) in SUDO_OR_HIGHER_ROLES
 
 # --- TEXT FORMATING ---
 async def format_message_text(text: str, user: User, chat: Chat, context: ContextTypes.DEFAULT_TYPE) -> str:
@@ -461,13 +513,18 @@ async def format_message_text(text: str, user: User, chat: Chat, context: Contex
     return text
 
 # --- AI ---
+GEMINI_MODEL_NAME = 'gemini-2.5-flash-preview-05-20'
+
+@functools.cache
+def _get_gemini_model() -> "genai.GenerativeModel":
+    genai.configure(api_key=GEMINI_API_KEY)
+    return genai.GenerativeModel(GEMINI_MODEL_NAME)
+
 async def get_gemini_response(prompt: str) -> str:
     if not GEMINI_API_KEY:
         return "AI features are not configured by the bot owner."
     try:
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel('gemini-2.5-flash-preview-05-20')
-        response = await model.generate_content_async(prompt)
+        response = await _get_gemini_model().generate_content_async(prompt)
         return response.text
     except Exception as e:
         logger.error(f"Error communicating with Gemini AI: {e}", exc_info=True)
@@ -510,7 +567,7 @@ async def propagate_unban(context: ContextTypes.DEFAULT_TYPE) -> None:
 
     chats_to_scan = []
     try:
-        with sqlite3.connect(DB_NAME) as conn:
+        with get_connection() as conn:
             cursor = conn.cursor()
             chats_to_scan = [row[0] for row in cursor.execute("SELECT chat_id FROM bot_chats")]
     except sqlite3.Error as e:
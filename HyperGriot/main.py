@@ -1,23 +1,37 @@
 # Main Bot file
 import asyncio
+import atexit
+import contextlib
+import functools
 import logging
+import logging.handlers
 import os
 import io
+import queue
+import signal
+import tempfile
+import time
 import importlib
 import traceback
 import json
 import html
+import httpx
+import urllib.parse
+import orjson
 from datetime import datetime, timezone, timedelta
 from telegram import Update, constants
 from telegram.constants import ParseMode, UpdateType
-from telegram.ext import Application, ApplicationBuilder, JobQueue, ContextTypes, MessageHandler, filters, ApplicationHandlerStop, ChatMemberHandler, CommandHandler
+from telegram.ext import AIORateLimiter, Application, ApplicationBuilder, BaseUpdateProcessor, JobQueue, ContextTypes, MessageHandler, filters, ApplicationHandlerStop, ChatMemberHandler, CommandHandler, CallbackQueryHandler
+from telegram.error import BadRequest, NetworkError
 from telegram.request import HTTPXRequest
 from telethon import TelegramClient
 
-from .config import SESSION_NAME, API_ID, API_HASH, LOG_CHAT_ID, OWNER_ID, BOT_TOKEN, ADMIN_LOG_CHAT_ID, DB_NAME
-from .core.database import init_db, disable_module, enable_module, get_disabled_modules
-from .core.utils import is_owner_or_dev, safe_escape, send_critical_log
+from .config import SESSION_NAME, API_ID, API_HASH, LOG_CHAT_ID, OWNER_ID, BOT_TOKEN, ADMIN_LOG_CHAT_ID, WEBHOOK_URL, WEBHOOK_LISTEN, WEBHOOK_PORT, WEBHOOK_SECRET_TOKEN
+from .core.database import init_db, disable_module, enable_module, get_disabled_modules, backup_database, take_pending_user_updates, write_user_updates
+from .core.utils import is_owner_or_dev, safe_escape, send_critical_log, flush_operational_logs, invalidate_admins_on_member_change, OPERATIONAL_LOG_FLUSH_INTERVAL
 from .core.handlers import get_custom_command_handler, custom_handler
+from .core.async_utils import aioify
+from .core.decorators import MANAGEABLE_COMMANDS
 
 from .modules.chatblacklists import check_blacklisted_chat_on_join
 from .modules.mutes import handle_bot_permission_changes
@@ -31,15 +45,123 @@ from .modules.welcomes import handle_new_group_members, handle_left_group_member
 from .modules.joinfilters import check_new_member
 from .modules.filters import check_message_for_filters
 
-logging.basicConfig(
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO
-)
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves message and traceback formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class TimedMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes on the first record arriving flush_interval seconds after the previous flush."""
+
+    def __init__(self, *args, flush_interval: float, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        return super().shouldFlush(record) or time.monotonic() - self._last_flush >= self.flush_interval
+
+    def flush(self) -> None:
+        super().flush()
+        self._last_flush = time.monotonic()
+
+
+class FlushingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers whenever the queue stays empty for flush_interval seconds."""
+
+    def __init__(self, *args, flush_interval: float, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.flush_interval = flush_interval
+
+    def dequeue(self, block: bool):
+        while True:
+            try:
+                return self.queue.get(block, timeout=self.flush_interval)
+            except queue.Empty:
+                if not block:
+                    raise
+                for handler in self.handlers:
+                    handler.flush()
+
+
+LOG_BUFFER_FLUSH_INTERVAL = 5
+
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+log_buffer_handler = TimedMemoryHandler(capacity=256, flushLevel=logging.WARNING, target=_log_stream_handler, flush_interval=LOG_BUFFER_FLUSH_INTERVAL)
+log_queue = queue.SimpleQueue()
+log_listener = FlushingQueueListener(log_queue, log_buffer_handler, respect_handler_level=True, flush_interval=LOG_BUFFER_FLUSH_INTERVAL)
+_log_queue_handler = DeferredQueueHandler(log_queue)
+logging.basicConfig(level=logging.INFO, handlers=[_log_queue_handler])
 logging.getLogger("httpx").setLevel(logging.WARNING)
 logging.getLogger("telegram.vendor.ptb_urllib3.urllib3").setLevel(logging.WARNING)
 logging.getLogger("httpcore").setLevel(logging.WARNING)
 logging.getLogger('telethon').setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
+
+class OrjsonHTTPXRequest(HTTPXRequest):
+    """HTTPXRequest that decodes Bot API responses with orjson."""
+
+    __slots__ = ()
+
+    @staticmethod
+    def parse_json_payload(payload: bytes) -> dict:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            return HTTPXRequest.parse_json_payload(payload)
+
+class ChatOrderedUpdateProcessor(BaseUpdateProcessor):
+    """Processes updates from different chats concurrently while keeping each chat's updates in arrival order.
+
+    A concurrency slot is only taken once the chat's lock is held, so updates queued behind a
+    busy chat never occupy slots that other chats could use.
+    """
+
+    __slots__ = ("_chat_locks", "_chat_waiters", "_update_slots")
+
+    def __init__(self, max_concurrent_updates: int):
+        super().__init__(max_concurrent_updates)
+        self._chat_locks: dict[int, asyncio.Lock] = {}
+        self._chat_waiters: dict[int, int] = {}
+        self._update_slots = asyncio.BoundedSemaphore(max_concurrent_updates)
+
+    async def process_update(self, update: object, coroutine) -> None:
+        chat = update.effective_chat if isinstance(update, Update) else None
+        if chat is None:
+            async with self._update_slots:
+                await coroutine
+            return
+
+        chat_id = chat.id
+        lock = self._chat_locks.get(chat_id)
+        if lock is None:
+            lock = self._chat_locks[chat_id] = asyncio.Lock()
+        self._chat_waiters[chat_id] = self._chat_waiters.get(chat_id, 0) + 1
+        try:
+            async with lock:
+                async with self._update_slots:
+                    await coroutine
+        finally:
+            remaining = self._chat_waiters[chat_id] - 1
+            if remaining:
+                self._chat_waiters[chat_id] = remaining
+            else:
+                del self._chat_waiters[chat_id]
+                del self._chat_locks[chat_id]
+
+    async def do_process_update(self, update: object, coroutine) -> None:
+        await coroutine
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
 async def send_startup_log(context: ContextTypes.DEFAULT_TYPE) -> None:
     startup_message_text = "<i>I'm already up!</i>"
     target_id_for_log = ADMIN_LOG_CHAT_ID or LOG_CHAT_ID or OWNER_ID
@@ -61,49 +183,75 @@ async def ignore_edited_commands(update: Update, context: ContextTypes.DEFAULT_T
     logger.info(f"Ignoring edited command: {update.edited_message.text}")
     raise ApplicationHandlerStop
 
-def discover_and_register_handlers(application: Application):
-    manageable_commands = set()
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    modules_dir = os.path.join(base_path, "modules")
+@functools.cache
+def _scan_module_names() -> tuple[str, ...]:
+    modules_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "modules")
+    with os.scandir(modules_dir) as entries:
+        return tuple(sorted(
+            entry.name[:-3] for entry in entries
+            if entry.name.endswith(".py") and not entry.name.startswith("_") and entry.is_file(follow_symlinks=False)
+        ))
+
+@functools.cache
+def _available_module_set() -> frozenset[str]:
+    return frozenset(_scan_module_names())
+
+@functools.cache
+def _available_modules_text() -> str:
+    return ", ".join(_scan_module_names())
+
+def _import_handler_module(module_name: str):
+    return importlib.import_module(f".modules.{module_name}", __package__)
+
+async def discover_and_register_handlers(application: Application):
+    module_names = _scan_module_names()
+    imported_modules = await asyncio.gather(
+        *(asyncio.to_thread(_import_handler_module, module_name) for module_name in module_names),
+        return_exceptions=True
+    )
 
-    for filename in sorted(os.listdir(modules_dir)):
-        if filename.endswith(".py") and not filename.startswith("_"):
-            module_name = filename[:-3]
-            try:
-                module = importlib.import_module(f"ZenthronBot.modules.{module_name}")
-                
-                if hasattr(module, "load_handlers"):
-                    module.load_handlers(application)
-                    logger.info(f"Successfully loaded module: {module_name}")
-                
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if callable(attr) and hasattr(attr, '_is_manageable'):
-                        command_name = getattr(attr, '_command_name')
-                        manageable_commands.add(command_name)
-                        
-            except Exception as e:
-                logger.error(f"Error processing module {module_name}: {e}")
-                traceback.print_exc()
+    for module_name, module in zip(module_names, imported_modules):
+        if isinstance(module, BaseException):
+            logger.error(f"Error processing module {module_name}: {module}")
+            traceback.print_exception(module)
+            continue
+        try:
+            if hasattr(module, "load_handlers"):
+                module.load_handlers(application)
+                logger.info(f"Successfully loaded module: {module_name}")
+                    
+        except Exception as e:
+            logger.error(f"Error processing module {module_name}: {e}")
+            traceback.print_exc()
     
+    manageable_commands = set(MANAGEABLE_COMMANDS)
     application.bot_data["manageable_commands"] = manageable_commands
     if manageable_commands:
         logger.info(f"Registered manageable commands: {sorted(list(manageable_commands))}")
     else:
         logger.info("No manageable commands found.")
 
+def _get_allowed_updates(application: Application) -> list[str]:
+    allowed_updates = set()
+    for handlers in application.handlers.values():
+        for handler in handlers:
+            if isinstance(handler, CallbackQueryHandler):
+                allowed_updates.add(Update.CALLBACK_QUERY)
+            elif isinstance(handler, ChatMemberHandler):
+                if handler.chat_member_types in (ChatMemberHandler.MY_CHAT_MEMBER, ChatMemberHandler.ANY_CHAT_MEMBER):
+                    allowed_updates.add(Update.MY_CHAT_MEMBER)
+                if handler.chat_member_types in (ChatMemberHandler.CHAT_MEMBER, ChatMemberHandler.ANY_CHAT_MEMBER):
+                    allowed_updates.add(Update.CHAT_MEMBER)
+            elif isinstance(handler, (MessageHandler, CommandHandler)):
+                allowed_updates.update((Update.MESSAGE, Update.EDITED_MESSAGE, Update.CHANNEL_POST, Update.EDITED_CHANNEL_POST))
+            else:
+                logger.warning(f"Unknown handler type {type(handler).__name__}, subscribing to all update types.")
+                return Update.ALL_TYPES
+    return sorted(allowed_updates)
+
 def _get_available_modules():
     try:
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        modules_dir = os.path.join(base_path, "modules")
-        
-        all_files = os.listdir(modules_dir)
-        
-        modules = [
-            f[:-3] for f in all_files 
-            if f.endswith('.py') and not f.startswith('_')
-        ]
-        return sorted(modules)
+        return _scan_module_names()
     except Exception as e:
         logger.error(f"Could not scan for available modules: {e}")
         return []
@@ -116,11 +264,10 @@ async def disable_module_command(update: Update, context: ContextTypes.DEFAULT_T
         logger.warning(f"Unauthorized /disablemodule attempt by user {user.id}.")
         return
 
-    available_modules = _get_available_modules()
-    if not context.args or context.args[0] not in available_modules:
+    if not context.args or context.args[0] not in _available_module_set():
         await update.message.reply_html(
             f"<b>Usage:</b> /disablemodule &lt;module name&gt;\n"
-            f"<b>Available:</b> <code>{', '.join(available_modules)}</code>"
+            f"<b>Available:</b> <code>{_available_modules_text()}</code>"
         )
         return
 
@@ -156,15 +303,17 @@ async def list_modules_command(update: Update, context: ContextTypes.DEFAULT_TYP
         logger.warning(f"Unauthorized /listmodules attempt by user {user.id}.")
         return
         
-    disabled_modules = get_disabled_modules()
+    disabled_modules = set(get_disabled_modules())
     available_modules = _get_available_modules()
     
-    message = "<b>Module Status:</b>\n\n"
+    message_parts = ["<b>Module Status:</b>\n\n"]
     for module in available_modules:
         status = "🔴 Disabled" if module in disabled_modules else "🟢 Enabled"
-        message += f"• <code>{module}</code>: {status}\n"
+        message_parts.append(f"• <code>{module}</code>: {status}\n")
         
-    await update.message.reply_html(message)
+    await update.message.reply_html("".join(message_parts))
+
+backup_database_async = aioify(backup_database)
 
 @custom_handler("backupdb")
 async def backup_db_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -177,26 +326,40 @@ async def backup_db_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
     message = await update.message.reply_text("Performing backup and sending the file...")
 
     try:
-        await context.bot.send_document(
-            chat_id=OWNER_ID,
-            document=open(DB_NAME, 'rb'),
-            filename="zenthron_data_backup.db",
-            caption=f"Here is backuped database."
-        )
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            snapshot_path = os.path.join(snapshot_dir, "backup.db")
+            await backup_database_async(snapshot_path)
+            with open(snapshot_path, 'rb') as db_file:
+                await context.bot.send_document(
+                    chat_id=OWNER_ID,
+                    document=db_file,
+                    filename="zenthron_data_backup.db",
+                    caption=f"Here is backuped database."
+                )
         await message.edit_text("✅ Backup has been successfully sent to you in a private message.")
     
-    except FileNotFoundError:
-        logger.error(f"Database file not found at: {DB_NAME}")
-        await message.edit_text("❌ Error: Database file not found.")
     except Exception as e:
         logger.error(f"Failed to send database backup: {e}")
         await message.edit_text(f"❌ An error occurred while sending the backup: {e}")
 
-async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> None:
-    logger.error("Exception while handling an update:", exc_info=context.error)
+ERROR_REPORT_COOLDOWN = 60
+_last_error_reports: dict[str, float] = {}
 
+async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> None:
     tb_list = traceback.format_exception(None, context.error, context.error.__traceback__)
     tb_string = "".join(tb_list)
+    logger.error(f"Exception while handling an update:\n{tb_string}")
+
+    if isinstance(context.error, NetworkError) and not isinstance(context.error, BadRequest):
+        return
+
+    error_key = f"{type(context.error).__name__}: {context.error}"
+    now = time.monotonic()
+    if now - _last_error_reports.get(error_key, float("-inf")) < ERROR_REPORT_COOLDOWN:
+        return
+    if len(_last_error_reports) >= 256:
+        _last_error_reports.clear()
+    _last_error_reports[error_key] = now
 
     update_str = update.to_dict() if isinstance(update, Update) else str(update)
     pretty_update_str = json.dumps(update_str, indent=2, ensure_ascii=False)
@@ -243,27 +406,55 @@ async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> N
             logger.critical(f"CRITICAL: Could not send error log with file to {target_id}: {e}")
             await send_critical_log(context, short_message)
 
+OWNER_FILTER = filters.User(user_id=OWNER_ID)
+
+MAIN_COMMANDS = (
+    ("disablemodule", disable_module_command, OWNER_FILTER),
+    ("enablemodule", enable_module_command, OWNER_FILTER),
+    ("listmodules", list_modules_command, None),
+    ("backupdb", backup_db_command, OWNER_FILTER),
+)
+
+CONCURRENT_UPDATES = 64
+LONG_POLL_TIMEOUT = 50
+RATE_LIMIT_MAX_RETRIES = 3
+HTTP_CONNECTION_POOL_SIZE = 256
+HTTP_KEEPALIVE_EXPIRY = 75.0
+WEBHOOK_MAX_CONNECTIONS = 100
+
 async def main() -> None:
     init_db()
 
-    async with TelegramClient(SESSION_NAME, API_ID, API_HASH) as telethon_client:
+    async with TelegramClient(SESSION_NAME, API_ID, API_HASH, receive_updates=False) as telethon_client:
         logger.info("Telethon client started.")
 
-        custom_request_settings = HTTPXRequest(connect_timeout=20.0, read_timeout=80.0, write_timeout=80.0, pool_timeout=20.0)
+        custom_request_settings = OrjsonHTTPXRequest(
+            connection_pool_size=HTTP_CONNECTION_POOL_SIZE, http_version="2", connect_timeout=20.0, read_timeout=80.0, write_timeout=80.0, pool_timeout=20.0,
+            httpx_kwargs={"limits": httpx.Limits(
+                max_connections=HTTP_CONNECTION_POOL_SIZE,
+                max_keepalive_connections=HTTP_CONNECTION_POOL_SIZE,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+            )}
+        )
+        get_updates_request_settings = OrjsonHTTPXRequest(http_version="2", connect_timeout=20.0, read_timeout=80.0, write_timeout=80.0, pool_timeout=20.0)
         
         application = (
             ApplicationBuilder()
             .token(BOT_TOKEN)
             .request(custom_request_settings)
+            .get_updates_request(get_updates_request_settings)
+            .concurrent_updates(ChatOrderedUpdateProcessor(CONCURRENT_UPDATES))
+            .rate_limiter(AIORateLimiter(max_retries=RATE_LIMIT_MAX_RETRIES))
             .job_queue(JobQueue())
             .build()
         )
 
         # --- GLOBAL LAYER: TRACEBACKS - MODULE LOADER ---
         application.add_error_handler(error_handler)
-        discover_and_register_handlers(application)
+        await discover_and_register_handlers(application)
 
         # --- LAYER 1: TOP PRIORITY - SECURITY AND IGNORANCE ---
+        application.add_handler(ChatMemberHandler(invalidate_admins_on_member_change, ChatMemberHandler.ANY_CHAT_MEMBER), group=-250)
         application.add_handler(ChatMemberHandler(check_blacklisted_chat_on_join, ChatMemberHandler.MY_CHAT_MEMBER), group=-200)
         application.add_handler(ChatMemberHandler(handle_bot_permission_changes, ChatMemberHandler.MY_CHAT_MEMBER), group=-100)
         application.add_handler(ChatMemberHandler(handle_bot_banned, ChatMemberHandler.MY_CHAT_MEMBER), group=-100)
@@ -293,10 +484,7 @@ async def main() -> None:
         application.add_handler(MessageHandler(filters.ALL & (~filters.UpdateType.EDITED_MESSAGE), log_user_from_interaction), group=10)
 
         # --- LAYER 7: COMMANDS - HANDLERS ---
-        application.add_handler(CommandHandler("disablemodule", disable_module_command))
-        application.add_handler(CommandHandler("enablemodule", enable_module_command))
-        application.add_handler(CommandHandler("listmodules", list_modules_command))
-        application.add_handler(CommandHandler("backupdb", backup_db_command))
+        application.add_handlers([CommandHandler(name, callback, filters=command_filter) for name, callback, command_filter in MAIN_COMMANDS])
 
         application.bot_data["telethon_client"] = telethon_client
         logger.info("Telethon client has been injected into bot_data.")
@@ -304,24 +492,58 @@ async def main() -> None:
         if application.job_queue:
             application.job_queue.run_once(send_startup_log, when=1)
             logger.info("Startup message job scheduled to run in 1 second.")
+            application.job_queue.run_repeating(flush_operational_logs, interval=OPERATIONAL_LOG_FLUSH_INTERVAL, first=OPERATIONAL_LOG_FLUSH_INTERVAL)
         else:
             logger.warning("JobQueue not available, cannot schedule startup message.")
 
-        logger.info(f"Bot starting polling... Owner ID: {OWNER_ID}")
+        logger.info(f"Bot starting {'webhook' if WEBHOOK_URL else 'polling'}... Owner ID: {OWNER_ID}")
         
         await application.initialize()
         await application.start()
-        await application.updater.start_polling(allowed_updates=Update.ALL_TYPES)
-        await telethon_client.run_until_disconnected()
-
-        await application.updater.stop()
-        await application.stop()
-        logger.info("Bot shutdown process completed.")
+        try:
+            with contextlib.suppress(NotImplementedError):
+                asyncio.get_running_loop().add_signal_handler(
+                    signal.SIGTERM, lambda: asyncio.ensure_future(telethon_client.disconnect())
+                )
+            allowed_updates = _get_allowed_updates(application)
+            if WEBHOOK_URL:
+                logger.info(f"Receiving update types via webhook: {allowed_updates}")
+                await application.updater.start_webhook(
+                    listen=WEBHOOK_LISTEN,
+                    port=WEBHOOK_PORT,
+                    url_path=urllib.parse.urlsplit(WEBHOOK_URL).path.lstrip("/"),
+                    webhook_url=WEBHOOK_URL,
+                    allowed_updates=allowed_updates,
+                    max_connections=WEBHOOK_MAX_CONNECTIONS,
+                    secret_token=WEBHOOK_SECRET_TOKEN
+                )
+            else:
+                logger.info(f"Polling for update types: {allowed_updates}")
+                await application.updater.start_polling(timeout=LONG_POLL_TIMEOUT, allowed_updates=allowed_updates)
+            await telethon_client.run_until_disconnected()
+        finally:
+            if application.updater.running:
+                await application.updater.stop()
+            await flush_operational_logs(ContextTypes.DEFAULT_TYPE(application))
+            write_user_updates(take_pending_user_updates())
+            await application.stop()
+            await application.shutdown()
+            logger.info("Bot shutdown process completed.")
 
 
 if __name__ == "__main__":
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+    try:
+        import uvloop
+        run = uvloop.run
+        logger.info("Using uvloop event loop.")
+    except ImportError:
+        run = asyncio.run
+
     try:
-        asyncio.run(main())
+        run(main())
     except (KeyboardInterrupt, SystemExit):
         logger.info("Bot stopped by user.")
     except Exception as e:
@@ -1,14 +1,15 @@
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from telegram import Update, User, Chat
-from telegram.constants import ChatType, ChatMemberStatus, ParseMode
+from telegram.constants import ChatMemberStatus, ParseMode
 from telegram.error import TelegramError
 from telegram.ext import Application, CommandHandler, ContextTypes, ChatMemberHandler
 
 from ..core.database import remove_chat_from_db
-from ..core.utils import _can_user_perform_action, resolve_user_with_telethon, parse_duration_to_timedelta, create_user_html_link, send_safe_reply, safe_escape, is_entity_a_user
-from ..core.decorators import check_module_enabled
+from ..core.utils import _can_user_perform_action, resolve_user_with_telethon, parse_duration_to_timedelta, create_user_html_link, send_safe_reply, safe_escape, is_entity_a_user, ADMIN_STATUSES
+from ..core.decorators import check_module_enabled, group_only
 from ..core.handlers import custom_handler
+from ..core.constants import MISSING_PERMISSION_TEXTS
 
 logger = logging.getLogger(__name__)
 
@@ -16,17 +17,14 @@ logger = logging.getLogger(__name__)
 # --- BAN COMMAND FUNCTIONS ---
 @check_module_enabled("bans")
 @custom_handler("ban")
+@group_only("Huh? You can't ban in private chat...")
 async def ban_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     chat = update.effective_chat
     user_who_bans = update.effective_user
     message = update.message
     if not message: return
 
-    if chat.type == ChatType.PRIVATE:
-        await send_safe_reply(update, context, text="Huh? You can't ban in private chat...")
-        return
-
-    if not await _can_user_perform_action(update, context, 'can_restrict_members', "Why should I listen to a person with no privileges for this? You need 'can_restrict_members' permission."):
+    if not await _can_user_perform_action(update, context, 'can_restrict_members', MISSING_PERMISSION_TEXTS['can_restrict_members']):
         return
 
     target_entity: User | Chat | None = None
@@ -58,17 +56,17 @@ async def ban_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         return        
 
     duration_str: str | None = None
+    duration_td: timedelta | None = None
     reason: str = "No reason provided."
     if args_after_target:
-        potential_duration_td = parse_duration_to_timedelta(args_after_target[0])
-        if potential_duration_td:
+        duration_td = parse_duration_to_timedelta(args_after_target[0])
+        if duration_td:
             duration_str = args_after_target[0]
             reason = " ".join(args_after_target[1:]) if len(args_after_target) > 1 else reason
         else:
             reason = " ".join(args_after_target)
     if not reason.strip(): reason = "No reason provided."
 
-    duration_td = parse_duration_to_timedelta(duration_str)
     until_date_for_api = datetime.now(timezone.utc) + duration_td if duration_td else None
 
 
@@ -81,7 +79,7 @@ async def ban_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
     if is_entity_a_user(target_entity):
         try:
             member = await context.bot.get_chat_member(chat.id, target_entity.id)
-            if member.status in [ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER]:
+            if member.status in ADMIN_STATUSES:
                 await send_safe_reply(update, context, text="Chat Creator and Administrators cannot be banned.")
                 return
         except TelegramError: pass
@@ -119,18 +117,15 @@ async def ban_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
 
 @check_module_enabled("bans")
 @custom_handler("dban")
+@group_only("Huh? You can't dban in private chat...")
 async def dban_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     chat = update.effective_chat
     user_who_bans = update.effective_user
     message = update.message
     if not message: return
 
-    if chat.type == ChatType.PRIVATE:
-        await send_safe_reply(update, context, text="Huh? You can't dban in private chat...")
-        return
-
-    can_ban = await _can_user_perform_action(update, context, 'can_restrict_members', "Why should I listen to a person with no privileges for this? You need 'can_restrict_members' permission.")
-    can_del = await _can_user_perform_action(update, context, 'can_delete_messages', "Why should I listen to a person with no privileges for this? You need 'can_delete_messages' permission.")
+    can_ban = await _can_user_perform_action(update, context, 'can_restrict_members', MISSING_PERMISSION_TEXTS['can_restrict_members'])
+    can_del = await _can_user_perform_action(update, context, 'can_delete_messages', MISSING_PERMISSION_TEXTS['can_delete_messages'])
     if not (can_ban and can_del):
         return
 
@@ -150,7 +145,7 @@ async def dban_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     if is_entity_a_user(target_entity):
         try:
             member = await chat.get_member(target_entity.id)
-            if member.status in [ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER]:
+            if member.status in ADMIN_STATUSES:
                 await send_safe_reply(update, context, text="Chat Creator and Administrators cannot be banned.")
                 return
         except TelegramError: pass
@@ -181,17 +176,14 @@ async def dban_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
 @check_module_enabled("bans")
 @custom_handler("tban")
+@group_only("Huh? You can't use this command in a private chat...")
 async def tban_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     chat = update.effective_chat
     user_who_bans = update.effective_user
     message = update.message
     if not message: return
 
-    if chat.type == ChatType.PRIVATE:
-        await send_safe_reply(update, context, text="Huh? You can't use this command in a private chat...")
-        return
-
-    if not await _can_user_perform_action(update, context, 'can_restrict_members', "Why should I listen to a person with no privileges for this? You need 'can_restrict_members' permission."):
+    if not await _can_user_perform_action(update, context, 'can_restrict_members', MISSING_PERMISSION_TEXTS['can_restrict_members']):
         return
 
     target_entity: User | Chat | None = None
@@ -246,7 +238,7 @@ async def tban_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
     try:
         member = await context.bot.get_chat_member(chat.id, target_entity.id)
-        if member.status in [ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER]:
+        if member.status in ADMIN_STATUSES:
             await send_safe_reply(update, context, text="Chat admins and creators cannot be banned.")
             return
     except TelegramError: pass
@@ -266,16 +258,13 @@ async def tban_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
 @check_module_enabled("bans")
 @custom_handler("unban")
+@group_only("Huh? You can't unban in private chat...")
 async def unban_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     chat = update.effective_chat
     message = update.message
     if not message: return
 
-    if chat.type == ChatType.PRIVATE:
-        await send_safe_reply(update, context, text="Huh? You can't unban in private chat...")
-        return
-
-    if not await _can_user_perform_action(update, context, 'can_restrict_members', "Why should I listen to a person with no privileges for this? You need 'can_restrict_members' permission."):
+    if not await _can_user_perform_action(update, context, 'can_restrict_members', MISSING_PERMISSION_TEXTS['can_restrict_members']):
         return
 
     target_entity: User | Chat | None = None
@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from datetime import datetime, timezone, timedelta
 from telegram import Update, User, Chat
@@ -6,13 +5,16 @@ from telegram.constants import ParseMode, ChatType
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes, ApplicationHandlerStop
 
 from ..config import OWNER_ID, APPEAL_CHAT_ID
-from ..core.database import add_to_blacklist, remove_from_blacklist, get_blacklist_reason, is_user_blacklisted, is_whitelisted, is_sudo_user 
-from ..core.utils import is_privileged_user, is_owner_or_dev, resolve_user_with_telethon, create_user_html_link, safe_escape, send_operational_log, is_entity_a_user
+from ..core.database import add_to_blacklist, remove_from_blacklist, get_blacklist_reason, is_user_blacklisted, is_whitelisted
+from ..core.utils import is_privileged_user, is_sudo_or_higher, resolve_user_with_telethon, create_user_html_link, safe_escape, send_operational_log, is_entity_a_user
 from ..core.decorators import check_module_enabled
 from ..core.handlers import custom_handler
 
 logger = logging.getLogger(__name__)
 
+ALWAYS_ALLOWED_COMMANDS = frozenset({'/start', '/help', '/info', '/rules', '/warns', '/warnings'})
+APPEAL_CHAT_ALLOWED_COMMANDS = frozenset({'/id'})
+
 
 # --- BLACKLIST COMMAND AND HANDLER FUNCTIONS ---
 @check_module_enabled("blacklists")
@@ -22,7 +24,7 @@ async def blacklist_user_command(update: Update, context: ContextTypes.DEFAULT_T
     message = update.message
     if not message: return
     
-    if not (is_owner_or_dev(user.id) or is_sudo_user(user.id)):
+    if not is_sudo_or_higher(user.id):
         logger.warning(f"Unauthorized /blist attempt by user {user.id}.")
         return
 
@@ -80,7 +82,6 @@ async def blacklist_user_command(update: Update, context: ContextTypes.DEFAULT_T
 
     prepare_message = f"Ok!"
     await message.reply_html(prepare_message)
-    await asyncio.sleep(1.0)
 
     if add_to_blacklist(target_entity.id, user.id, reason):
         success_message = f"✅ Done! {user_display} [<code>{target_entity.id}</code>] has been <b>blacklisted</b>.\n<b>Reason:</b> {safe_escape(reason)}"
@@ -108,7 +109,7 @@ async def blacklist_user_command(update: Update, context: ContextTypes.DEFAULT_T
 async def unblacklist_user_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     user = update.effective_user
     message = update.message
-    if not (is_owner_or_dev(user.id) or is_sudo_user(user.id)):
+    if not is_sudo_or_higher(user.id):
         logger.warning(f"Unauthorized /unblist attempt by user {user.id}.")
         return
 
@@ -147,7 +148,6 @@ async def unblacklist_user_command(update: Update, context: ContextTypes.DEFAULT
 
     prepare_message = f"Let’s give him next chance!"
     await message.reply_html(prepare_message)
-    await asyncio.sleep(1.0)
 
     if remove_from_blacklist(target_entity.id):
         success_message = f"✅ Done! {user_display} [<code>{target_entity.id}</code>] has been <b>unblacklisted</b>."
@@ -185,24 +185,20 @@ async def check_blacklist_handler(update: Update, context: ContextTypes.DEFAULT_
     if not is_user_blacklisted(user.id):
         return
 
-    always_allowed_commands = ['/start', '/help', '/info', '/rules', '/warns', '/warnings']
-    appeal_chat_allowed_commands = ['/id']
-
     is_in_appeal_chat = (chat.id == APPEAL_CHAT_ID)
 
-    command = message.text.split()[0].lower()
+    command = message.text.split(None, 1)[0].lower()
 
-    if command in always_allowed_commands:
+    if command in ALWAYS_ALLOWED_COMMANDS:
         return
     
-    if is_in_appeal_chat and command in appeal_chat_allowed_commands:
-        logger.info(f"Allowing command '{command}' for blacklisted user {user.id} in appeal chat.")
+    if is_in_appeal_chat and command in APPEAL_CHAT_ALLOWED_COMMANDS:
+        logger.info("Allowing command '%s' for blacklisted user %s in appeal chat.", command, user.id)
         return
 
-    user_mention_log = f"@{user.username}" if user.username else str(user.id)
-    message_text_preview = message.text[:50]
-    
-    logger.info(f"User {user.id} ({user_mention_log}) is blacklisted. Blocking command: '{message_text_preview}'")
+    if logger.isEnabledFor(logging.INFO):
+        user_mention_log = f"@{user.username}" if user.username else str(user.id)
+        logger.info("User %s (%s) is blacklisted. Blocking command: '%s'", user.id, user_mention_log, message.text[:50])
     
     raise ApplicationHandlerStop
 
@@ -2,11 +2,10 @@ import logging
 import io
 import re
 from telegram import Update
-from telegram.constants import ChatType
 from telegram.error import TelegramError
 from telegram.ext import Application, CommandHandler, ContextTypes
 
-from ..core.utils import safe_escape
+from ..core.utils import safe_escape, get_chat_administrators_cached, GROUP_OR_CHANNEL_CHAT_TYPES
 from ..core.decorators import check_module_enabled, command_control
 from ..core.handlers import custom_handler
 
@@ -20,12 +19,12 @@ logger = logging.getLogger(__name__)
 async def list_admins_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     chat = update.effective_chat
 
-    if chat.type not in [ChatType.GROUP, ChatType.SUPERGROUP, ChatType.CHANNEL]:
+    if chat.type not in GROUP_OR_CHANNEL_CHAT_TYPES:
         await update.message.reply_text("Huh? This command can only be used in chats.")
         return
 
     try:
-        administrators = await context.bot.get_chat_administrators(chat_id=chat.id)
+        administrators = await get_chat_administrators_cached(context, chat.id)
     except TelegramError as e:
         logger.error(f"Failed to get admin list for chat {chat.id} ('{chat.title}'): {e}")
         await update.message.reply_text(f"Skrrrt... Some supernatural force is preventing me from getting a list of administrators for this chat. Reason: {safe_escape(str(e))}")
@@ -82,7 +81,6 @@ async def list_admins_command(update: Update, context: ContextTypes.DEFAULT_TYPE
     if len(message_text) > 4090:
         logger.info(f"Admin list for chat {chat.id} is too long, attempting to send as a file.")
         try:
-            import io
             file_content = "\n".join(response_lines).replace("<b>", "").replace("</b>", "").replace("<code>", "").replace("</code>", "").replace("<i>", "").replace("</i>", "")
             file_content = file_content.replace("</a>", "").replace("✨", "").replace("🛡️", "")
             file_content = re.sub(r'<a href="[^"]*">', '', file_content)
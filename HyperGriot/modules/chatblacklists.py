@@ -1,3 +1,4 @@
+import io
 import logging
 from datetime import datetime, timezone
 from telegram import Update
@@ -104,14 +105,13 @@ async def list_blacklisted_chats_command(update: Update, context: ContextTypes.D
         await update.message.reply_text("No chats are currently blacklisted.")
         return
         
-    message = "<b>Blacklisted Chats:</b>\n\n"
+    message_parts = ["<b>Blacklisted Chats:</b>\n\n"]
     for chat_id, chat_name, timestamp in blacklisted:
         date_added = datetime.fromisoformat(timestamp).strftime('%Y-%m-%d %H:%M')
-        message += f"• <b>{safe_escape(chat_name)}</b> [<code>{chat_id}</code>]\n"
-        message += f"Added: <code>{date_added}</code>\n\n"
+        message_parts.append(f"• <b>{safe_escape(chat_name)}</b> [<code>{chat_id}</code>]\nAdded: <code>{date_added}</code>\n\n")
+    message = "".join(message_parts)
 
     if len(message) > 4096:
-        import io
         with io.BytesIO(str.encode(message.replace("<b>", "").replace("</b>", "").replace("<code>", "").replace("</code>", ""))) as file:
             file.name = "blacklisted_chats.txt"
             await update.message.reply_document(document=file)
@@ -5,17 +5,16 @@ import logging
 import platform
 import random
 import sqlite3
-import subprocess
 import time
 from datetime import datetime, timezone, timedelta
 from telegram import Update, User, Chat
 from telegram import __version__ as ptb_version
 from telethon import __version__ as telethon_version
 from telegram.constants import ParseMode, ChatType, ChatMemberStatus
-from telegram.error import TelegramError
+from telegram.error import TelegramError, Forbidden, BadRequest
 from telegram.ext import Application, CommandHandler, ContextTypes
 
-from ..config import BOT_START_TIME, DB_NAME, OWNER_ID, ADMIN_LOG_CHAT_ID
+from ..config import BOT_START_TIME, OWNER_ID, ADMIN_LOG_CHAT_ID
 from ..core.database import (
     get_all_bot_chats_from_db, remove_chat_from_db_by_id,
     get_all_dev_users_from_db, add_dev_user, remove_dev_user,
@@ -24,33 +23,61 @@ from ..core.database import (
     get_all_whitelist_users_from_db, add_to_whitelist, remove_from_whitelist,
     is_dev_user, is_sudo_user, is_support_user,
     is_whitelisted, get_gban_reason, get_blacklist_reason,
-    get_user_from_db_by_username, delete_user_from_db
+    get_users_from_db_by_ids, delete_user_from_db, get_user_role, set_user_role,
+    get_table_counts, STATS_TABLES
 )
 from ..core.utils import (
     is_owner_or_dev, get_readable_time_delta, safe_escape, resolve_user_with_telethon,
-    create_user_html_link, send_operational_log, is_privileged_user, run_speed_test_async, is_entity_a_user
+    create_user_html_link, send_operational_log, is_privileged_user, is_sudo_or_higher, run_speed_test_async, is_entity_a_user
 )
 from ..core.constants import LEAVE_TEXTS
+from ..core.async_utils import aioify
 from ..core.decorators import check_module_enabled
 from ..core.handlers import custom_handler
 
 logger = logging.getLogger(__name__)
 
+get_table_counts_async = aioify(get_table_counts)
+
+NEOFETCH_TIMEOUT = 10.0
+ROLE_DISPLAY_NAMES = {
+    "support": "Support",
+    "sudo": "Sudo",
+    "dev": "Developer"
+}
+BOT_PERMISSION_NAMES = {
+    "can_manage_chat": "Manage Chat",
+    "can_delete_messages": "Delete Messages",
+    "can_manage_video_chats": "Manage Video Chats",
+    "can_restrict_members": "Restrict Members",
+    "can_promote_members": "Promote Members",
+    "can_change_info": "Change Chat Info",
+    "can_invite_users": "Invite Users",
+    "can_pin_messages": "Pin Messages",
+    "can_manage_topics": "Manage Topics"
+}
+SOFTWARE_INFO_TEXT = "\n".join([
+    "<b>Software Info:</b>",
+    f"<b>• Python:</b> <code>{platform.python_version()}</code>",
+    f"<b>• python-telegram-bot:</b> <code>{ptb_version}</code>",
+    f"<b>• Telethon:</b> <code>{telethon_version}</code>",
+    f"<b>• SQLite:</b> <code>{sqlite3.sqlite_version}</code>",
+])
+BROADCAST_CONCURRENCY = 25
+BROADCAST_SEND_INTERVAL = 1.0
+
 
 # --- CORE HANDLER FUNCTIONS ---
 @check_module_enabled("core")
 @custom_handler("status")
 async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     user = update.effective_user
-    if not (is_owner_or_dev(user.id) or is_sudo_user(user.id)):
+    if not is_sudo_or_higher(user.id):
         logger.warning(f"Unauthorized /status attempt by user {user.id}.")
         return
 
     uptime_delta = datetime.now() - BOT_START_TIME 
     readable_uptime = get_readable_time_delta(uptime_delta)
-    
-    python_version = platform.python_version()
-    sqlite_version = sqlite3.sqlite_version
 
     neofetch_output = ""
     try:
@@ -59,7 +86,12 @@ async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE
         )
-        stdout, stderr = await process.communicate()
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=NEOFETCH_TIMEOUT)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
 
         if stdout:
             lines = stdout.decode('utf-8').strip().split('\n')
@@ -90,11 +122,7 @@ async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         "<b>System Info:</b>",
         f"<code>{safe_escape(neofetch_output)}</code>",
         "",
-        "<b>Software Info:</b>",
-        f"<b>• Python:</b> <code>{python_version}</code>",
-        f"<b>• python-telegram-bot:</b> <code>{ptb_version}</code>",
-        f"<b>• Telethon:</b> <code>{telethon_version}</code>",
-        f"<b>• SQLite:</b> <code>{sqlite_version}</code>",
+        SOFTWARE_INFO_TEXT,
     ]
 
     status_msg = "\n".join(status_lines)
@@ -104,67 +132,27 @@ async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 @custom_handler("stats")
 async def stats_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     user = update.effective_user
-    if not (is_owner_or_dev(user.id) or is_sudo_user(user.id)):
+    if not is_sudo_or_higher(user.id):
         logger.warning(f"Unauthorized /stats attempt by user {user.id}.")
         return
 
-    known_users_count = "N/A"
-    blacklisted_count = "N/A"
-    developer_users_count = "N/A"
-    sudo_users_count = "N/A"
-    support_users_count = "N/A"
-    whitelist_users_count = "N/A"
-    blacklisted_chats_count = "N/A"
-    gban_count = "N/A"
-    chat_count = "N/A"
-
     try:
-        with sqlite3.connect(DB_NAME) as conn:
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT COUNT(*) FROM users")
-            known_users_count = str(cursor.fetchone()[0])
-
-            cursor.execute("SELECT COUNT(*) FROM blacklist")
-            blacklisted_count = str(cursor.fetchone()[0])
-
-            cursor.execute("SELECT COUNT(*) FROM dev_users")
-            developer_users_count = str(cursor.fetchone()[0])
-                
-            cursor.execute("SELECT COUNT(*) FROM sudo_users")
-            sudo_users_count = str(cursor.fetchone()[0])
-
-            cursor.execute("SELECT COUNT(*) FROM support_users")
-            support_users_count = str(cursor.fetchone()[0])
-
-            cursor.execute("SELECT COUNT(*) FROM whitelist_users")
-            whitelist_users_count = str(cursor.fetchone()[0])
-
-            cursor.execute("SELECT COUNT(*) FROM chat_blacklist")
-            blacklisted_chats_count = str(cursor.fetchone()[0])
-
-            cursor.execute("SELECT COUNT(*) FROM global_bans")
-            gban_count = str(cursor.fetchone()[0])
-                
-            cursor.execute("SELECT COUNT(*) FROM bot_chats")
-            chat_count = str(cursor.fetchone()[0])
-            
+        counts = {table: str(count) for table, count in (await get_table_counts_async()).items()}
     except sqlite3.Error as e:
         logger.error(f"SQLite error fetching counts for /stats: {e}", exc_info=True)
-        (known_users_count, blacklisted_count, developer_users_count, sudo_users_count, 
-         support_users_count, whitelist_users_count, blacklisted_chats_count, gban_count, chat_count) = ("DB Error",) * 7
+        counts = dict.fromkeys(STATS_TABLES, "DB Error")
 
     stats_lines = [
         "<b>📊 Bot Database Stats:</b>\n",
-        f"<b>• 💬 Chats:</b> <code>{chat_count}</code>",
-        f"<b>• 🛑 Blacklisted Chats:</b> <code>{blacklisted_chats_count}</code>",
-        f"<b>• 👀 Known Users:</b> <code>{known_users_count}</code>",
-        f"<b>• 🛃 Developer Users:</b> <code>{developer_users_count}</code>",
-        f"<b>• 🛡 Sudo Users:</b> <code>{sudo_users_count}</code>",
-        f"<b>• 👷‍♂️ Support Users:</b> <code>{support_users_count}</code>",
-        f"<b>• 🔰 Whitelist Users:</b> <code>{whitelist_users_count}</code>",
-        f"<b>• 🚫 Blacklisted Users:</b> <code>{blacklisted_count}</code>",
-        f"<b>• 🌍 Globally Banned Users:</b> <code>{gban_count}</code>"
+        f"<b>• 💬 Chats:</b> <code>{counts['bot_chats']}</code>",
+        f"<b>• 🛑 Blacklisted Chats:</b> <code>{counts['chat_blacklist']}</code>",
+        f"<b>• 👀 Known Users:</b> <code>{counts['users']}</code>",
+        f"<b>• 🛃 Developer Users:</b> <code>{counts['dev_users']}</code>",
+        f"<b>• 🛡 Sudo Users:</b> <code>{counts['sudo_users']}</code>",
+        f"<b>• 👷‍♂️ Support Users:</b> <code>{counts['support_users']}</code>",
+        f"<b>• 🔰 Whitelist Users:</b> <code>{counts['whitelist_users']}</code>",
+        f"<b>• 🚫 Blacklisted Users:</b> <code>{counts['blacklist']}</code>",
+        f"<b>• 🌍 Globally Banned Users:</b> <code>{counts['global_bans']}</code>"
     ]
 
     stats_msg = "\n".join(stats_lines)
@@ -178,11 +166,11 @@ async def ping_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         logger.warning(f"Unauthorized /ping attempt by user {user.id}.")
         return
     
-    start_time = time.time()
-    message = await update.message.reply_html("<b>Pinging...</b>")
-    end_time = time.time()
-    latency = round((end_time - start_time) * 1000, 2)
-    await message.edit_text(
+    start_ns = time.perf_counter_ns()
+    await context.bot.get_me()
+    latency = round((time.perf_counter_ns() - start_ns) / 1e6, 2)
+    await context.bot.send_message(
+        update.effective_chat.id,
         f"🏓 <b>Pong!</b>\n"
         f"<b>Latency:</b> <code>{latency} ms</code>",
         parse_mode=ParseMode.HTML
@@ -196,7 +184,7 @@ async def permissions_command(update: Update, context: ContextTypes.DEFAULT_TYPE
     message = update.effective_message
     if not message: return
     
-    if not (is_owner_or_dev(user.id) or is_sudo_user(user.id)):
+    if not is_sudo_or_higher(user.id):
         logger.warning(f"Unauthorized /permission attempt by user {user.id}.")
         return
 
@@ -217,21 +205,9 @@ async def permissions_command(update: Update, context: ContextTypes.DEFAULT_TYPE
         )
         return
 
-    permissions_to_check = {
-        "can_manage_chat": "Manage Chat",
-        "can_delete_messages": "Delete Messages",
-        "can_manage_video_chats": "Manage Video Chats",
-        "can_restrict_members": "Restrict Members",
-        "can_promote_members": "Promote Members",
-        "can_change_info": "Change Chat Info",
-        "can_invite_users": "Invite Users",
-        "can_pin_messages": "Pin Messages",
-        "can_manage_topics": "Manage Topics"
-    }
-
     response_lines = ["<b>🔧 My Permissions in this Chat:</b>\n"]
     
-    for perm_key, perm_name in permissions_to_check.items():
+    for perm_key, perm_name in BOT_PERMISSION_NAMES.items():
         has_permission = getattr(bot_member, perm_key, False)
         
         status_text = "Yes" if has_permission else "No"
@@ -244,7 +220,7 @@ async def permissions_command(update: Update, context: ContextTypes.DEFAULT_TYPE
 @custom_handler("echo")
 async def echo(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     user = update.effective_user
-    if not (is_owner_or_dev(user.id) or is_sudo_user(user.id)):
+    if not is_sudo_or_higher(user.id):
         logger.warning(f"Unauthorized /echo attempt by user {user.id}.")
         return
 
@@ -466,7 +442,6 @@ async def speedtest_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
     loop = asyncio.get_event_loop()
     try:
         results = await run_speed_test_async()
-        await asyncio.sleep(4)
 
         if results and "error" not in results:
             ping_val = results.get("ping", 0.0)
@@ -547,11 +522,17 @@ async def list_sudo_users_command(update: Update, context: ContextTypes.DEFAULT_
 
     response_lines = ["<b>🛡️ Sudo Users List:</b>\n"]
     
+    known_users = get_users_from_db_by_ids([user_id for user_id, _ in sudo_user_tuples])
     for user_id, timestamp_str in sudo_user_tuples:
         user_display_name = f"<code>{user_id}</code>"
 
-        try:
-            chat_info = await context.bot.get_chat(user_id)
+        chat_info = known_users.get(user_id)
+        if not chat_info:
+            try:
+                chat_info = await context.bot.get_chat(user_id)
+            except Exception:
+                pass
+        if chat_info:
             name_parts = []
             if chat_info.first_name: name_parts.append(safe_escape(chat_info.first_name))
             if chat_info.last_name: name_parts.append(safe_escape(chat_info.last_name))
@@ -559,15 +540,6 @@ async def list_sudo_users_command(update: Update, context: ContextTypes.DEFAULT_
             
             if name_parts:
                 user_display_name = " ".join(name_parts) + f" [<code>{user_id}</code>]"
-        except Exception:
-            user_obj_from_db = get_user_from_db_by_username(str(user_id))
-            if user_obj_from_db:
-                display_name_parts = []
-                if user_obj_from_db.first_name: display_name_parts.append(safe_escape(user_obj_from_db.first_name))
-                if user_obj_from_db.last_name: display_name_parts.append(safe_escape(user_obj_from_db.last_name))
-                if user_obj_from_db.username: display_name_parts.append(f"(@{safe_escape(user_obj_from_db.username)})")
-                if display_name_parts:
-                    user_display_name = " ".join(display_name_parts) + f" [<code>{user_id}</code>]"
 
         formatted_added_time = timestamp_str
         try:
@@ -602,11 +574,17 @@ async def listsupport_command(update: Update, context: ContextTypes.DEFAULT_TYPE
 
     response_lines = [f"<b>👷‍♂️ Support Users List:</b>\n"]
     
+    known_users = get_users_from_db_by_ids([user_id for user_id, _ in support_user_tuples])
     for user_id, timestamp_str in support_user_tuples:
         user_display_name = f"<code>{user_id}</code>"
 
-        try:
-            chat_info = await context.bot.get_chat(user_id)
+        chat_info = known_users.get(user_id)
+        if not chat_info:
+            try:
+                chat_info = await context.bot.get_chat(user_id)
+            except Exception:
+                pass
+        if chat_info:
             name_parts = []
             if chat_info.first_name: name_parts.append(safe_escape(chat_info.first_name))
             if chat_info.last_name: name_parts.append(safe_escape(chat_info.last_name))
@@ -614,15 +592,6 @@ async def listsupport_command(update: Update, context: ContextTypes.DEFAULT_TYPE
             
             if name_parts:
                 user_display_name = " ".join(name_parts) + f" [<code>{user_id}</code>]"
-        except Exception:
-            user_obj_from_db = get_user_from_db_by_username(str(user_id))
-            if user_obj_from_db:
-                display_name_parts = []
-                if user_obj_from_db.first_name: display_name_parts.append(safe_escape(user_obj_from_db.first_name))
-                if user_obj_from_db.last_name: display_name_parts.append(safe_escape(user_obj_from_db.last_name))
-                if user_obj_from_db.username: display_name_parts.append(f"(@{safe_escape(user_obj_from_db.username)})")
-                if display_name_parts:
-                    user_display_name = " ".join(display_name_parts) + f" [<code>{user_id}</code>]"
 
         formatted_added_time = timestamp_str
         try:
@@ -652,11 +621,17 @@ async def listwhitelist_command(update: Update, context: ContextTypes.DEFAULT_TY
 
     response_lines = [f"<b>🔰 Whitelist Users List:</b>\n"]
     
+    known_users = get_users_from_db_by_ids([user_id for user_id, _ in whitelist_user_tuples])
     for user_id, timestamp_str in whitelist_user_tuples:
         user_display_name = f"<code>{user_id}</code>"
 
-        try:
-            chat_info = await context.bot.get_chat(user_id)
+        chat_info = known_users.get(user_id)
+        if not chat_info:
+            try:
+                chat_info = await context.bot.get_chat(user_id)
+            except Exception:
+                pass
+        if chat_info:
             name_parts = []
             if chat_info.first_name: name_parts.append(safe_escape(chat_info.first_name))
             if chat_info.last_name: name_parts.append(safe_escape(chat_info.last_name))
@@ -664,15 +639,6 @@ async def listwhitelist_command(update: Update, context: ContextTypes.DEFAULT_TY
             
             if name_parts:
                 user_display_name = " ".join(name_parts) + f" [<code>{user_id}</code>]"
-        except Exception:
-            user_obj_from_db = get_user_from_db_by_username(str(user_id))
-            if user_obj_from_db:
-                display_name_parts = []
-                if user_obj_from_db.first_name: display_name_parts.append(safe_escape(user_obj_from_db.first_name))
-                if user_obj_from_db.last_name: display_name_parts.append(safe_escape(user_obj_from_db.last_name))
-                if user_obj_from_db.username: display_name_parts.append(f"(@{safe_escape(user_obj_from_db.username)})")
-                if display_name_parts:
-                    user_display_name = " ".join(display_name_parts) + f" [<code>{user_id}</code>]"
 
         formatted_added_time = timestamp_str
         try:
@@ -701,11 +667,17 @@ async def listdevs_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
 
     response_lines = [f"<b>🛃 Developer Users List:</b>\n"]
     
+    known_users = get_users_from_db_by_ids([user_id for user_id, _ in dev_user_tuples])
     for user_id, timestamp_str in dev_user_tuples:
         user_display_name = f"<code>{user_id}</code>"
 
-        try:
-            chat_info = await context.bot.get_chat(user_id)
+        chat_info = known_users.get(user_id)
+        if not chat_info:
+            try:
+                chat_info = await context.bot.get_chat(user_id)
+            except Exception:
+                pass
+        if chat_info:
             name_parts = []
             if chat_info.first_name: name_parts.append(safe_escape(chat_info.first_name))
             if chat_info.last_name: name_parts.append(safe_escape(chat_info.last_name))
@@ -713,15 +685,6 @@ async def listdevs_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
             
             if name_parts:
                 user_display_name = " ".join(name_parts) + f" [<code>{user_id}</code>]"
-        except Exception:
-            user_obj_from_db = get_user_from_db_by_username(str(user_id))
-            if user_obj_from_db:
-                display_name_parts = []
-                if user_obj_from_db.first_name: display_name_parts.append(safe_escape(user_obj_from_db.first_name))
-                if user_obj_from_db.last_name: display_name_parts.append(safe_escape(user_obj_from_db.last_name))
-                if user_obj_from_db.username: display_name_parts.append(f"(@{safe_escape(user_obj_from_db.username)})")
-                if display_name_parts:
-                    user_display_name = " ".join(display_name_parts) + f" [<code>{user_id}</code>]"
 
         formatted_added_time = timestamp_str
         try:
@@ -765,15 +728,18 @@ async def list_groups_command(update: Update, context: ContextTypes.DEFAULT_TYPE
             f"<b>Added:</b> <code>{formatted_added_time}</code>\n\n"
         )
 
-    final_message = ""
+    chunk: list[str] = []
+    chunk_length = 0
     for line in response_lines:
-        if len(final_message) + len(line) > 4096:
-            await update.message.reply_html(final_message, disable_web_page_preview=True)
-            final_message = ""
-        final_message += line
+        if chunk and chunk_length + len(line) > 4096:
+            await update.message.reply_html("".join(chunk), disable_web_page_preview=True)
+            chunk = []
+            chunk_length = 0
+        chunk.append(line)
+        chunk_length += len(line)
 
-    if final_message:
-        await update.message.reply_html(final_message, disable_web_page_preview=True)
+    if chunk:
+        await update.message.reply_html("".join(chunk), disable_web_page_preview=True)
 
 @check_module_enabled("core")
 @custom_handler("delgroup")
@@ -901,22 +867,33 @@ async def broadcast_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         f"📢 Starting broadcast to <code>{len(all_chats)}</code> chats..."
     )
 
-    sent_count = 0
-    failed_count = 0
-    
-    for chat_id, chat_title, _ in all_chats:
+    context.application.create_task(
+        _run_broadcast(context, status_message, all_chats, text_to_broadcast),
+        update=update
+    )
+
+async def _send_broadcast_message(context: ContextTypes.DEFAULT_TYPE, semaphore: asyncio.Semaphore, chat_id: int, chat_title: str, text: str) -> bool:
+    async with semaphore:
         try:
-            await context.bot.send_message(chat_id=chat_id, text=text_to_broadcast)
-            sent_count += 1
+            await context.bot.send_message(chat_id=chat_id, text=text)
             logger.info(f"Broadcast sent to: {chat_title} ({chat_id})")
+            return True
         except Exception as e:
-            failed_count += 1
             logger.error(f"Failed to send broadcast to {chat_title} ({chat_id}): {e}")
-            if isinstance(e, (telegram.error.Forbidden, telegram.error.BadRequest)):
+            if isinstance(e, (Forbidden, BadRequest)):
                 if "forbidden" in str(e).lower() or "bot is not a member" in str(e).lower() or "chat not found" in str(e).lower():
-                    remove_chat_from_db(chat_id)
-        
-        await asyncio.sleep(0.2)
+                    remove_chat_from_db_by_id(chat_id)
+            return False
+        finally:
+            await asyncio.sleep(BROADCAST_SEND_INTERVAL)
+
+async def _run_broadcast(context: ContextTypes.DEFAULT_TYPE, status_message, all_chats: list, text: str) -> None:
+    semaphore = asyncio.Semaphore(BROADCAST_CONCURRENCY)
+    results = await asyncio.gather(
+        *(_send_broadcast_message(context, semaphore, chat_id, chat_title, text) for chat_id, chat_title, _ in all_chats)
+    )
+    sent_count = sum(results)
+    failed_count = len(results) - sent_count
 
     final_report = (
         f" complete!\n\n"
@@ -956,27 +933,26 @@ async def shell_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         
         stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=60.0)
 
-        result_text = ""
-        if stdout:
-            result_text += f"<code>{html.escape(stdout.decode('utf-8', errors='ignore'))}</code>\n"
-        if stderr:
-            result_text += f"<code>{html.escape(stderr.decode('utf-8', errors='ignore'))}</code>\n"
-        if not stdout and not stderr:
-            result_text = "✅ Command executed with no output."
+        outputs = [stream.decode('utf-8', errors='ignore') for stream in (stdout, stderr) if stream]
+        result_text = "".join(
+            f"<code>{html.escape(output)}</code>\n" for output in outputs
+        ) or "✅ Command executed with no output."
             
         if len(result_text) > 4096:
             await status_message.edit_text("Output is too long. Sending as a file.")
-            with io.BytesIO(str.encode(result_text.replace("<b>", "").replace("</b>", "").replace("<code>", "").replace("</code>", ""))) as f:
+            with io.BytesIO("\n".join(outputs).encode()) as f:
                 f.name = "shell_output.txt"
                 await update.message.reply_document(document=f)
         else:
             await status_message.edit_text(result_text, parse_mode=ParseMode.HTML)
 
     except asyncio.TimeoutError:
-        await status_message.edit_text("<b>Error:</b> Command timed out after 60 seconds.")
+        process.kill()
+        await process.wait()
+        await status_message.edit_text("<b>Error:</b> Command timed out after 60 seconds.", parse_mode=ParseMode.HTML)
     except Exception as e:
         logger.error(f"Error executing shell command '{command}': {e}", exc_info=True)
-        await status_message.edit_text(f"<b>Error:</b> {html.escape(str(e))}")
+        await status_message.edit_text(f"<b>Error:</b> {html.escape(str(e))}", parse_mode=ParseMode.HTML)
 
 @check_module_enabled("core")
 @custom_handler(["execute", "exe"])
@@ -1012,12 +988,17 @@ async def addsudo_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         
         target_user = await resolve_user_with_telethon(context, target_input, update)
         
-        if not target_user and target_input.isdigit():
+        if not target_user:
             try:
-                target_user = await context.bot.get_chat(int(target_input))
-            except:
-                logger.warning(f"Could not resolve full profile for ID {target_input} in ADDSUDO. Creating a minimal User object.")
-                target_user = User(id=int(target_input), first_name="", is_bot=False)
+                target_id = int(target_input)
+            except ValueError:
+                target_id = 0
+            if target_id > 0:
+                try:
+                    target_user = await context.bot.get_chat(target_id)
+                except TelegramError:
+                    logger.warning(f"Could not resolve full profile for ID {target_input} in ADDSUDO. Creating a minimal User object.")
+                    target_user = User(id=target_id, first_name="", is_bot=False)
     else:
         await message.reply_text("Usage: /addsudo <ID/@username/reply>")
         return
@@ -1207,61 +1188,39 @@ async def setrank_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
     new_role_shortcut = args_for_role[0].lower()
 
-    role_map = {
-        "support": "Support",
-        "sudo": "Sudo",
-        "dev": "Developer"
-    }
-
-    if new_role_shortcut not in role_map:
+    if new_role_shortcut not in ROLE_DISPLAY_NAMES:
         await message.reply_text(f"Invalid role '{safe_escape(new_role_shortcut)}'. Please use one of: support, sudo, dev.")
         return
 
-    new_role_full_name = role_map[new_role_shortcut]
+    new_role_full_name = ROLE_DISPLAY_NAMES[new_role_shortcut]
 
     if target_user.id == OWNER_ID:
         await message.reply_text("Owner cannot have his rank changed because he has the ultimate authority.")
         return
 
-    if not is_privileged_user(target_user.id):
+    current_role_shortcut = get_user_role(target_user.id)
+    if current_role_shortcut is None:
         await message.reply_text("This command can only be used on users who already have a role (Support, Sudo, or Developer).")
         return
 
-    if is_dev_user(user.id):
+    if get_user_role(user.id) == "dev":
         if user.id == target_user.id:
             await message.reply_text("You cannot change your own rank.")
             return
-        if is_dev_user(target_user.id):
+        if current_role_shortcut == "dev":
             await message.reply_text("As a Developer, you cannot change the rank of other Developers.")
             return
         if new_role_shortcut == "dev":
             await message.reply_text("As a Developer, you cannot promote others to the Developer role.")
             return
 
-    current_role_shortcut = ""
-    if is_dev_user(target_user.id): current_role_shortcut = "dev"
-    elif is_sudo_user(target_user.id): current_role_shortcut = "sudo"
-    elif is_support_user(target_user.id): current_role_shortcut = "support"
-    
-    current_role_full_name = role_map.get(current_role_shortcut, "Unknown")
+    current_role_full_name = ROLE_DISPLAY_NAMES.get(current_role_shortcut, "Unknown")
 
     if new_role_shortcut == current_role_shortcut:
         await message.reply_text(f"User is already a {new_role_full_name}. No changes made.")
         return
 
-    remove_support_user(target_user.id)
-    remove_sudo_user(target_user.id)
-    remove_dev_user(target_user.id)
-
-    success = False
-    if new_role_shortcut == "support":
-        success = add_support_user(target_user.id, user.id)
-    elif new_role_shortcut == "sudo":
-        success = add_sudo_user(target_user.id, user.id)
-    elif new_role_shortcut == "dev":
-        success = add_dev_user(target_user.id, user.id)
-
-    if success:
+    if set_user_role(target_user.id, new_role_shortcut, user.id):
         user_display = create_user_html_link(target_user)
         admin_link = create_user_html_link(user)
         
@@ -1673,7 +1632,6 @@ async def whitelist_user_command(update: Update, context: ContextTypes.DEFAULT_T
 
     prepare_message = f"Keep this user safe!"
     await message.reply_html(prepare_message)
-    await asyncio.sleep(1.0)
 
     if add_to_whitelist(target_user.id, user.id):
         await message.reply_html(f"✅ Done! {user_display} [<code>{target_user.id}</code>] has been <b>whitelisted</b>.")
@@ -1736,7 +1694,6 @@ async def unwhitelist_user_command(update: Update, context: ContextTypes.DEFAULT
 
     prepare_message = f"Let him be like everyone else!"
     await message.reply_html(prepare_message)
-    await asyncio.sleep(1.0)
 
     user_display = create_user_html_link(target_user)
     if remove_from_whitelist(target_user.id):
@@ -1,5 +1,6 @@
 import logging
 import traceback
+import io
 import html
 from telegram import Update, User, Chat
 from telegram.constants import ChatType, ParseMode
@@ -63,7 +64,6 @@ async def get_update_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         update_json = update_to_show.to_json()
         
         if len(update_json) > 4000:
-            import io
             with io.BytesIO(str.encode(update_json)) as file:
                 file.name = "update.json"
                 await message.reply_document(document=file)
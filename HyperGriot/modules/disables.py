@@ -4,7 +4,7 @@ from telegram.constants import ParseMode, ChatType
 from telegram.ext import Application, CommandHandler, ContextTypes
 from collections import defaultdict
 
-from ..core.constants import DISABLES_HELP_TEXT
+from ..core.constants import DISABLES_HELP_TEXT, MISSING_PERMISSION_TEXTS
 from ..core.database import disable_command_in_chat, enable_command_in_chat, get_disabled_commands_in_chat
 from ..core.utils import safe_escape, _can_user_perform_action, send_safe_reply
 from ..core.decorators import check_module_enabled, command_control
@@ -22,7 +22,7 @@ async def disable_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         return
     
     can_disable = await _can_user_perform_action(
-        update, context, 'can_manage_chat', "Why should I listen to a person with no privileges for this? You need 'can_manage_chat' permission.", allow_bot_privileged_override=False
+        update, context, 'can_manage_chat', MISSING_PERMISSION_TEXTS['can_manage_chat'], allow_bot_privileged_override=False
     )
     if not can_disable:
         return
@@ -70,7 +70,7 @@ async def enable_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         return
     
     can_enable = await _can_user_perform_action(
-        update, context, 'can_manage_chat', "Why should I listen to a person with no privileges for this? You need 'can_manage_chat' permission.", allow_bot_privileged_override=False
+        update, context, 'can_manage_chat', MISSING_PERMISSION_TEXTS['can_manage_chat'], allow_bot_privileged_override=False
     )
     if not can_enable:
         return
@@ -115,24 +115,24 @@ async def settings_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
         return
     
     can_see_settings = await _can_user_perform_action(
-        update, context, 'can_manage_chat', "Why should I listen to a person with no privileges for this? You need 'can_manage_chat' permission."
+        update, context, 'can_manage_chat', MISSING_PERMISSION_TEXTS['can_manage_chat']
     )
     if not can_see_settings:
         return
 
     manageable_commands = context.bot_data.get("manageable_commands", set())
-    disabled_commands = get_disabled_commands_in_chat(update.effective_chat.id)
+    disabled_commands = set(get_disabled_commands_in_chat(update.effective_chat.id))
     
-    message = f"<b>Settings for {safe_escape(update.effective_chat.title)}:</b>\n\n"
+    message_parts = [f"<b>Settings for {safe_escape(update.effective_chat.title)}:</b>\n\n"]
     
     if not manageable_commands:
-        message += "No manageable commands found."
+        message_parts.append("No manageable commands found.")
     else:
-        for cmd in sorted(list(manageable_commands)):
+        for cmd in sorted(manageable_commands):
             status = "🔴 Disabled" if cmd in disabled_commands else "🟢 Enabled"
-            message += f"• <code>{cmd}</code>: {status}\n"
+            message_parts.append(f"• <code>{cmd}</code>: {status}\n")
         
-    await update.message.reply_html(message)
+    await update.message.reply_html("".join(message_parts))
 
 @check_module_enabled("disables")
 @command_control("disableshelp")
@@ -1,19 +1,38 @@
+import functools
 import logging
 import re
-import json
 import time
+import orjson
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, User, Chat
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
 from telegram.constants import ParseMode, ChatType
 
-from ..core.database import add_or_update_filter, remove_filter, get_all_filters_for_chat
+from ..core.database import add_or_update_filter, remove_filter, get_all_filters_for_chat, get_filter_keywords_for_chat
 from ..core.utils import _can_user_perform_action, safe_escape
 from ..core.decorators import check_module_enabled, command_control
 from ..core.handlers import custom_handler
-from ..core.constants import FILTERS_HELP_TEXT
+from ..core.constants import FILTERS_HELP_TEXT, MISSING_PERMISSION_TEXTS
 
 logger = logging.getLogger(__name__)
 
+FILTERS_CACHE_TTL = 60
+FILTER_KEYBOARD_CACHE_SIZE = 256
+NON_WORD_CHARS_RE = re.compile(r'[^\w\s]')
+
+FILTER_PATTERN_BUILDERS = {
+    'wildcard': lambda keyword: re.compile(re.escape(keyword).replace(r'\*', '.*'), re.IGNORECASE),
+    'regex': lambda keyword: re.compile(keyword, re.IGNORECASE),
+}
+
+MEDIA_REPLY_METHODS = {
+    'photo': 'reply_photo',
+    'audio': 'reply_audio',
+    'animation': 'reply_animation',
+    'video': 'reply_video',
+    'voice': 'reply_voice',
+    'document': 'reply_document',
+}
+
 
 def fill_reply_template(text: str | None, user: User, chat: Chat) -> str:
     if not text:
@@ -27,6 +46,28 @@ def fill_reply_template(text: str | None, user: User, chat: Chat) -> str:
                .replace('{id}', str(user.id))\
                .replace('{chatname}', safe_escape(chat.title or "this chat"))
 
+def _prepare_filters(chat_id: int, chat_filters: list[dict]) -> list[tuple[str | re.Pattern, dict]]:
+    """Pairs each filter with its lowercased keyword or compiled pattern, keeping the original order."""
+    prepared = []
+    for f in chat_filters:
+        keyword = f['keyword']
+        filter_type = f['filter_type']
+        if filter_type == 'keyword':
+            prepared.append((keyword.lower(), f))
+        elif filter_type in FILTER_PATTERN_BUILDERS:
+            try:
+                prepared.append((FILTER_PATTERN_BUILDERS[filter_type](keyword), f))
+            except re.error as e:
+                logger.warning("Invalid regex pattern in filter for chat %s: %s | Error: %s", chat_id, keyword, e)
+    return prepared
+
+@functools.lru_cache(maxsize=FILTER_KEYBOARD_CACHE_SIZE)
+def _build_filter_keyboard(buttons_json: str) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton(text, url=url) for text, url in row]
+        for row in orjson.loads(buttons_json)
+    ])
+
 @check_module_enabled("filters")
 @command_control("filters")
 async def send_filter_reply(update: Update, context: ContextTypes.DEFAULT_TYPE, filter_data: dict):
@@ -41,13 +82,8 @@ async def send_filter_reply(update: Update, context: ContextTypes.DEFAULT_TYPE,
 
     if buttons_json:
         try:
-            buttons_data = json.loads(buttons_json)
-            keyboard = [
-                [InlineKeyboardButton(text, url=url) for text, url in row]
-                for row in buttons_data
-            ]
-            reply_markup = InlineKeyboardMarkup(keyboard)
-        except (json.JSONDecodeError, TypeError, ValueError) as e:
+            reply_markup = _build_filter_keyboard(buttons_json)
+        except (orjson.JSONDecodeError, TypeError, ValueError) as e:
             logger.warning(f"Could not parse buttons for filter '{filter_data.get('keyword')}': {e}")
 
     try:
@@ -55,20 +91,11 @@ async def send_filter_reply(update: Update, context: ContextTypes.DEFAULT_TYPE,
         
         if reply_type == 'text':
             await target_message.reply_html(reply_text, reply_markup=reply_markup, disable_web_page_preview=True)
-        elif reply_type == 'photo':
-            await target_message.reply_photo(file_id, caption=reply_text, parse_mode=ParseMode.HTML, reply_markup=reply_markup)
-        elif reply_type == 'audio':
-            await target_message.reply_audio(file_id, caption=reply_text, parse_mode=ParseMode.HTML, reply_markup=reply_markup)
         elif reply_type == 'sticker':
             await target_message.reply_sticker(file_id, reply_markup=reply_markup)
-        elif reply_type == 'animation':
-            await target_message.reply_animation(file_id, caption=reply_text, parse_mode=ParseMode.HTML, reply_markup=reply_markup)
-        elif reply_type == 'video':
-            await target_message.reply_video(file_id, caption=reply_text, parse_mode=ParseMode.HTML, reply_markup=reply_markup)
-        elif reply_type == 'voice':
-            await target_message.reply_voice(file_id, caption=reply_text, parse_mode=ParseMode.HTML, reply_markup=reply_markup)
-        elif reply_type == 'document':
-            await target_message.reply_document(file_id, caption=reply_text, parse_mode=ParseMode.HTML, reply_markup=reply_markup)
+        elif reply_type in MEDIA_REPLY_METHODS:
+            reply_method = getattr(target_message, MEDIA_REPLY_METHODS[reply_type])
+            await reply_method(file_id, caption=reply_text, parse_mode=ParseMode.HTML, reply_markup=reply_markup)
     
     except Exception as e:
         logger.error(f"Failed to send filter reply for keyword '{filter_data.get('keyword')}': {e}")
@@ -83,9 +110,9 @@ async def check_message_for_filters(update: Update, context: ContextTypes.DEFAUL
 
     if not chat or not message or not message.text or chat.type == ChatType.PRIVATE:
         return
-    current_time = time.time()
-    if 'filters_cache' not in context.chat_data or context.chat_data.get('filters_last_update', 0) < (current_time - 60):
-        context.chat_data['filters_cache'] = get_all_filters_for_chat(chat.id)
+    current_time = time.monotonic()
+    if 'filters_cache' not in context.chat_data or context.chat_data['filters_last_update'] < current_time - FILTERS_CACHE_TTL:
+        context.chat_data['filters_cache'] = _prepare_filters(chat.id, get_all_filters_for_chat(chat.id))
         context.chat_data['filters_last_update'] = current_time
     
     all_filters = context.chat_data.get('filters_cache', [])
@@ -93,35 +120,18 @@ async def check_message_for_filters(update: Update, context: ContextTypes.DEFAUL
         return
     
     message_text = message.text
-    for f in all_filters:
-        keyword = f['keyword']
-        filter_type = f['filter_type']
-        
-        match = False
-        try:
-            if filter_type == 'keyword':
-                normalized_text = re.sub(r'[^\w\s]', '', message_text)
-                words_in_message = normalized_text.lower().split()
-                
-                if keyword.lower() in words_in_message:
-                    match = True
-            
-            elif filter_type == 'wildcard':
-                pattern = re.escape(keyword).replace(r'\*', '.*')
-                if re.search(pattern, message_text, re.IGNORECASE):
-                    match = True
-            
-            elif filter_type == 'regex':
-                if re.search(keyword, message_text, re.IGNORECASE):
-                    match = True
-
-        except re.error as e:
-            logger.warning(f"Invalid regex pattern in filter for chat {chat.id}: {keyword} | Error: {e}")
+    words_in_message = None
+    for matcher, f in all_filters:
+        if isinstance(matcher, str):
+            if words_in_message is None:
+                words_in_message = set(NON_WORD_CHARS_RE.sub('', message_text).lower().split())
+            if matcher not in words_in_message:
+                continue
+        elif not matcher.search(message_text):
             continue
 
-        if match:
-            await send_filter_reply(update, context, f)
-            return
+        await send_filter_reply(update, context, f)
+        return
 
 @check_module_enabled("filters")
 @custom_handler(["addfilter", "filter"])
@@ -133,7 +143,7 @@ async def add_filter_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         return
     
     can_manage = await _can_user_perform_action(
-        update, context, 'can_manage_chat', "Why should I listen to a person with no privileges for this? You need 'can_manage_chat' permission.", allow_bot_privileged_override=False
+        update, context, 'can_manage_chat', MISSING_PERMISSION_TEXTS['can_manage_chat'], allow_bot_privileged_override=False
     )
     if not can_manage:
         return
@@ -164,11 +174,11 @@ async def add_filter_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
             await msg.reply_html("Invalid type format. Use <code>type:wildcard</code> or <code>type:regex</code>.")
             return
 
-    try:
-        keyword = full_args_text.split("'", 2)[1]
-    except IndexError:
+    quoted_parts = full_args_text.split("'", 2)
+    if len(quoted_parts) < 2:
         await msg.reply_html("You need to wrap your keyword in single quotes, e.g., 'hello'.")
         return
+    keyword = quoted_parts[1]
         
     filter_data = {'filter_type': filter_type}
     
@@ -193,10 +203,7 @@ async def add_filter_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         else:
             filter_data['reply_type'] = 'text'
     else:
-        try:
-            reply_text = full_args_text.split(f"'{keyword}'", 1)[1].strip()
-        except IndexError:
-            reply_text = None
+        reply_text = quoted_parts[2].strip() if len(quoted_parts) > 2 else None
 
         if not reply_text:
             await msg.reply_html("You must provide a reply (like text or an emoji) after the keyword.")
@@ -221,7 +228,7 @@ async def remove_filter_command(update: Update, context: ContextTypes.DEFAULT_TY
         return
         
     can_manage = await _can_user_perform_action(
-        update, context, 'can_manage_chat', "Why should I listen to a person with no privileges for this? You need 'can_manage_chat' permission.", allow_bot_privileged_override=False
+        update, context, 'can_manage_chat', MISSING_PERMISSION_TEXTS['can_manage_chat'], allow_bot_privileged_override=False
     )
     if not can_manage:
         return
@@ -248,29 +255,28 @@ async def list_filters_command(update: Update, context: ContextTypes.DEFAULT_TYP
         return
     
     can_see = await _can_user_perform_action(
-        update, context, 'can_manage_chat', "Why should I listen to a person with no privileges for this? You need 'can_manage_chat' permission.", allow_bot_privileged_override=True
+        update, context, 'can_manage_chat', MISSING_PERMISSION_TEXTS['can_manage_chat'], allow_bot_privileged_override=True
     )
     if not can_see:
         return
     
-    all_filters = get_all_filters_for_chat(update.effective_chat.id)
+    all_filters = get_filter_keywords_for_chat(update.effective_chat.id)
     if not all_filters:
         await update.message.reply_text("There are no active filters in this chat.")
         return
         
-    message = "<b>Active filters in this chat:</b>\n\n"
+    message_parts = ["<b>Active filters in this chat:</b>\n\n"]
     filters_by_type = {'keyword': [], 'wildcard': [], 'regex': []}
-    for f in all_filters:
-        filters_by_type[f['filter_type']].append(f['keyword'])
+    for f_type, keyword in all_filters:
+        filters_by_type[f_type].append(keyword)
         
     for f_type, keywords in filters_by_type.items():
         if keywords:
-            message += f"<b>{f_type.capitalize()}:</b>\n"
-            for keyword in sorted(keywords):
-                message += f"• <code>{safe_escape(keyword)}</code>\n"
-            message += "\n"
+            message_parts.append(f"<b>{f_type.capitalize()}:</b>\n")
+            message_parts.extend(f"• <code>{safe_escape(keyword)}</code>\n" for keyword in keywords)
+            message_parts.append("\n")
 
-    await update.message.reply_html(message)
+    await update.message.reply_html("".join(message_parts))
 
 @check_module_enabled("filters")
 @command_control("filters")
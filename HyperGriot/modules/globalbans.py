@@ -1,14 +1,13 @@
 import logging
-import asyncio
 import sqlite3
 from datetime import datetime, timezone, timedelta
 from telegram import Update, User, Chat
 from telegram.constants import ParseMode, ChatType, ChatMemberStatus
 from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes, ApplicationHandlerStop
 
-from ..config import APPEAL_CHAT_USERNAME, DB_NAME
-from ..core.database import is_gban_enforced, get_gban_reason, add_to_gban, remove_from_gban, is_whitelisted, add_chat_to_db
-from ..core.utils import is_privileged_user, resolve_user_with_telethon, create_user_html_link, safe_escape, send_operational_log, propagate_unban, is_entity_a_user
+from ..config import APPEAL_CHAT_USERNAME
+from ..core.database import is_gban_enforced, get_gban_reason, add_to_gban, remove_from_gban, is_whitelisted, add_chat_to_db, get_connection
+from ..core.utils import is_privileged_user, resolve_user_with_telethon, create_user_html_link, safe_escape, send_operational_log, propagate_unban, is_entity_a_user, ADMIN_STATUSES, GROUP_CHAT_TYPES
 from ..core.decorators import check_module_enabled
 from ..core.handlers import custom_handler
 
@@ -48,44 +47,41 @@ async def check_gban_on_message(update: Update, context: ContextTypes.DEFAULT_TY
         return
     
     chat = update.effective_chat
-    
-    if not is_gban_enforced(chat.id):
-        return
-
     user = update.effective_user
-    if not user or is_privileged_user(user.id):
+    if not user:
         return
-        
+
     gban_reason = get_gban_reason(user.id)
-    if gban_reason:
-        message = update.effective_message
-        
-        try:
-            bot_member = await context.bot.get_chat_member(chat.id, context.bot.id)
-            user_member = await context.bot.get_chat_member(chat.id, user.id)
+    if not gban_reason or is_privileged_user(user.id) or not is_gban_enforced(chat.id):
+        return
 
-            if user_member.status in ["creator", "administrator"]:
-                return
+    message = update.effective_message
+    
+    try:
+        user_member = await context.bot.get_chat_member(chat.id, user.id)
+        if user_member.status in ADMIN_STATUSES:
+            return
 
-            if bot_member.status == "administrator" and bot_member.can_restrict_members:
-                
-                await context.bot.ban_chat_member(chat.id, user.id)
-                
-                if bot_member.can_delete_messages:
-                    try:
-                        await message.delete()
-                    except Exception: pass
-                
-                message_text = (
-                    f"⚠️ <b>Alert!</b> This user is globally banned.\n"
-                    f"<i>Enforcing ban in this chat.</i>\n\n"
-                    f"<b>User ID:</b> <code>{user.id}</code>\n"
-                    f"<b>Reason:</b> {safe_escape(gban_reason)}\n"
-                    f"<b>Appeal Chat:</b> {APPEAL_CHAT_USERNAME}"
-                )
-                await context.bot.send_message(chat.id, text=message_text, parse_mode=ParseMode.HTML)
-        except Exception as e:
-            logger.error(f"Failed to take gban action on message for user {user.id} in chat {chat.id}: {e}")
+        bot_member = await context.bot.get_chat_member(chat.id, context.bot.id)
+        if bot_member.status == "administrator" and bot_member.can_restrict_members:
+            
+            await context.bot.ban_chat_member(chat.id, user.id)
+            
+            if bot_member.can_delete_messages:
+                try:
+                    await message.delete()
+                except Exception: pass
+            
+            message_text = (
+                f"⚠️ <b>Alert!</b> This user is globally banned.\n"
+                f"<i>Enforcing ban in this chat.</i>\n\n"
+                f"<b>User ID:</b> <code>{user.id}</code>\n"
+                f"<b>Reason:</b> {safe_escape(gban_reason)}\n"
+                f"<b>Appeal Chat:</b> {APPEAL_CHAT_USERNAME}"
+            )
+            await context.bot.send_message(chat.id, text=message_text, parse_mode=ParseMode.HTML)
+    except Exception as e:
+        logger.error(f"Failed to take gban action on message for user {user.id} in chat {chat.id}: {e}")
 
 @check_module_enabled("globalbans")
 @custom_handler("gban")
@@ -152,7 +148,6 @@ async def gban_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
     prepare_message = f"Ok!"
     await message.reply_html(prepare_message)
-    await asyncio.sleep(1.0)
 
     if add_to_gban(target_entity.id, user_who_gbans.id, reason):
         if chat.type != ChatType.PRIVATE and is_gban_enforced(chat.id):
@@ -273,7 +268,7 @@ async def enforce_gban_command(update: Update, context: ContextTypes.DEFAULT_TYP
     chat = update.effective_chat
     user = update.effective_user
     
-    if not chat or chat.type not in [ChatType.GROUP, ChatType.SUPERGROUP]:
+    if not chat or chat.type not in GROUP_CHAT_TYPES:
         await update.message.reply_text("Huh? You can't set enforcement gban in private chat.")
         return
 
@@ -314,7 +309,7 @@ async def enforce_gban_command(update: Update, context: ContextTypes.DEFAULT_TYP
         
         setting = 1
         try:
-            with sqlite3.connect(DB_NAME) as conn:
+            with get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("UPDATE bot_chats SET enforce_gban = ? WHERE chat_id = ?", (setting, chat.id))
                 if cursor.rowcount == 0:
@@ -340,7 +335,7 @@ async def enforce_gban_command(update: Update, context: ContextTypes.DEFAULT_TYP
         
         setting = 0
         try:
-            with sqlite3.connect(DB_NAME) as conn:
+            with get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("UPDATE bot_chats SET enforce_gban = ? WHERE chat_id = ?", (setting, chat.id))
                 conn.commit()
@@ -8,9 +8,12 @@ from ..core.database import get_chat_join_settings, update_chat_join_settings
 from ..core.utils import _can_user_perform_action, safe_escape, create_user_html_link, send_safe_reply
 from ..core.decorators import check_module_enabled
 from ..core.handlers import custom_handler
+from ..core.constants import MISSING_PERMISSION_TEXTS
 
 logger = logging.getLogger(__name__)
 
+JOIN_MUTE_PERMISSIONS = ChatPermissions(can_send_messages=False)
+
 @check_module_enabled("joinfilters")
 async def check_new_member(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     chat = update.effective_chat
@@ -61,7 +64,7 @@ async def check_new_member(update: Update, context: ContextTypes.DEFAULT_TYPE) -
                             parse_mode=ParseMode.HTML
                         )
                 elif action_to_take == "mute":
-                    await context.bot.restrict_chat_member(chat.id, member.id, ChatPermissions(can_send_messages=False))
+                    await context.bot.restrict_chat_member(chat.id, member.id, JOIN_MUTE_PERMISSIONS)
                     await context.bot.send_message(
                         chat_id=chat.id,
                         text=f"User {user_link} has been <b>muted</b>. {reason}",
@@ -79,7 +82,7 @@ async def add_filter_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         await send_safe_reply(update, context, text="Huh? You can't add joinfilter in private chat...")
         return
   
-    if not await _can_user_perform_action(update, context, 'can_manage_chat', "Why should I listen to a person with no privileges for this? You need 'can_manage_chat' permission.", allow_bot_privileged_override=False): return
+    if not await _can_user_perform_action(update, context, 'can_manage_chat', MISSING_PERMISSION_TEXTS['can_manage_chat'], allow_bot_privileged_override=False): return
     if not context.args: await update.message.reply_html("Usage: /addjoinfilter &lt;filter&gt;"); return
     
     chat_id = update.effective_chat.id
@@ -104,7 +107,7 @@ async def remove_filter_command(update: Update, context: ContextTypes.DEFAULT_TY
         await send_safe_reply(update, context, text="Huh? You can't remove joinfilter in private chat...")
         return
   
-    if not await _can_user_perform_action(update, context, 'can_manage_chat', "Why should I listen to a person with no privileges for this? You need 'can_manage_chat' permission.", allow_bot_privileged_override=False): return
+    if not await _can_user_perform_action(update, context, 'can_manage_chat', MISSING_PERMISSION_TEXTS['can_manage_chat'], allow_bot_privileged_override=False): return
     if not context.args: await update.message.reply_html("Usage: /deljoinfilter &lt;filter&gt;"); return
 
     chat_id = update.effective_chat.id
@@ -129,22 +132,24 @@ async def list_filters_command(update: Update, context: ContextTypes.DEFAULT_TYP
         await send_safe_reply(update, context, text="Huh? You can't list joinfilters in private chat...")
         return
   
-    if not await _can_user_perform_action(update, context, 'can_manage_chat', "Why should I listen to a person with no privileges for this? You need 'can_manage_chat' permission.", allow_bot_privileged_override=True): return
+    if not await _can_user_perform_action(update, context, 'can_manage_chat', MISSING_PERMISSION_TEXTS['can_manage_chat'], allow_bot_privileged_override=True): return
     
     filters, action = get_chat_join_settings(update.effective_chat.id)
     
-    message = "<b>Join Filter Settings</b>\n\n"
-    message += "This feature automatically takes action on users who join with a name or username containing specific keywords.\n\n"
-    message += f"<b>Action on trigger:</b> <code>{action.upper()}</code>\n"
-    message += "<i>Use /setjoinaction to change.</i>\n\n"
+    message_parts = [
+        "<b>Join Filter Settings</b>\n\n",
+        "This feature automatically takes action on users who join with a name or username containing specific keywords.\n\n",
+        f"<b>Action on trigger:</b> <code>{action.upper()}</code>\n",
+        "<i>Use /setjoinaction to change.</i>\n\n",
+    ]
     
     if not filters:
-        message += "There are no active join filters in this chat."
+        message_parts.append("There are no active join filters in this chat.")
     else:
-        message += "<b>Filtered keywords:</b>\n"
-        message += " • ".join(f"<code>{safe_escape(f)}</code>" for f in filters)
+        message_parts.append("<b>Filtered keywords:</b>\n")
+        message_parts.append(" • ".join(f"<code>{safe_escape(f)}</code>" for f in filters))
 
-    await update.message.reply_html(message)
+    await update.message.reply_html("".join(message_parts))
 
 @check_module_enabled("joinfilters")
 @custom_handler("setjoinaction")
@@ -155,7 +160,7 @@ async def set_action_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         await send_safe_reply(update, context, text="Huh? You can't set joinfilter action in private chat...")
         return
   
-    if not await _can_user_perform_action(update, context, 'can_manage_chat', "Why should I listen to a person with no privileges for this? You need 'can_manage_chat' permission.", allow_bot_privileged_override=False): return
+    if not await _can_user_perform_action(update, context, 'can_manage_chat', MISSING_PERMISSION_TEXTS['can_manage_chat'], allow_bot_privileged_override=False): return
     
     actions = ['ban', 'kick', 'mute']
     action_to_set = context.args[0].lower() if context.args else None
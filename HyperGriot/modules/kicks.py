@@ -1,30 +1,42 @@
+import asyncio
 import logging
 from telegram import Update, User
-from telegram.constants import ChatType, ChatMemberStatus, ParseMode
+from telegram.constants import ChatType, ParseMode
 from telegram.error import TelegramError
 from telegram.ext import Application, CommandHandler, ContextTypes
 
-from ..core.utils import _can_user_perform_action, resolve_user_with_telethon, create_user_html_link, send_safe_reply, safe_escape, is_entity_a_user
-from ..core.decorators import check_module_enabled, command_control
+from ..core.utils import _can_user_perform_action, resolve_user_with_telethon, create_user_html_link, send_safe_reply, safe_escape, is_entity_a_user, ADMIN_STATUSES
+from ..core.decorators import check_module_enabled, group_only, command_control
 from ..core.handlers import custom_handler
+from ..core.constants import MISSING_PERMISSION_TEXTS
 
 logger = logging.getLogger(__name__)
 
+async def _kick_and_report(update: Update, context: ContextTypes.DEFAULT_TYPE, chat_id: int, user_id: int, report_text: str) -> None:
+    """Bans to remove the member, then lifts the ban while the report is being sent."""
+    await context.bot.ban_chat_member(chat_id=chat_id, user_id=user_id)
+    unban_result, reply_result = await asyncio.gather(
+        context.bot.unban_chat_member(chat_id=chat_id, user_id=user_id, only_if_banned=True),
+        send_safe_reply(update, context, text=report_text, parse_mode=ParseMode.HTML),
+        return_exceptions=True
+    )
+    if isinstance(reply_result, Exception):
+        logger.error(f"Failed to send kick report in chat {chat_id}: {reply_result}")
+    if isinstance(unban_result, Exception):
+        logger.error(f"Failed to lift kick ban for user {user_id} in chat {chat_id}: {unban_result}")
+        await send_safe_reply(update, context, text=f"⚠️ The user was removed but is still banned: {safe_escape(str(unban_result))}")
 
 # --- KICK COMMAND FUNCTIONS ---
 @check_module_enabled("kicks")
 @custom_handler("kick")
+@group_only("Huh? You can't kick in private chat...")
 async def kick_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     chat = update.effective_chat
     user_who_kicks = update.effective_user
     message = update.message
     if not message: return
 
-    if chat.type == ChatType.PRIVATE:
-        await send_safe_reply(update, context, text="Huh? You can't kick in private chat...")
-        return
-
-    if not await _can_user_perform_action(update, context, 'can_restrict_members', "Why should I listen to a person with no privileges for this? You need 'can_restrict_members' permission."):
+    if not await _can_user_perform_action(update, context, 'can_restrict_members', MISSING_PERMISSION_TEXTS['can_restrict_members']):
         return
 
     target_user: User | None = None
@@ -72,7 +84,7 @@ async def kick_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
     try:
         target_chat_member = await context.bot.get_chat_member(chat.id, target_user.id)
-        if target_chat_member.status in ["creator", "administrator"]:
+        if target_chat_member.status in ADMIN_STATUSES:
             await send_safe_reply(update, context, text="Chat Creator and Administrators cannot be kicked.")
             return
     except TelegramError as e:
@@ -83,29 +95,23 @@ async def kick_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         logger.warning(f"Could not get target's chat member status for /kick: {e}")
 
     try:
-        await context.bot.ban_chat_member(chat_id=chat.id, user_id=target_user.id)
-        await context.bot.unban_chat_member(chat_id=chat.id, user_id=target_user.id, only_if_banned=True)
-
         user_display_name = create_user_html_link(target_user)
         response_lines = ["Success: User Kicked", f"<b>• User:</b> {user_display_name} [<code>{target_user.id}</code>]", f"<b>• Reason:</b> {safe_escape(reason)}"]
-        await send_safe_reply(update, context, text="\n".join(response_lines), parse_mode=ParseMode.HTML)
+        await _kick_and_report(update, context, chat.id, target_user.id, "\n".join(response_lines))
     except TelegramError as e:
         await send_safe_reply(update, context, text=f"Failed to kick user: {safe_escape(str(e))}")
 
 @check_module_enabled("kicks")
 @custom_handler("dkick")
+@group_only("Huh? You can't dkick in private chat...")
 async def dkick_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     chat = update.effective_chat
     user_who_kicks = update.effective_user
     message = update.message
     if not message: return
 
-    if chat.type == ChatType.PRIVATE:
-        await send_safe_reply(update, context, text="Huh? You can't dkick in private chat...")
-        return
-
-    can_kick = await _can_user_perform_action(update, context, 'can_restrict_members', "Why should I listen to a person with no privileges for this? You need 'can_restrict_members' permission.")
-    can_del = await _can_user_perform_action(update, context, 'can_delete_messages', "Why should I listen to a person with no privileges for this? You need 'can_delete_messages' permission.")
+    can_kick = await _can_user_perform_action(update, context, 'can_restrict_members', MISSING_PERMISSION_TEXTS['can_restrict_members'])
+    can_del = await _can_user_perform_action(update, context, 'can_delete_messages', MISSING_PERMISSION_TEXTS['can_delete_messages'])
     if not (can_kick and can_del):
         return
 
@@ -127,7 +133,7 @@ async def dkick_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
 
     try:
         member = await chat.get_member(target_user.id)
-        if member.status in [ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER]:
+        if member.status in ADMIN_STATUSES:
             await send_safe_reply(update, context, text="Chat Creator and Administrators cannot be kicked.")
             return
     except TelegramError: pass
@@ -136,15 +142,12 @@ async def dkick_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     try:
         await message.reply_to_message.delete()
         
-        await context.bot.ban_chat_member(chat_id=chat.id, user_id=target_user.id)
-        await context.bot.unban_chat_member(chat_id=chat.id, user_id=target_user.id, only_if_banned=True)
-
         display_name = create_user_html_link(target_user)
         response_lines = ["Success: User Kicked"]
         response_lines.append(f"<b>• User:</b> {display_name} [<code>{target_user.id}</code>]")
         response_lines.append(f"<b>• Reason:</b> {safe_escape(reason)}")
         
-        await send_safe_reply(update, context, text="\n".join(response_lines), parse_mode=ParseMode.HTML)
+        await _kick_and_report(update, context, chat.id, target_user.id, "\n".join(response_lines))
 
     except Exception as e:
         await send_safe_reply(update, context, text=f"❌ Failed to kick user (but their message was deleted). Error: {safe_escape(str(e))}")
@@ -152,6 +155,7 @@ async def dkick_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
 @check_module_enabled("kicks")
 @command_control("kickme")
 @custom_handler("kickme")
+@group_only("Huh? You can't kick yourself in private chat...")
 async def kickme_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     chat = update.effective_chat
     message = update.effective_message
@@ -160,10 +164,6 @@ async def kickme_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     if not user_to_kick:
         return
 
-    if chat.type == ChatType.PRIVATE:
-        await update.message.reply_text("Huh? You can't kick yourself in private chat...")
-        return
-
     sender_chat = message.sender_chat
     if sender_chat and sender_chat.type == ChatType.CHANNEL:
         await message.reply_text("🧐 Anonymous admins (channels) cannot use the /kickme command.")
@@ -1,3 +1,4 @@
+import functools
 import logging
 import random
 import telegram
@@ -7,17 +8,40 @@ from telegram.error import TelegramError
 from telegram.ext import Application, CommandHandler, ContextTypes, CallbackQueryHandler
 
 from ..config import OWNER_ID, APPEAL_CHAT_USERNAME, LOG_CHAT_USERNAME
-from ..core.database import get_rules, is_dev_user, is_sudo_user, is_support_user, is_whitelisted, get_blacklist_reason, get_gban_reason, is_gban_enforced, update_user_in_db
-from ..core.utils import is_privileged_user, safe_escape, resolve_user_with_telethon, create_user_html_link, send_safe_reply, is_owner_or_dev
-from ..core.constants import START_TEXT, HELP_MAIN_TEXT, GENERAL_COMMANDS, USER_CHAT_INFO, MODERATION_COMMANDS, ADMIN_TOOLS, NOTES, CHAT_SETTINGS, CHAT_SECURITY, AI_COMMANDS, FUN_COMMANDS, ADMIN_NOTE_TEXT, SUPPORT_COMMANDS_TEXT, SUDO_COMMANDS_TEXT, DEVELOPER_COMMANDS_TEXT, OWNER_COMMANDS_TEXT, FILTERS
+from ..core.database import get_rules, get_user_role, is_whitelisted, get_blacklist_reason, get_gban_reason, is_gban_enforced, update_user_in_db
+from ..core.utils import is_privileged_user, is_sudo_or_higher, safe_escape, resolve_user_with_telethon, create_user_html_link, send_safe_reply, ADMIN_STATUSES, GROUP_CHAT_TYPES, GROUP_OR_CHANNEL_CHAT_TYPES
+from ..core.constants import START_TEXT, HELP_MAIN_TEXT, GENERAL_COMMANDS, USER_CHAT_INFO, MODERATION_COMMANDS, ADMIN_TOOLS, NOTES, CHAT_SETTINGS, CHAT_SECURITY, AI_COMMANDS, FUN_COMMANDS, PRIVILEGED_HELP_TEXTS, FILTERS
 from ..core.decorators import check_module_enabled, command_control
 from ..core.handlers import custom_handler
 
 logger = logging.getLogger(__name__)
 
+HELP_SECTION_TEXTS = {
+    "menu_help_general": f"<b>🔹 General Commands</b>\n{GENERAL_COMMANDS}",
+    "menu_help_userinfo": f"<b>ℹ️ User & Chat Info</b>\n{USER_CHAT_INFO}",
+    "menu_help_moderation": f"<b>🛡️ Moderation Commands</b>\n{MODERATION_COMMANDS}",
+    "menu_help_admin": f"<b>👑 Admin Tools</b>\n{ADMIN_TOOLS}",
+    "menu_help_notes": f"<b>📝 Notes</b>\n{NOTES}",
+    "menu_help_settings": f"<b>⚙️ Chat Settings</b>\n{CHAT_SETTINGS}",
+    "menu_help_filters": f"<b>🧲 Filters Commands</b>\n{FILTERS}",
+    "menu_help_security": f"<b>🔒 Chat Security</b>\n{CHAT_SECURITY}",
+    "menu_help_ai": f"<b>🤖 AI Commands</b>\n{AI_COMMANDS}",
+    "menu_help_fun": f"<b>🤣 Fun Commands</b>\n{FUN_COMMANDS}",
+}
+
+MEMBER_STATUS_DISPLAY = {
+    "creator": "<code>Creator</code>",
+    "administrator": "<code>Admin</code>",
+    "kicked": "<code>Banned</code>",
+    "left": "<code>Not in chat</code>",
+    "restricted": "<code>Member (Excepted)</code>",
+    "member": "<code>Member</code>",
+    "not_a_member": "<code>Not in chat</code>",
+}
+
 # --- HELPERS ---
-def get_start_keyboard(context: ContextTypes.DEFAULT_TYPE):
-    bot_username = context.bot.username
+@functools.cache
+def _build_start_keyboard(bot_username: str) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup([
         [
             InlineKeyboardButton("📚 Commands", url=f"https://t.me/{bot_username}?start=help"),
@@ -31,34 +55,41 @@ def get_start_keyboard(context: ContextTypes.DEFAULT_TYPE):
         ]
     ])
 
-def get_help_main_keyboard():
-    return InlineKeyboardMarkup([
-        [
-            InlineKeyboardButton("🔹 General", callback_data="menu_help_general"),
-            InlineKeyboardButton("ℹ️ User & Chat", callback_data="menu_help_userinfo")
-        ],
-        [
-            InlineKeyboardButton("🛡️ Moderation", callback_data="menu_help_moderation"),
-            InlineKeyboardButton("👑 Admin Tools", callback_data="menu_help_admin")
-        ],
-        [
-            InlineKeyboardButton("📝 Notes", callback_data="menu_help_notes"),
-            InlineKeyboardButton("⚙️ Settings", callback_data="menu_help_settings"),
-            InlineKeyboardButton("🧲 Filters", callback_data="menu_help_filters")
-        ],
-        [
-            InlineKeyboardButton("🔒 Security", callback_data="menu_help_security"),
-            InlineKeyboardButton("🤖 AI", callback_data="menu_help_ai"),
-            InlineKeyboardButton("🤣 FUN", callback_data="menu_help_fun")
-        ],
-        [InlineKeyboardButton("⬅️ Back to Main Menu", callback_data="menu_start")]
-    ])
+def get_start_keyboard(context: ContextTypes.DEFAULT_TYPE):
+    return _build_start_keyboard(context.bot.username)
 
-def get_back_to_help_keyboard():
+@functools.cache
+def _build_help_link_keyboard(bot_username: str) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup([[
-        InlineKeyboardButton("⬅️ Back to Help Categories", callback_data="menu_help_main")
+        InlineKeyboardButton("📬 Open Help Menu", url=f"https://t.me/{bot_username}?start=help")
     ]])
 
+HELP_MAIN_KEYBOARD = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("🔹 General", callback_data="menu_help_general"),
+        InlineKeyboardButton("ℹ️ User & Chat", callback_data="menu_help_userinfo")
+    ],
+    [
+        InlineKeyboardButton("🛡️ Moderation", callback_data="menu_help_moderation"),
+        InlineKeyboardButton("👑 Admin Tools", callback_data="menu_help_admin")
+    ],
+    [
+        InlineKeyboardButton("📝 Notes", callback_data="menu_help_notes"),
+        InlineKeyboardButton("⚙️ Settings", callback_data="menu_help_settings"),
+        InlineKeyboardButton("🧲 Filters", callback_data="menu_help_filters")
+    ],
+    [
+        InlineKeyboardButton("🔒 Security", callback_data="menu_help_security"),
+        InlineKeyboardButton("🤖 AI", callback_data="menu_help_ai"),
+        InlineKeyboardButton("🤣 FUN", callback_data="menu_help_fun")
+    ],
+    [InlineKeyboardButton("⬅️ Back to Main Menu", callback_data="menu_start")]
+])
+
+BACK_TO_HELP_KEYBOARD = InlineKeyboardMarkup([[
+    InlineKeyboardButton("⬅️ Back to Help Categories", callback_data="menu_help_main")
+]])
+
 # --- MISCELLANEOUS COMMAND FUNCTIONS ---
 @check_module_enabled("misc")
 @custom_handler("start")
@@ -72,7 +103,7 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         
         
         if arg == 'help':
-            await message.reply_html(HELP_MAIN_TEXT, reply_markup=get_help_main_keyboard())
+            await message.reply_html(HELP_MAIN_TEXT, reply_markup=HELP_MAIN_KEYBOARD)
             return
             
         elif arg.startswith('rules_'):
@@ -91,24 +122,8 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
             if not is_privileged_user(update.effective_user.id):
                 return
             
-            help_parts = []
-
-            if is_sudo_user(user.id) or is_dev_user(user.id) or user.id == OWNER_ID:
-                help_parts.append(ADMIN_NOTE_TEXT)
-            
-            if is_support_user(user.id) or is_sudo_user(user.id) or is_dev_user(user.id) or user.id == OWNER_ID:
-                help_parts.append(SUPPORT_COMMANDS_TEXT)
-
-            if is_sudo_user(user.id) or is_dev_user(user.id) or user.id == OWNER_ID:
-                help_parts.append(SUDO_COMMANDS_TEXT)
-
-            if is_dev_user(user.id) or user.id == OWNER_ID:
-                help_parts.append(DEVELOPER_COMMANDS_TEXT)
-
-            if user.id == OWNER_ID:
-                help_parts.append(OWNER_COMMANDS_TEXT)
-            
-            final_sudo_help = "".join(help_parts)
+            role = "owner" if user.id == OWNER_ID else get_user_role(user.id)
+            final_sudo_help = PRIVILEGED_HELP_TEXTS.get(role, "")
             
             if final_sudo_help:
                 await update.message.reply_html(final_sudo_help, disable_web_page_preview=True)
@@ -123,14 +138,11 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     if not message: return
 
     if update.effective_chat.type == ChatType.PRIVATE:
-        await message.reply_html(HELP_MAIN_TEXT, reply_markup=get_help_main_keyboard())
+        await message.reply_html(HELP_MAIN_TEXT, reply_markup=HELP_MAIN_KEYBOARD)
     else:
-        bot_username = context.bot.username
         await message.reply_text(
             "I've sent you the help menu in a private message.",
-            reply_markup=InlineKeyboardMarkup([[
-                InlineKeyboardButton("📬 Open Help Menu", url=f"https://t.me/{bot_username}?start=help")
-            ]])
+            reply_markup=_build_help_link_keyboard(context.bot.username)
         )
 
 async def menu_button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -139,29 +151,21 @@ async def menu_button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE
 
     command = query.data
 
-    menu_map = {
-        "menu_start": (START_TEXT, get_start_keyboard(context)),
-        "menu_help_main": (HELP_MAIN_TEXT, get_help_main_keyboard()),
-        "menu_help_general": (f"<b>🔹 General Commands</b>\n{GENERAL_COMMANDS}", get_back_to_help_keyboard()),
-        "menu_help_userinfo": (f"<b>ℹ️ User & Chat Info</b>\n{USER_CHAT_INFO}", get_back_to_help_keyboard()),
-        "menu_help_moderation": (f"<b>🛡️ Moderation Commands</b>\n{MODERATION_COMMANDS}", get_back_to_help_keyboard()),
-        "menu_help_admin": (f"<b>👑 Admin Tools</b>\n{ADMIN_TOOLS}", get_back_to_help_keyboard()),
-        "menu_help_notes": (f"<b>📝 Notes</b>\n{NOTES}", get_back_to_help_keyboard()),
-        "menu_help_settings": (f"<b>⚙️ Chat Settings</b>\n{CHAT_SETTINGS}", get_back_to_help_keyboard()),
-        "menu_help_filters": (f"<b>🧲 Filters Commands</b>\n{FILTERS}", get_back_to_help_keyboard()),
-        "menu_help_security": (f"<b>🔒 Chat Security</b>\n{CHAT_SECURITY}", get_back_to_help_keyboard()),
-        "menu_help_ai": (f"<b>🤖 AI Commands</b>\n{AI_COMMANDS}", get_back_to_help_keyboard()),
-        "menu_help_fun": (f"<b>🤣 Fun Commands</b>\n{FUN_COMMANDS}", get_back_to_help_keyboard()),
-    }
-
-    if command in menu_map:
-        text, keyboard = menu_map[command]
-        await query.edit_message_text(
-            text,
-            parse_mode=ParseMode.HTML,
-            reply_markup=keyboard,
-            disable_web_page_preview=True
-        )
+    if command == "menu_start":
+        text, keyboard = START_TEXT, get_start_keyboard(context)
+    elif command == "menu_help_main":
+        text, keyboard = HELP_MAIN_TEXT, HELP_MAIN_KEYBOARD
+    elif command in HELP_SECTION_TEXTS:
+        text, keyboard = HELP_SECTION_TEXTS[command], BACK_TO_HELP_KEYBOARD
+    else:
+        return
+
+    await query.edit_message_text(
+        text,
+        parse_mode=ParseMode.HTML,
+        reply_markup=keyboard,
+        disable_web_page_preview=True
+    )
 
 @check_module_enabled("misc")
 @command_control("misc")
@@ -231,34 +235,15 @@ def format_entity_info(entity: Chat | User,
 
         if chat_member_obj:
             status = chat_member_obj.status
-            display_status = ""
+            display_status = MEMBER_STATUS_DISPLAY.get(status, "")
     
-            if status == "creator":
-                display_status = "<code>Creator</code>"
-            elif status == "administrator":
-                display_status = "<code>Admin</code>"
-            elif status == "kicked":
-                display_status = "<code>Banned</code>"
-            elif status == "left":
-                display_status = "<code>Not in chat</code>"
-            elif status == "restricted":
-                if getattr(chat_member_obj, 'can_send_messages', True) is False:
-                    display_status = "<code>Muted</code>"
-                else:
-                    display_status = "<code>Member (Excepted)</code>"
-            elif status == "member":
-                if getattr(chat_member_obj, 'can_send_messages', True) is False:
-                     display_status = "<code>Muted</code>"
-                else:
-                     display_status = "<code>Member</code>"
-
-            elif status == "not_a_member":
-                display_status = "<code>Not in chat</code>"
+            if status in ("restricted", "member") and getattr(chat_member_obj, 'can_send_messages', True) is False:
+                display_status = "<code>Muted</code>"
             
             if display_status:
                 info_lines.append(f"<b>• Status:</b> {display_status}")
 
-            if status in ["creator", "administrator"]:
+            if status in ADMIN_STATUSES:
                 custom_title = getattr(chat_member_obj, 'custom_title', None)
                 if custom_title: 
                     info_lines.append(f"<b>• Title:</b> <code>{safe_escape(custom_title)}</code>")
@@ -307,7 +292,7 @@ def format_entity_info(entity: Chat | User,
         else:
             info_lines.append(f"<b>• Permalink:</b> Private channel (no public link)")
         
-    elif entity_chat_type in [ChatType.GROUP, ChatType.SUPERGROUP]:
+    elif entity_chat_type in GROUP_CHAT_TYPES:
         chat = entity
         title = safe_escape(chat.title or f"{entity_chat_type.capitalize()} {chat.id}")
         info_lines.append(f"ℹ️ Entity <code>{chat.id}</code> is a <b>{entity_chat_type.capitalize()}</b> ({title}).")
@@ -352,15 +337,16 @@ async def entity_info_command(update: Update, context: ContextTypes.DEFAULT_TYPE
 
     is_target_bot_flag = (target_entity.id == context.bot.id)
     is_target_owner_flag = (target_entity.id == OWNER_ID)
-    is_target_dev_flag = is_dev_user(target_entity.id)
-    is_target_sudo_flag = is_sudo_user(target_entity.id)
-    is_target_support_flag = is_support_user(target_entity.id)
+    target_role = get_user_role(target_entity.id)
+    is_target_dev_flag = target_role == "dev"
+    is_target_sudo_flag = target_role == "sudo"
+    is_target_support_flag = target_role == "support"
     is_target_whitelist_flag = is_whitelisted(target_entity.id)
     blacklist_reason_str = get_blacklist_reason(target_entity.id)
     gban_reason_str = get_gban_reason(target_entity.id)
     chat_member_obj: telegram.ChatMember | None = None
     
-    if isinstance(target_entity, User) and update.effective_chat.type in [ChatType.GROUP, ChatType.SUPERGROUP]:
+    if isinstance(target_entity, User) and update.effective_chat.type in GROUP_CHAT_TYPES:
         try:
             chat_member_obj = await context.bot.get_chat_member(update.effective_chat.id, target_entity.id)
         except TelegramError:
@@ -432,7 +418,7 @@ async def chat_info_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         await update.message.reply_text("Could not get chat information for some reason.")
         return
 
-    if chat.type not in [ChatType.GROUP, ChatType.SUPERGROUP, ChatType.CHANNEL]:
+    if chat.type not in GROUP_OR_CHANNEL_CHAT_TYPES:
         await update.message.reply_text("This command shows stats for groups, supergroups, or channels.")
         return
 
@@ -480,7 +466,7 @@ async def chat_info_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         logger.error(f"Unexpected error in get_chat_member_count for /chatstats in {full_chat_object.id}: {e}", exc_info=True)
         info_lines.append(f"<b>• Total Members:</b> N/A (Unexpected error)")
 
-    if chat.type in [ChatType.GROUP, ChatType.SUPERGROUP]:
+    if chat.type in GROUP_CHAT_TYPES:
         status_line = "<b>• Gban Enforcement:</b> "
         
         if not is_gban_enforced(chat.id):
@@ -504,7 +490,7 @@ async def chat_info_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
 @custom_handler("ginfo")
 async def global_info_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     user = update.effective_user
-    if not (is_owner_or_dev(user.id) or is_sudo_user(user.id)):
+    if not is_sudo_or_higher(user.id):
         logger.warning(f"Unauthorized /cinfo attempt by user {user.id}.")
         return
 
@@ -551,7 +537,7 @@ async def global_info_command(update: Update, context: ContextTypes.DEFAULT_TYPE
         await update.message.reply_text("Couldn't determine the chat to inspect.")
         return
 
-    if chat_object_for_details.type not in [ChatType.GROUP, ChatType.SUPERGROUP, ChatType.CHANNEL]:
+    if chat_object_for_details.type not in GROUP_OR_CHANNEL_CHAT_TYPES:
         await update.message.reply_text("This command provides info about groups, supergroups, or channels.")
         return
 
@@ -1,31 +1,41 @@
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from telegram import Update, User, ChatPermissions
-from telegram.constants import ChatType, ChatMemberStatus, ParseMode
+from telegram.constants import ChatMemberStatus, ParseMode
 from telegram.error import TelegramError
 from telegram.ext import Application, CommandHandler, ContextTypes, ChatMemberHandler
 
-from ..core.utils import _can_user_perform_action, resolve_user_with_telethon, parse_duration_to_timedelta, create_user_html_link, send_safe_reply, safe_escape, send_critical_log, is_entity_a_user
-from ..core.decorators import check_module_enabled
+from ..core.utils import _can_user_perform_action, resolve_user_with_telethon, parse_duration_to_timedelta, create_user_html_link, send_safe_reply, safe_escape, send_critical_log, is_entity_a_user, ADMIN_STATUSES
+from ..core.decorators import check_module_enabled, group_only
 from ..core.handlers import custom_handler
+from ..core.constants import MISSING_PERMISSION_TEXTS
 
 logger = logging.getLogger(__name__)
 
+MUTE_PERMISSIONS = ChatPermissions(
+    can_send_messages=False, can_send_audios=False, can_send_documents=False,
+    can_send_photos=False, can_send_videos=False, can_send_video_notes=False,
+    can_send_voice_notes=False, can_send_polls=False, can_send_other_messages=False,
+    can_add_web_page_previews=False
+)
+UNMUTE_PERMISSIONS = ChatPermissions(
+    can_send_messages=True, can_send_audios=True, can_send_documents=True,
+    can_send_photos=True, can_send_videos=True, can_send_video_notes=True,
+    can_send_voice_notes=True, can_send_polls=True, can_send_other_messages=True,
+    can_add_web_page_previews=True
+)
 
 # --- MUTE COMMAND FUNCTIONS ---
 @check_module_enabled("mutes")
 @custom_handler("mute")
+@group_only("Huh? You can't mute in private chat...")
 async def mute_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     chat = update.effective_chat
     user_who_mutes = update.effective_user
     message = update.message
     if not message: return
 
-    if chat.type == ChatType.PRIVATE:
-        await send_safe_reply(update, context, text="Huh? You can't mute in private chat...")
-        return
-
-    if not await _can_user_perform_action(update, context, 'can_restrict_members', "Why should I listen to a person with no privileges for this? You need 'can_restrict_members' permission."):
+    if not await _can_user_perform_action(update, context, 'can_restrict_members', MISSING_PERMISSION_TEXTS['can_restrict_members']):
         return
 
     target_user: User | None = None
@@ -64,10 +74,11 @@ async def mute_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         return
         
     duration_str: str | None = None
+    duration_td: timedelta | None = None
     reason: str = "No reason provided."
     if args_after_target:
-        potential_duration_td = parse_duration_to_timedelta(args_after_target[0])
-        if potential_duration_td:
+        duration_td = parse_duration_to_timedelta(args_after_target[0])
+        if duration_td:
             duration_str = args_after_target[0]
             if len(args_after_target) > 1:
                 reason = " ".join(args_after_target[1:])
@@ -83,7 +94,7 @@ async def mute_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
     try:
         member = await chat.get_member(target_user.id)
-        if member.status in [ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER]:
+        if member.status in ADMIN_STATUSES:
             await send_safe_reply(update, context, text="Chat Creator and Administrators cannot be muted.")
             return
     except TelegramError as e:
@@ -93,12 +104,10 @@ async def mute_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
             return
         logger.warning(f"Could not get target's chat member status for /mute: {e}")
 
-    duration_td = parse_duration_to_timedelta(duration_str)
-    permissions_to_set_for_mute = ChatPermissions(can_send_messages=False, can_send_audios=False, can_send_documents=False, can_send_photos=False, can_send_videos=False, can_send_video_notes=False, can_send_voice_notes=False, can_send_polls=False, can_send_other_messages=False, can_add_web_page_previews=False)
     until_date_dt = datetime.now(timezone.utc) + duration_td if duration_td else None
 
     try:
-        await context.bot.restrict_chat_member(chat_id=chat.id, user_id=target_user.id, permissions=permissions_to_set_for_mute, until_date=until_date_dt, use_independent_chat_permissions=True)
+        await context.bot.restrict_chat_member(chat_id=chat.id, user_id=target_user.id, permissions=MUTE_PERMISSIONS, until_date=until_date_dt, use_independent_chat_permissions=True)
         user_display_name = create_user_html_link(target_user)
 
         response_lines = ["Success: User Muted"]
@@ -112,18 +121,15 @@ async def mute_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
 @check_module_enabled("mutes")
 @custom_handler("dmute")
+@group_only("Huh? You can't dmute in private chat...")
 async def dmute_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     chat = update.effective_chat
     user_who_mutes = update.effective_user
     message = update.message
     if not message: return
 
-    if chat.type == ChatType.PRIVATE:
-        await send_safe_reply(update, context, text="Huh? You can't dmute in private chat...")
-        return
-
-    can_mute = await _can_user_perform_action(update, context, 'can_restrict_members', "Why should I listen to a person with no privileges for this? You need 'can_restrict_members' permission.")
-    can_del = await _can_user_perform_action(update, context, 'can_delete_messages', "Why should I listen to a person with no privileges for this? You need 'can_delete_messages' permission.")
+    can_mute = await _can_user_perform_action(update, context, 'can_restrict_members', MISSING_PERMISSION_TEXTS['can_restrict_members'])
+    can_del = await _can_user_perform_action(update, context, 'can_delete_messages', MISSING_PERMISSION_TEXTS['can_delete_messages'])
     if not (can_mute and can_del):
         return
 
@@ -145,7 +151,7 @@ async def dmute_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
 
     try:
         member = await chat.get_member(target_user.id)
-        if member.status in [ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER]:
+        if member.status in ADMIN_STATUSES:
             await send_safe_reply(update, context, text="Chat Creator and Administrators cannot be muted.")
             return
     except TelegramError: pass
@@ -153,8 +159,7 @@ async def dmute_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     try:
         await message.reply_to_message.delete()
         
-        permissions_to_set = ChatPermissions(can_send_messages=False, can_send_audios=False, can_send_documents=False, can_send_photos=False, can_send_videos=False, can_send_video_notes=False, can_send_voice_notes=False, can_send_polls=False, can_send_other_messages=False, can_add_web_page_previews=False)
-        await context.bot.restrict_chat_member(chat_id=chat.id, user_id=target_user.id, permissions=permissions_to_set)
+        await context.bot.restrict_chat_member(chat_id=chat.id, user_id=target_user.id, permissions=MUTE_PERMISSIONS)
 
         display_name = create_user_html_link(target_user)
         response_lines = ["Success: User Muted"]
@@ -167,17 +172,14 @@ async def dmute_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
 
 @check_module_enabled("mutes")
 @custom_handler("tmute")
+@group_only("Huh? You can't tmute in private chat...")
 async def tmute_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     chat = update.effective_chat
     user_who_mutes = update.effective_user
     message = update.message
     if not message: return
 
-    if chat.type == ChatType.PRIVATE:
-        await send_safe_reply(update, context, text="Huh? You can't tmute in private chat...")
-        return
-
-    if not await _can_user_perform_action(update, context, 'can_restrict_members', "Why should I listen to a person with no privileges for this? You need 'can_restrict_members' permission."):
+    if not await _can_user_perform_action(update, context, 'can_restrict_members', MISSING_PERMISSION_TEXTS['can_restrict_members']):
         return
 
     target_user: User | None = None
@@ -234,14 +236,13 @@ async def tmute_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
 
     try:
         member = await chat.get_member(target_user.id)
-        if member.status in [ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER]:
+        if member.status in ADMIN_STATUSES:
             await send_safe_reply(update, context, text="Chat Creator and Administrators cannot be muted.")
             return
     except TelegramError: pass
 
     try:
-        permissions_to_set = ChatPermissions(can_send_messages=False, can_send_audios=False, can_send_documents=False, can_send_photos=False, can_send_videos=False, can_send_video_notes=False, can_send_voice_notes=False, can_send_polls=False, can_send_other_messages=False, can_add_web_page_previews=False)
-        await context.bot.restrict_chat_member(chat_id=chat.id, user_id=target_user.id, permissions=permissions_to_set, until_date=until_date_dt)
+        await context.bot.restrict_chat_member(chat_id=chat.id, user_id=target_user.id, permissions=MUTE_PERMISSIONS, until_date=until_date_dt)
         
         display_name = create_user_html_link(target_user)
         response_lines = ["Success: User Muted"]
@@ -255,16 +256,13 @@ async def tmute_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
 
 @check_module_enabled("mutes")
 @custom_handler("unmute")
+@group_only("Huh? You can't unmute in private chat...")
 async def unmute_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     chat = update.effective_chat
     message = update.message
     if not message: return
 
-    if chat.type == ChatType.PRIVATE:
-        await send_safe_reply(update, context, text="Huh? You can't unmute in private chat...")
-        return
-
-    if not await _can_user_perform_action(update, context, 'can_restrict_members', "Why should I listen to a person with no privileges for this? You need 'can_restrict_members' permission."):
+    if not await _can_user_perform_action(update, context, 'can_restrict_members', MISSING_PERMISSION_TEXTS['can_restrict_members']):
         return
 
     target_user: User | None = None
@@ -296,15 +294,8 @@ async def unmute_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         await send_safe_reply(update, context, text="🧐 Unmute can only be applied to users.")
         return
 
-    permissions_to_restore = ChatPermissions(
-        can_send_messages=True, can_send_audios=True, can_send_documents=True,
-        can_send_photos=True, can_send_videos=True, can_send_video_notes=True,
-        can_send_voice_notes=True, can_send_polls=True, can_send_other_messages=True,
-        can_add_web_page_previews=True
-    )
-
     try:
-        await context.bot.restrict_chat_member(chat_id=chat.id, user_id=target_user.id, permissions=permissions_to_restore, use_independent_chat_permissions=True)
+        await context.bot.restrict_chat_member(chat_id=chat.id, user_id=target_user.id, permissions=UNMUTE_PERMISSIONS, use_independent_chat_permissions=True)
         user_display_name = create_user_html_link(target_user)
         response_lines = ["Success: User Unmuted", f"<b>• User:</b> {user_display_name} [<code>{target_user.id}</code>]"]
         await send_safe_reply(update, context, text="\n".join(response_lines), parse_mode=ParseMode.HTML)
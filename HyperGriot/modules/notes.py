@@ -7,6 +7,7 @@ from ..core.database import add_note, get_all_notes, remove_note, get_note
 from ..core.utils import _can_user_perform_action, send_safe_reply, safe_escape
 from ..core.decorators import check_module_enabled, command_control
 from ..core.handlers import custom_handler
+from ..core.constants import MISSING_PERMISSION_TEXTS
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +24,7 @@ async def save_note_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         await send_safe_reply(update, context, text="Huh? You can't save note in private chat...")
         return
     
-    if not await _can_user_perform_action(update, context, 'can_change_info', "Why should I listen to a person with no privileges for this? You need 'can_change_info' permission.", allow_bot_privileged_override=False):
+    if not await _can_user_perform_action(update, context, 'can_change_info', MISSING_PERMISSION_TEXTS['can_change_info'], allow_bot_privileged_override=False):
         return
         
     note_name = ""
@@ -52,7 +53,7 @@ async def save_note_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
             return
             
         note_name = context.args[0]
-        command = message.text.split()[0]
+        command = message.text.split(None, 1)[0]
         note_name_raw = context.args[0]
         
         content_offset = len(command) + len(note_name_raw) + 2
@@ -97,7 +98,7 @@ async def remove_note_command(update: Update, context: ContextTypes.DEFAULT_TYPE
         await send_safe_reply(update, context, text="Huh? You can't remove notes in private chat...")
         return
     
-    if not await _can_user_perform_action(update, context, 'can_change_info', "Why should I listen to a person with no privileges for this? You need 'can_change_info' permission.", allow_bot_privileged_override=False):
+    if not await _can_user_perform_action(update, context, 'can_change_info', MISSING_PERMISSION_TEXTS['can_change_info'], allow_bot_privileged_override=False):
         return
 
     if not context.args:
@@ -145,7 +146,7 @@ async def handle_note_trigger(update: Update, context: ContextTypes.DEFAULT_TYPE
     if not text.startswith('#') or text.startswith('#/'):
         return
 
-    note_name = text.split()[0][1:].lower()
+    note_name = text.split(None, 1)[0][1:].lower()
     chat_id = update.effective_chat.id
 
     content = get_note(chat_id, note_name)
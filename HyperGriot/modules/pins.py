@@ -1,12 +1,12 @@
 import logging
 from telegram import Update
-from telegram.constants import ChatType, ChatMemberStatus
 from telegram.error import TelegramError
 from telegram.ext import Application, CommandHandler, ContextTypes
 
-from ..core.utils import _can_user_perform_action, send_safe_reply, safe_escape
+from ..core.utils import _can_user_perform_action, send_safe_reply, safe_escape, GROUP_OR_CHANNEL_CHAT_TYPES
 from ..core.decorators import check_module_enabled
 from ..core.handlers import custom_handler
+from ..core.constants import MISSING_PERMISSION_TEXTS
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +19,7 @@ async def pin_message_command(update: Update, context: ContextTypes.DEFAULT_TYPE
     user_who_pins = update.effective_user
     message_to_pin = update.message.reply_to_message
 
-    if chat.type not in [ChatType.GROUP, ChatType.SUPERGROUP, ChatType.CHANNEL]:
+    if chat.type not in GROUP_OR_CHANNEL_CHAT_TYPES:
         await update.message.reply_text("Huh? You can't pin messages in private chat...")
         return
 
@@ -27,17 +27,7 @@ async def pin_message_command(update: Update, context: ContextTypes.DEFAULT_TYPE
         await update.message.reply_text("Please🙏 use this command by replying to the message you want to pin.")
         return
 
-    try:
-        bot_member = await context.bot.get_chat_member(chat.id, context.bot.id)
-        if not (bot_member.status == "administrator" and getattr(bot_member, 'can_pin_messages', False)):
-            await update.message.reply_text("Error: I need to be an admin with the 'can_pin_messages' permission in this chat.")
-            return
-    except TelegramError as e:
-        logger.error(f"Error checking bot's own permissions in /pin for chat {chat.id}: {e}")
-        await update.message.reply_text("Error: Couldn't verify my own permissions in this chat.")
-        return
-        
-    if not await _can_user_perform_action(update, context, 'can_pin_messages', "Why should I listen to a person with no privileges for this? You need 'can_pin_messages' permission."):
+    if not await _can_user_perform_action(update, context, 'can_pin_messages', MISSING_PERMISSION_TEXTS['can_pin_messages']):
         return
 
     disable_notification = True
@@ -80,7 +70,7 @@ async def unpin_message_command(update: Update, context: ContextTypes.DEFAULT_TY
     chat = update.effective_chat
     message_to_unpin = update.message.reply_to_message
 
-    if chat.type not in [ChatType.GROUP, ChatType.SUPERGROUP, ChatType.CHANNEL]:
+    if chat.type not in GROUP_OR_CHANNEL_CHAT_TYPES:
         await update.message.reply_text("Huh? You can't unpin messages in private chat...")
         return
         
@@ -88,17 +78,7 @@ async def unpin_message_command(update: Update, context: ContextTypes.DEFAULT_TY
         await update.message.reply_text("Please reply to a pinned message to unpin it.")
         return
 
-    try:
-        bot_member = await context.bot.get_chat_member(chat.id, context.bot.id)
-        if not (bot_member.status == ChatMemberStatus.ADMINISTRATOR and getattr(bot_member, 'can_pin_messages', False)):
-            await update.message.reply_text("Error: I need to be an admin with 'can_pin_messages' permission in this chat.")
-            return
-    except TelegramError as e:
-        logger.error(f"Error checking bot's own permissions in /unpin for chat {chat.id}: {e}")
-        await update.message.reply_text("Error: Couldn't verify my own permissions in this chat.")
-        return
-
-    if not await _can_user_perform_action(update, context, 'can_pin_messages', "Why should I listen to a person with no privileges for this? You need 'can_pin_messages' permission."):
+    if not await _can_user_perform_action(update, context, 'can_pin_messages', MISSING_PERMISSION_TEXTS['can_pin_messages']):
         return
 
     try:
@@ -113,6 +93,8 @@ async def unpin_message_command(update: Update, context: ContextTypes.DEFAULT_TY
         error_message = str(e)
         if "message not found" in error_message.lower() or "message to unpin not found" in error_message.lower():
              await update.message.reply_text("Error: The message you replied to is not pinned or I can't find it.")
+        elif "not enough rights" in error_message.lower() or "not admin" in error_message.lower():
+            await update.message.reply_text("Error: I need to be an admin with 'can_pin_messages' permission in this chat.")
         else:
             await update.message.reply_text(f"Failed to unpin message: {safe_escape(error_message)}")
     except Exception as e:
@@ -1,12 +1,13 @@
 import logging
 from telegram import Update, User
-from telegram.constants import ChatType, ChatMemberStatus
+from telegram.constants import ChatMemberStatus
 from telegram.error import TelegramError
 from telegram.ext import Application, CommandHandler, ContextTypes
 
-from ..core.utils import _can_user_perform_action, resolve_user_with_telethon, create_user_html_link, safe_escape, is_entity_a_user
-from ..core.decorators import check_module_enabled
+from ..core.utils import _can_user_perform_action, resolve_user_with_telethon, create_user_html_link, safe_escape, is_entity_a_user, invalidate_chat_administrators
+from ..core.decorators import check_module_enabled, group_only
 from ..core.handlers import custom_handler
+from ..core.constants import MISSING_PERMISSION_TEXTS
 
 logger = logging.getLogger(__name__)
 
@@ -14,16 +15,13 @@ logger = logging.getLogger(__name__)
 # --- PROMOTION/DEMOTION COMMAND FUNCTIONS ---
 @check_module_enabled("promotes")
 @custom_handler("promote")
+@group_only("Huh? You can't promote in private chat....")
 async def promote_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     chat = update.effective_chat
     message = update.message
     if not message: return
 
-    if chat.type not in [ChatType.GROUP, ChatType.SUPERGROUP]:
-        await message.reply_text("Huh? You can't promote in private chat....")
-        return
-
-    if not await _can_user_perform_action(update, context, 'can_promote_members', "Why should I listen to a person with no privileges for this? You need 'can_promote_members' permission.", allow_bot_privileged_override=True):
+    if not await _can_user_perform_action(update, context, 'can_promote_members', MISSING_PERMISSION_TEXTS['can_promote_members'], allow_bot_privileged_override=True):
         return
 
     target_user: User | None = None
@@ -75,6 +73,7 @@ async def promote_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             if provided_custom_title:
                 title_to_set = provided_custom_title[:16]
                 await context.bot.set_chat_administrator_custom_title(chat.id, target_user.id, title_to_set)
+                invalidate_chat_administrators(chat.id)
                 await message.reply_html(f"✅ User {user_display}'s title has been updated to '<i>{safe_escape(title_to_set)}</i>'.")
             else:
                 await message.reply_html(f"ℹ️ User {user_display} is already an admin.")
@@ -93,6 +92,7 @@ async def promote_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             can_restrict_members=True, can_change_info=True, can_invite_users=True,
             can_pin_messages=True, can_manage_topics=(chat.is_forum if hasattr(chat, 'is_forum') else None)
         )
+        invalidate_chat_administrators(chat.id)
         await context.bot.set_chat_administrator_custom_title(chat.id, target_user.id, title_to_set)
         
         user_display = create_user_html_link(target_user)
@@ -102,16 +102,13 @@ async def promote_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
 @check_module_enabled("promotes")
 @custom_handler("demote")
+@group_only("Huh? You can't demote in private chat...")
 async def demote_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     chat = update.effective_chat
     message = update.message
     if not message: return
     
-    if chat.type not in [ChatType.GROUP, ChatType.SUPERGROUP]:
-        await message.reply_text("Huh? You can't demote in private chat...")
-        return
-
-    if not await _can_user_perform_action(update, context, 'can_promote_members', "Why should I listen to a person with no privileges for this? You need 'can_promote_members' permission.", allow_bot_privileged_override=True):
+    if not await _can_user_perform_action(update, context, 'can_promote_members', MISSING_PERMISSION_TEXTS['can_promote_members'], allow_bot_privileged_override=True):
         return
     
     target_user: User | None = None
@@ -164,6 +161,7 @@ async def demote_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             can_manage_video_chats=False, can_restrict_members=False, can_promote_members=False,
             can_change_info=False, can_invite_users=False, can_pin_messages=False, can_manage_topics=False
         )
+        invalidate_chat_administrators(chat.id)
         await message.reply_html(f"✅ User {user_display} has been demoted to a regular member.")
 
     except TelegramError as e:
@@ -1,31 +1,31 @@
 import asyncio
 import logging
-from datetime import datetime
+import time
 from telegram import Update
-from telegram.constants import ChatType, ChatMemberStatus, ParseMode
+from telegram.constants import ChatMemberStatus, ParseMode
 from telegram.error import TelegramError
 from telegram.ext import Application, CommandHandler, ContextTypes
 
-from ..core.utils import _can_user_perform_action, safe_escape
-from ..core.decorators import check_module_enabled
+from ..core.utils import _can_user_perform_action
+from ..core.decorators import check_module_enabled, group_only
 from ..core.handlers import custom_handler
+from ..core.constants import MISSING_PERMISSION_TEXTS
 
 logger = logging.getLogger(__name__)
 
+PURGE_BATCH_SIZE = 100
+
 
 # --- PURGE COMMAND FUNCTION ---
 @check_module_enabled("purges")
 @custom_handler("purge")
+@group_only("Huh? You can't purge messages in private chat...")
 async def purge_messages_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     chat = update.effective_chat
     user_who_purges = update.effective_user
     command_message = update.message
     replied_to_message = update.message.reply_to_message
 
-    if chat.type not in [ChatType.GROUP, ChatType.SUPERGROUP]:
-        await command_message.reply_text("Huh? You can't purge messages in private chat...")
-        return
-
     if not replied_to_message:
         await context.bot.send_message(chat.id, "Please use this command by replying to the message up to which you want to delete (that message will also be deleted).")
         return
@@ -40,7 +40,7 @@ async def purge_messages_command(update: Update, context: ContextTypes.DEFAULT_T
         await context.bot.send_message(chat.id, "Error: Couldn't verify my own permissions in this chat.")
         return
 
-    if not await _can_user_perform_action(update, context, 'can_delete_messages', "Why should I listen to a person with no privileges for this? You need 'can_delete_messages' permission."):
+    if not await _can_user_perform_action(update, context, 'can_delete_messages', MISSING_PERMISSION_TEXTS['can_delete_messages']):
         return
 
     is_silent_purge = False
@@ -59,33 +59,29 @@ async def purge_messages_command(update: Update, context: ContextTypes.DEFAULT_T
             await context.bot.send_message(chat.id, "No messages found between your reply and this command to delete.")
         return
 
-    errors_occurred = False
-    start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
 
-    for i in range(0, len(message_ids_to_delete), 100):
-        batch_ids = message_ids_to_delete[i:i + 100]
-        try:
-            success = await context.bot.delete_messages(chat_id=chat.id, message_ids=batch_ids)
-            if not success:
-                errors_occurred = True
-                logger.warning(f"A batch purge in chat {chat.id} failed or partially failed.")
-            if len(message_ids_to_delete) > 100 and i + 100 < len(message_ids_to_delete):
-                await asyncio.sleep(1.1)
-        except TelegramError as e:
-            logger.error(f"TelegramError during purge batch in chat {chat.id}: {e}")
-            errors_occurred = True
-            if not is_silent_purge:
-                await context.bot.send_message(chat.id, text=f"Error occurred: {safe_escape(str(e))}. Purge stopped.")
-            break
-        except Exception as e:
-            logger.error(f"Unexpected error during purge batch in chat {chat.id}: {e}", exc_info=True)
-            errors_occurred = True
-            if not is_silent_purge:
-                await context.bot.send_message(chat.id, text="An unexpected error occurred. Purge stopped.")
-            break
-
-    end_time = datetime.now()
-    duration_secs = (end_time - start_time).total_seconds()
+    results = await asyncio.gather(
+        *(
+            context.bot.delete_messages(chat_id=chat.id, message_ids=message_ids_to_delete[i:i + PURGE_BATCH_SIZE])
+            for i in range(0, len(message_ids_to_delete), PURGE_BATCH_SIZE)
+        ),
+        return_exceptions=True
+    )
+
+    errors_occurred = False
+    for result in results:
+        if result is True:
+            continue
+        errors_occurred = True
+        if isinstance(result, TelegramError):
+            logger.error(f"TelegramError during purge batch in chat {chat.id}: {result}")
+        elif isinstance(result, BaseException):
+            logger.error(f"Unexpected error during purge batch in chat {chat.id}: {result}", exc_info=result)
+        else:
+            logger.warning(f"A batch purge in chat {chat.id} failed or partially failed.")
+
+    duration_secs = (time.perf_counter_ns() - start_ns) / 1e9
 
     if not is_silent_purge:
         final_message_text = f"✅ Purge completed in <code>{duration_secs:.2f}s</code>."
@@ -1,10 +1,10 @@
 import logging
 from telegram import Update, Chat, User
-from telegram.constants import ChatType, ChatMemberStatus, ParseMode
+from telegram.constants import ChatType, ParseMode
 from telegram.error import TelegramError
 from telegram.ext import Application, CommandHandler, ContextTypes
 
-from ..core.utils import resolve_user_with_telethon, create_user_html_link, safe_escape
+from ..core.utils import resolve_user_with_telethon, create_user_html_link, safe_escape, get_chat_administrators_cached
 from ..core.decorators import check_module_enabled, command_control
 from ..core.handlers import custom_handler
 
@@ -23,13 +23,15 @@ async def report_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     if not message or chat.type == ChatType.PRIVATE:
         return
 
+    admin_ids: set[int] = set()
     try:
-        reporter_member = await chat.get_member(reporter.id)
-        if reporter_member.status in [ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER]:
-            logger.info(f"Report command ignored: used by admin {reporter.id} in chat {chat.id}.")
-            return
+        admin_ids = {admin.user.id for admin in await get_chat_administrators_cached(context, chat.id)}
     except TelegramError as e:
-        logger.warning(f"Could not get status for reporter {reporter.id} in /report: {e}")
+        logger.warning(f"Could not get admin list for chat {chat.id} in /report: {e}")
+
+    if reporter.id in admin_ids:
+        logger.info(f"Report command ignored: used by admin {reporter.id} in chat {chat.id}.")
+        return
 
     target_entity: Chat | User | None = None
     args_for_reason = list(context.args)
@@ -46,14 +48,9 @@ async def report_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         
     reason = " ".join(args_for_reason) if args_for_reason else "No specific reason provided."
 
-    try:
-        target_member = await chat.get_member(target_entity.id)
-        if target_member.status in [ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER]:
-            logger.info(f"Report command ignored: target {target_entity.id} is an admin in chat {chat.id}.")
-            return
-    except TelegramError as e:
-        if "user not found" not in str(e).lower():
-            logger.warning(f"Could not get status for target {target_entity.id} in /report: {e}")
+    if target_entity.id in admin_ids:
+        logger.info(f"Report command ignored: target {target_entity.id} is an admin in chat {chat.id}.")
+        return
 
     reporter_mention = create_user_html_link(reporter)
     
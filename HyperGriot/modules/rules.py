@@ -7,6 +7,7 @@ from ..core.database import set_rules, get_rules, clear_rules
 from ..core.utils import _can_user_perform_action
 from ..core.decorators import check_module_enabled, command_control
 from ..core.handlers import custom_handler
+from ..core.constants import MISSING_PERMISSION_TEXTS
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +24,7 @@ async def set_rules_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         await message.reply_text("Huh? You can't set rules in private chat...")
         return
 
-    if not await _can_user_perform_action(update, context, 'can_change_info', "Why should I listen to a person with no privileges for this? You need 'can_change_members' permission."):
+    if not await _can_user_perform_action(update, context, 'can_change_info', MISSING_PERMISSION_TEXTS['can_change_info']):
         return
 
     if message.reply_to_message:
@@ -55,7 +56,7 @@ async def clear_rules_command(update: Update, context: ContextTypes.DEFAULT_TYPE
         await message.reply_text("Huh? You can't clear rules in private chat...")
         return
 
-    if not await _can_user_perform_action(update, context, 'can_change_info', "Why should I listen to a person with no privileges for this? You need 'can_change_members' permission."):
+    if not await _can_user_perform_action(update, context, 'can_change_info', MISSING_PERMISSION_TEXTS['can_change_info']):
         return
 
     if clear_rules(chat.id):
@@ -1,31 +1,35 @@
 import logging
 import sqlite3
 from telegram import Update
-from telegram.constants import ChatType
 from telegram.ext import Application, MessageHandler, filters, ContextTypes
 
-from ..config import DB_NAME
-from ..core.database import update_user_in_db, add_chat_to_db
+from ..core.database import queue_user_update, take_pending_user_updates, write_user_updates, add_chat_to_db, get_connection
 from ..core.decorators import check_module_enabled
+from ..core.utils import GROUP_CHAT_TYPES
+from ..core.async_utils import aioify
 
 logger = logging.getLogger(__name__)
 
+USER_UPDATE_FLUSH_INTERVAL = 2
+
+write_user_updates_async = aioify(write_user_updates)
+
 
 # --- PASSIVE USER AND CHAT LOGGING FUNCTION ---
 @check_module_enabled("userlogger")
 async def log_user_from_interaction(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if update.effective_user:
-        update_user_in_db(update.effective_user)
+        queue_user_update(update.effective_user)
     
     if update.message and update.message.reply_to_message and update.message.reply_to_message.from_user:
-        update_user_in_db(update.message.reply_to_message.from_user)
+        queue_user_update(update.message.reply_to_message.from_user)
 
     chat = update.effective_chat
-    if chat and chat.type in [ChatType.GROUP, ChatType.SUPERGROUP]:
+    if chat and chat.type in GROUP_CHAT_TYPES:
         if 'known_chats' not in context.bot_data:
             context.bot_data['known_chats'] = set()
             try:
-                with sqlite3.connect(DB_NAME) as conn:
+                with get_connection() as conn:
                     cursor = conn.cursor()
                     known_ids = {row[0] for row in cursor.execute("SELECT chat_id FROM bot_chats")}
                     context.bot_data['known_chats'] = known_ids
@@ -39,6 +43,11 @@ async def log_user_from_interaction(update: Update, context: ContextTypes.DEFAUL
             context.bot_data['known_chats'].add(chat.id)
 
 
+async def flush_user_updates(context: ContextTypes.DEFAULT_TYPE) -> None:
+    await write_user_updates_async(take_pending_user_updates())
+
+
 # --- HANDLER LOADER ---
 def load_handlers(application: Application):
-    pass
+    if application.job_queue:
+        application.job_queue.run_repeating(flush_user_updates, interval=USER_UPDATE_FLUSH_INTERVAL, first=USER_UPDATE_FLUSH_INTERVAL)
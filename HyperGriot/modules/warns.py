@@ -1,13 +1,14 @@
 import logging
 from telegram import Update, User, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.constants import ChatType, ChatMemberStatus, ParseMode
+from telegram.constants import ParseMode
 from telegram.error import TelegramError
 from telegram.ext import Application, CommandHandler, ContextTypes, CallbackQueryHandler
 
 from ..core.database import add_warning, remove_warning_by_id, get_warnings, reset_warnings, set_warn_limit, get_warn_limit
-from ..core.utils import _can_user_perform_action, resolve_user_with_telethon, create_user_html_link, send_safe_reply, safe_escape, is_entity_a_user
-from ..core.decorators import check_module_enabled, command_control
+from ..core.utils import _can_user_perform_action, resolve_user_with_telethon, create_user_html_link, send_safe_reply, safe_escape, is_entity_a_user, ADMIN_STATUSES
+from ..core.decorators import check_module_enabled, group_only, command_control
 from ..core.handlers import custom_handler
+from ..core.constants import MISSING_PERMISSION_TEXTS
 
 logger = logging.getLogger(__name__)
 
@@ -15,16 +16,13 @@ logger = logging.getLogger(__name__)
 # --- WARNINGS COMMAND AND HANDLER FUNCTIONS ---
 @check_module_enabled("warns")
 @custom_handler("warn")
+@group_only("Huh? You can't warn in private chat...")
 async def warn_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     chat = update.effective_chat
     warner = update.effective_user
     message = update.message
-
-    if chat.type == ChatType.PRIVATE:
-        await send_safe_reply(update, context, text="Huh? You can't warn in private chat...")
-        return
     
-    if not await _can_user_perform_action(update, context, 'can_restrict_members', "Why should I listen to a person with no privileges for this? You need 'can_restrict_members' permission."):
+    if not await _can_user_perform_action(update, context, 'can_restrict_members', MISSING_PERMISSION_TEXTS['can_restrict_members']):
         return
 
     target_user: User | None = None
@@ -67,7 +65,7 @@ async def warn_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     try:
         target_member = await context.bot.get_chat_member(chat.id, target_user.id)
         
-        if target_member.status in [ChatMemberStatus.OWNER, ChatMemberStatus.ADMINISTRATOR]:
+        if target_member.status in ADMIN_STATUSES:
             await message.reply_text("Chat Creator and Administrators cannot be warned.")
             return
     except TelegramError as e:
@@ -108,17 +106,14 @@ async def warn_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
 @check_module_enabled("warns")
 @custom_handler("dwarn")
+@group_only("Huh? You can't dwarn in private chat...")
 async def dwarn_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     chat = update.effective_chat
     warner = update.effective_user
     message = update.message
-
-    if chat.type == ChatType.PRIVATE:
-        await send_safe_reply(update, context, text="Huh? You can't dwarn in private chat...")
-        return
     
-    can_warn = await _can_user_perform_action(update, context, 'can_restrict_members', "Why should I listen to a person with no privileges for this? You need 'can_restrict_members' permission.")
-    can_del = await _can_user_perform_action(update, context, 'can_delete_messages', "Why should I listen to a person with no privileges for this? You need 'can_delete_messages' permission.")
+    can_warn = await _can_user_perform_action(update, context, 'can_restrict_members', MISSING_PERMISSION_TEXTS['can_restrict_members'])
+    can_del = await _can_user_perform_action(update, context, 'can_delete_messages', MISSING_PERMISSION_TEXTS['can_delete_messages'])
     if not (can_warn and can_del):
         return
 
@@ -140,7 +135,7 @@ async def dwarn_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         
     try:
         target_member = await context.bot.get_chat_member(chat.id, target_user.id)
-        if target_member.status in [ChatMemberStatus.OWNER, ChatMemberStatus.ADMINISTRATOR]:
+        if target_member.status in ADMIN_STATUSES:
             await message.reply_text("Chat Creator and Administrators cannot be warned.")
             return
     except TelegramError as e:
@@ -191,7 +186,7 @@ async def undo_warn_callback(update: Update, context: ContextTypes.DEFAULT_TYPE)
     
     try:
         member = await context.bot.get_chat_member(query.message.chat_id, user_who_clicked.id)
-        if member.status not in [ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER]:
+        if member.status not in ADMIN_STATUSES:
             await query.answer("You must be an admin to undo this action.", show_alert=True)
             return
     except Exception:
@@ -213,13 +208,8 @@ async def undo_warn_callback(update: Update, context: ContextTypes.DEFAULT_TYPE)
 @check_module_enabled("warns")
 @command_control("warns")
 @custom_handler(["warnings", "warns"])
+@group_only("Huh? You can't check warnings in private chat...")
 async def warnings_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    chat = update.effective_chat
-
-    if chat.type == ChatType.PRIVATE:
-        await send_safe_reply(update, context, text="Huh? You can't check warnings in private chat...")
-        return
-    
     target_user: User | None = None
     
     if update.message.reply_to_message:
@@ -259,15 +249,11 @@ async def warnings_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
 
 @check_module_enabled("warns")
 @custom_handler("resetwarns")
+@group_only("Huh? You can't reset warnings in private chat...")
 async def reset_warnings_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    chat = update.effective_chat
     user = update.effective_user
-
-    if chat.type == ChatType.PRIVATE:
-        await send_safe_reply(update, context, text="Huh? You can't reset warnings in private chat...")
-        return
     
-    if not await _can_user_perform_action(update, context, 'can_restrict_members', "Why should I listen to a person with no privileges for this? You need 'can_restrict_members' permission."):
+    if not await _can_user_perform_action(update, context, 'can_restrict_members', MISSING_PERMISSION_TEXTS['can_restrict_members']):
         return
 
     target_user: User | None = None
@@ -289,14 +275,11 @@ async def reset_warnings_command(update: Update, context: ContextTypes.DEFAULT_T
 
 @check_module_enabled("warns")
 @custom_handler("setwarnlimit")
+@group_only("Huh? You can't set warning limit in private chat...")
 async def set_warn_limit_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     chat = update.effective_chat
-
-    if chat.type == ChatType.PRIVATE:
-        await send_safe_reply(update, context, text="Huh? You can't set warning limit in private chat...")
-        return
     
-    if not await _can_user_perform_action(update, context, 'can_restrict_members', "Why should I listen to a person with no privileges for this? You need 'can_restrict_members' permission.", allow_bot_privileged_override=False):
+    if not await _can_user_perform_action(update, context, 'can_restrict_members', MISSING_PERMISSION_TEXTS['can_restrict_members'], allow_bot_privileged_override=False):
         return
 
     if not context.args:
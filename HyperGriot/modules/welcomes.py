@@ -5,20 +5,25 @@ from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.constants import ChatType, ParseMode
 from telegram.ext import Application, CommandHandler, ContextTypes, MessageHandler, filters
 
-from ..config import OWNER_ID, DB_NAME, APPEAL_CHAT_USERNAME
+from ..config import OWNER_ID, APPEAL_CHAT_USERNAME
 from ..core.database import (
     set_welcome_setting, get_welcome_settings, set_goodbye_setting, get_goodbye_settings,
     set_clean_service, should_clean_service, add_chat_to_db, remove_chat_from_db,
-    is_dev_user, is_sudo_user, is_support_user, is_chat_blacklisted, update_user_in_db,
-    is_gban_enforced, get_gban_reason
+    get_user_role, is_chat_blacklisted, update_user_in_db,
+    is_gban_enforced, get_gban_reason, get_connection
 )
 from ..core.utils import _can_user_perform_action, send_safe_reply, safe_escape, format_message_text, send_critical_log
-from ..core.constants import OWNER_WELCOME_TEXTS, DEV_WELCOME_TEXTS, SUDO_WELCOME_TEXTS, SUPPORT_WELCOME_TEXTS, GENERIC_WELCOME_TEXTS, GENERIC_GOODBYE_TEXTS
+from ..core.constants import OWNER_WELCOME_TEXTS, DEV_WELCOME_TEXTS, SUDO_WELCOME_TEXTS, SUPPORT_WELCOME_TEXTS, GENERIC_WELCOME_TEXTS, GENERIC_GOODBYE_TEXTS, MISSING_PERMISSION_TEXTS
 from ..core.decorators import check_module_enabled, command_control
 from ..core.handlers import custom_handler
 
 logger = logging.getLogger(__name__)
 
+ROLE_WELCOME_TEXTS = {
+    "dev": DEV_WELCOME_TEXTS,
+    "sudo": SUDO_WELCOME_TEXTS,
+    "support": SUPPORT_WELCOME_TEXTS,
+}
 
 # --- WELCOME/GOODBYE COMMAND AND HANDLER FUNCTIONS ---
 @check_module_enabled("welcomes")
@@ -30,13 +35,13 @@ async def welcome_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         await send_safe_reply(update, context, text="Huh? You can't manage welcome in private chat...")
         return
     
-    if not await _can_user_perform_action(update, context, 'can_change_info', "Why should I listen to a person with no privileges for this? You need 'can_change_info' permission.", allow_bot_privileged_override=False):
+    if not await _can_user_perform_action(update, context, 'can_change_info', MISSING_PERMISSION_TEXTS['can_change_info'], allow_bot_privileged_override=False):
         return
 
     if context.args and context.args[0].lower() in ['yes', 'on', 'off', 'no']:
         is_on = context.args[0].lower() == 'on' or context.args[0].lower() == 'yes'
         try:
-            with sqlite3.connect(DB_NAME) as conn:
+            with get_connection() as conn:
                  conn.execute("UPDATE bot_chats SET welcome_enabled = ? WHERE chat_id = ?", (1 if is_on else 0, chat.id))
             status_text = "ENABLED" if is_on else "DISABLED"
             await update.message.reply_html(f"✅ Welcome messages have been <b>{status_text}</b>.")
@@ -77,7 +82,7 @@ async def set_welcome_command(update: Update, context: ContextTypes.DEFAULT_TYPE
         await send_safe_reply(update, context, text="Huh? You can't set welcome message in private chat...")
         return
     
-    if not await _can_user_perform_action(update, context, 'can_change_info', "Why should I listen to a person with no privileges for this? You need 'can_change_info' permission.", allow_bot_privileged_override=False):
+    if not await _can_user_perform_action(update, context, 'can_change_info', MISSING_PERMISSION_TEXTS['can_change_info'], allow_bot_privileged_override=False):
         return
 
     if not context.args:
@@ -99,7 +104,7 @@ async def reset_welcome_command(update: Update, context: ContextTypes.DEFAULT_TY
         await send_safe_reply(update, context, text="Huh? You can't reset welcome message in private chat...")
         return
     
-    if not await _can_user_perform_action(update, context, 'can_change_info', "Why should I listen to a person with no privileges for this? You need 'can_change_info' permission.", allow_bot_privileged_override=False):
+    if not await _can_user_perform_action(update, context, 'can_change_info', MISSING_PERMISSION_TEXTS['can_change_info'], allow_bot_privileged_override=False):
         return
 
     if set_welcome_setting(chat.id, enabled=True, text=None):
@@ -116,7 +121,7 @@ async def goodbye_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         await send_safe_reply(update, context, text="Huh? You can't manage goodbye in private chat...")
         return
     
-    if not await _can_user_perform_action(update, context, 'can_change_info', "Why should I listen to a person with no privileges for this? You need 'can_change_info' permission.", allow_bot_privileged_override=False):
+    if not await _can_user_perform_action(update, context, 'can_change_info', MISSING_PERMISSION_TEXTS['can_change_info'], allow_bot_privileged_override=False):
         return
 
     if context.args and context.args[0].lower() in ['yes', 'on', 'off', 'no']:
@@ -158,7 +163,7 @@ async def set_goodbye_command(update: Update, context: ContextTypes.DEFAULT_TYPE
         await send_safe_reply(update, context, text="Huh? You can't set goodbye message in private chat...")
         return
     
-    if not await _can_user_perform_action(update, context, 'can_change_info', "Why should I listen to a person with no privileges for this? You need 'can_change_info' permission.", allow_bot_privileged_override=False):
+    if not await _can_user_perform_action(update, context, 'can_change_info', MISSING_PERMISSION_TEXTS['can_change_info'], allow_bot_privileged_override=False):
         return
 
     if not context.args:
@@ -180,7 +185,7 @@ async def reset_goodbye_command(update: Update, context: ContextTypes.DEFAULT_TY
         await send_safe_reply(update, context, text="Huh? You can't reset goodbye message in private chat...")
         return
     
-    if not await _can_user_perform_action(update, context, 'can_change_info', "Why should I listen to a person with no privileges for this? You need 'can_change_info' permission.", allow_bot_privileged_override=False):
+    if not await _can_user_perform_action(update, context, 'can_change_info', MISSING_PERMISSION_TEXTS['can_change_info'], allow_bot_privileged_override=False):
         return
         
     if set_goodbye_setting(chat.id, enabled=True, text=None):
@@ -222,7 +227,7 @@ async def set_clean_service_command(update: Update, context: ContextTypes.DEFAUL
         await send_safe_reply(update, context, text="Huh? You can't set clean service in private chat...")
         return
     
-    if not await _can_user_perform_action(update, context, 'can_delete_messages', "Why should I listen to a person with no privileges for this? You need 'can_delete_messages' permission.", allow_bot_privileged_override=False):
+    if not await _can_user_perform_action(update, context, 'can_delete_messages', MISSING_PERMISSION_TEXTS['can_delete_messages'], allow_bot_privileged_override=False):
         return
 
     if not context.args:
@@ -307,20 +312,16 @@ async def handle_new_group_members(update: Update, context: ContextTypes.DEFAULT
 
     for member in update.message.new_chat_members:
         update_user_in_db(member)
-        if is_gban_enforced(chat.id) and get_gban_reason(member.id):
+        if get_gban_reason(member.id) and is_gban_enforced(chat.id):
             continue
 
         base_text = ""
         is_privileged_join = True
 
-        if member.id == OWNER_ID and OWNER_WELCOME_TEXTS:
-            base_text = random.choice(OWNER_WELCOME_TEXTS)
-        elif is_dev_user(member.id) and DEV_WELCOME_TEXTS:
-            base_text = random.choice(DEV_WELCOME_TEXTS)
-        elif is_sudo_user(member.id) and SUDO_WELCOME_TEXTS:
-            base_text = random.choice(SUDO_WELCOME_TEXTS)
-        elif is_support_user(member.id) and SUPPORT_WELCOME_TEXTS:
-            base_text = random.choice(SUPPORT_WELCOME_TEXTS)
+        privileged_texts = (member.id == OWNER_ID and OWNER_WELCOME_TEXTS) or ROLE_WELCOME_TEXTS.get(get_user_role(member.id))
+
+        if privileged_texts:
+            base_text = random.choice(privileged_texts)
         else:
             is_privileged_join = False
 
@@ -394,7 +395,7 @@ async def handle_left_group_member(update: Update, context: ContextTypes.DEFAULT
         except Exception:
             pass
 
-    if is_gban_enforced(chat.id) and get_gban_reason(left_member.id):
+    if get_gban_reason(left_member.id) and is_gban_enforced(chat.id):
         return
 
     is_enabled, custom_text = get_goodbye_settings(chat.id)
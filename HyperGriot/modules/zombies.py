@@ -2,15 +2,19 @@ import asyncio
 import logging
 from telegram import Update
 from telegram.constants import ChatType, ChatMemberStatus, ParseMode
+from telegram.error import TelegramError
 from telegram.ext import Application, CommandHandler, ContextTypes
 from telethon import TelegramClient
 
 from ..core.utils import _can_user_perform_action, send_safe_reply, safe_escape
 from ..core.decorators import check_module_enabled
 from ..core.handlers import custom_handler
+from ..core.constants import MISSING_PERMISSION_TEXTS
 
 logger = logging.getLogger(__name__)
 
+ZOMBIE_KICK_CONCURRENCY = 10
+
 
 # --- ZOMBIES COMMAND FUNCTIONS ---
 @check_module_enabled("zombies")
@@ -22,45 +26,62 @@ async def _find_and_process_zombies(update: Update, context: ContextTypes.DEFAUL
     action_text = "Scanning for" if dry_run else "Cleaning"
     status_message = await message.reply_html(f"🔥 <b>{action_text} deleted accounts...</b> This might take a while for large groups.")
 
-    zombie_count = 0
-    kicked_count = 0
-    failed_count = 0
+    zombie_ids: list[int] = []
     
     try:
         async for member in telethon_client.iter_participants(chat.id):
             if member.deleted:
-                zombie_count += 1
-                
-                if not dry_run:
-                    try:
-                        await context.bot.ban_chat_member(chat.id, member.id)
-                        await context.bot.unban_chat_member(chat.id, member.id)
-                        kicked_count += 1
-                    except Exception as e:
-                        failed_count += 1
-                    
-                    await asyncio.sleep(0.1)
+                zombie_ids.append(member.id)
 
     except Exception as e:
         await status_message.edit_text(f"An error occurred while scanning members: {safe_escape(str(e))}")
         return
 
-    if not dry_run and kicked_count > 0:
-        await asyncio.sleep(1)
+    zombie_count = len(zombie_ids)
 
-    if dry_run:
+    if dry_run or not zombie_ids:
         await status_message.edit_text(
             f"✅ <b>Scan complete!</b> Found <code>{zombie_count}</code> deleted accounts in this chat.\n",
             parse_mode=ParseMode.HTML
         )
-    else:
-        report = [f"✅ <b>Cleanup complete!</b>"]
-        report.append(f"<b>• Found:</b> <code>{zombie_count}</code> deleted accounts.")
-        report.append(f"<b>• Successfully kicked:</b> <code>{kicked_count}</code>.")
-        if failed_count > 0:
-            report.append(f"<b>• Failed to kick:</b> <code>{failed_count}</code> (likely because they are admins).")
-        
+        return
+
+    await status_message.edit_text(
+        f"🔥 <b>Kicking</b> <code>{zombie_count}</code> <b>deleted accounts...</b> I'll update this message when it's done.",
+        parse_mode=ParseMode.HTML
+    )
+    context.application.create_task(
+        _kick_zombies(context, chat.id, status_message, zombie_ids),
+        update=update
+    )
+
+async def _kick_zombies(context: ContextTypes.DEFAULT_TYPE, chat_id: int, status_message, zombie_ids: list[int]) -> None:
+    semaphore = asyncio.Semaphore(ZOMBIE_KICK_CONCURRENCY)
+
+    async def _kick_zombie(user_id: int) -> bool:
+        async with semaphore:
+            try:
+                await context.bot.ban_chat_member(chat_id, user_id)
+                await context.bot.unban_chat_member(chat_id, user_id)
+                return True
+            except TelegramError:
+                return False
+
+    zombie_count = len(zombie_ids)
+    results = await asyncio.gather(*(_kick_zombie(user_id) for user_id in zombie_ids))
+    kicked_count = sum(results)
+    failed_count = zombie_count - kicked_count
+
+    report = [f"✅ <b>Cleanup complete!</b>"]
+    report.append(f"<b>• Found:</b> <code>{zombie_count}</code> deleted accounts.")
+    report.append(f"<b>• Successfully kicked:</b> <code>{kicked_count}</code>.")
+    if failed_count > 0:
+        report.append(f"<b>• Failed to kick:</b> <code>{failed_count}</code> (likely because they are admins).")
+
+    try:
         await status_message.edit_text("\n".join(report), parse_mode=ParseMode.HTML)
+    except TelegramError as e:
+        logger.error(f"Could not edit zombie cleanup report in chat {chat_id}: {e}")
 
 @check_module_enabled("zombies")
 @custom_handler("zombies")
@@ -71,7 +92,7 @@ async def zombies_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         await send_safe_reply(update, context, text="Huh? You can't scan and delete zombies in private chat...")
         return
 
-    if not await _can_user_perform_action(update, context, 'can_restrict_members', "Why should I listen to a person with no privileges for this? You need 'can_restrict_members' permission.", allow_bot_privileged_override=True):
+    if not await _can_user_perform_action(update, context, 'can_restrict_members', MISSING_PERMISSION_TEXTS['can_restrict_members'], allow_bot_privileged_override=True):
         return
 
     if 'telethon_client' not in context.bot_data: